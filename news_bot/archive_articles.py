@@ -0,0 +1,119 @@
+"""
+历史新闻归档工具（列式归档，见 src/archive.py）
+
+用法:
+    python archive_articles.py list
+    python archive_articles.py export --month 2026-01
+    python archive_articles.py export --all
+    python archive_articles.py scan --start 2026-01-01 --end 2026-02-01 --source 彭博社
+    python archive_articles.py import --start 2026-01-01 --source 彭博社
+"""
+
+import sys
+import argparse
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from news_bot.src.config import Config
+from news_bot.src.database import DatabaseManager
+from news_bot.src.seen_filter import SeenFilter
+from news_bot.src.archive import (
+    ARCHIVE_FILENAME_FORMAT,
+    read_footer,
+    iter_archive,
+    export_month,
+    import_archive
+)
+
+
+def parse_date(value: str) -> datetime:
+    """解析 YYYY-MM-DD（UTC）"""
+    return datetime.strptime(value, "%Y-%m-%d")
+
+
+def list_archives(archive_dir: Path):
+    """显示归档文件"""
+    paths = sorted(archive_dir.glob(ARCHIVE_FILENAME_FORMAT.format(month='*')))
+    total = 0
+
+    print("=" * 80)
+    print(f"归档目录: {archive_dir}")
+    print("=" * 80)
+    for path in paths:
+        footer = read_footer(path)
+        total += footer['rows']
+        print(f"{path.name}: {footer['rows']}条, {len(footer['blocks'])}块, {path.stat().st_size / 1024:.1f}KB")
+    print("=" * 80)
+    print(f"总计: {len(paths)}个文件, {total}条新闻")
+
+
+def export_articles(db_manager: DatabaseManager, archive_dir: Path, months: list, export_all: bool):
+    """把数据库中的新闻按月导出到归档"""
+    if export_all:
+        with db_manager as db:
+            months = [row[0] for row in db.cursor.execute("""
+                SELECT DISTINCT substr(beijing_date, 1, 7) FROM news_articles
+                WHERE beijing_date IS NOT NULL
+                ORDER BY 1
+            """)]
+
+    total = sum(export_month(db_manager, month, archive_dir) for month in months)
+    print(f"导出: {len(months)}个月, {total}条新闻 -> {archive_dir}")
+
+
+def scan_archives(archive_dir: Path, start, end, sources):
+    """按条件扫描归档，按月份和来源统计"""
+    counts = Counter()
+    for record in iter_archive(archive_dir, start, end, sources, columns=['source', 'beijing_date']):
+        counts[((record['beijing_date'] or 'unknown')[:7], record['source'])] += 1
+
+    for (month, source), count in sorted(counts.items()):
+        print(f"{month}  {source}: {count}条")
+    print(f"总计: {sum(counts.values())}条新闻")
+
+
+def import_articles(db_manager: DatabaseManager, archive_dir: Path, start, end, sources):
+    """把归档中的新闻导回数据库"""
+    imported = import_archive(db_manager, archive_dir, start, end, sources)
+    if imported:
+        # 布隆过滤器需要包含导回的新闻，否则抓取时会漏判已存在（加载时发现数据库指纹变化即重建）
+        SeenFilter.for_database(db_manager)
+    print(f"导入: {imported}条新闻")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='历史新闻归档工具')
+    parser.add_argument('command', choices=['list', 'export', 'scan', 'import'], help='操作')
+    parser.add_argument('--archive-dir', type=Path, default=Config.ARCHIVE_DIR,
+                        help=f'归档目录，默认 {Config.ARCHIVE_DIR}')
+    parser.add_argument('--month', action='append', default=[],
+                        help='export: 导出的月份（YYYY-MM，北京时间），可重复')
+    parser.add_argument('--all', action='store_true',
+                        help='export: 导出数据库中的所有月份')
+    parser.add_argument('--start', type=parse_date, default=None,
+                        help='scan/import: 发布日期下限（YYYY-MM-DD，UTC，含）')
+    parser.add_argument('--end', type=parse_date, default=None,
+                        help='scan/import: 发布日期上限（YYYY-MM-DD，UTC，不含）')
+    parser.add_argument('--source', action='append', default=None,
+                        help='scan/import: 只处理该来源，可重复')
+    args = parser.parse_args()
+
+    if args.command == 'export' and not args.month and not args.all:
+        parser.error("export 需要 --month 或 --all")
+
+    if args.command == 'list':
+        list_archives(args.archive_dir)
+    elif args.command == 'scan':
+        scan_archives(args.archive_dir, args.start, args.end, args.source)
+    else:
+        db_manager = DatabaseManager(Config.DATABASE_PATH)
+        db_manager.init_database()
+        if args.command == 'export':
+            export_articles(db_manager, args.archive_dir, args.month, args.all)
+        else:
+            import_articles(db_manager, args.archive_dir, args.start, args.end, args.source)
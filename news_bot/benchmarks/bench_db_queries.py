@@ -0,0 +1,268 @@
+"""
+数据库热点查询基准（页面重新生成的读取）
+
+在临时数据库中生成一批模拟新闻（默认10万条，跨度一年，约15%未翻译），
+检查页面重新生成相关查询的执行计划（EXPLAIN QUERY PLAN）：
+必须使用 idx_publish_ts，且不能出现额外排序（USE TEMP B-TREE），
+然后测量实际的读取方法（iter_articles 键集分页、get_articles_by_month）的耗时，
+并与额外建立部分索引 idx_translated_publish_ts（旧版本曾使用，现已删除）时对比，
+以及读取结果时构建 pydantic NewsArticle 与只读模型 ArticleRow 的耗时（访问页面模板用到的字段），
+最后对比逐项 COUNT/GROUP BY 扫描与读取计数表（stats_counters）得到统计信息的耗时，并校验两者一致。
+
+执行计划不符合预期或统计不一致时以非零状态退出，可作为索引设计的回归检查。
+
+用法:
+    python benchmarks/bench_db_queries.py
+    python benchmarks/bench_db_queries.py --count 300000 --repeat 20
+"""
+
+import sys
+import time
+import random
+import argparse
+import tempfile
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from loguru import logger
+
+from news_bot.src.database import DatabaseManager, beijing_month_range, get_utc_now, to_epoch, to_beijing_date
+from news_bot.src.html_generator import PAGE_ARTICLE_FIELDS
+from news_bot.src.models import ArticleRow
+
+
+INDEX_NAME = 'idx_publish_ts'
+
+# 对照：只包含已翻译新闻的部分索引（旧版本曾使用）
+PARTIAL_INDEX_SQL = """
+    CREATE INDEX idx_translated_publish_ts
+    ON news_articles(publish_ts DESC)
+    WHERE translated = 1
+"""
+
+SOURCES = ['华尔街日报', '彭博社', 'CNBC', 'MarketWatch']
+
+
+# 模拟新闻的发布时间截止到当前时间（读取方法按当前时间计算最近N天），单月归档读取两个月前的月份
+NOW = get_utc_now()
+ARCHIVE_MONTH = (NOW - timedelta(days=60)).strftime('%Y-%m')
+
+
+def make_rows(count: int, now: datetime = NOW, seed: int = 42) -> list:
+    """生成模拟新闻行"""
+    rng = random.Random(seed)
+    rows = []
+    for i in range(count):
+        publish_time = now - timedelta(seconds=rng.randint(0, 365 * 86400))
+        rows.append((
+            f"标题 {i}", f"Title {i}", "摘要" * 40, "Summary " * 20,
+            rng.choice(SOURCES), f"https://example.com/{i}", f"https://example.com/{i}",
+            'global', 'en',
+            publish_time.isoformat(), to_epoch(publish_time), to_beijing_date(publish_time),
+            publish_time.isoformat(),
+            int(rng.random() < 0.85)
+        ))
+    return rows
+
+
+def build_database(db_path: Path, count: int) -> DatabaseManager:
+    """创建并填充临时数据库"""
+    db_manager = DatabaseManager(db_path)
+    db_manager.init_database()
+
+    with db_manager:
+        db_manager.cursor.executemany("""
+            INSERT INTO news_articles (
+                title, title_original, content, content_original,
+                source, url, url_canonical, category, language,
+                publish_time, publish_ts, beijing_date, crawl_time, translated
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, make_rows(count))
+        db_manager.conn.commit()
+        db_manager.cursor.execute("ANALYZE")
+
+    return db_manager
+
+
+def hot_queries(now: datetime) -> list:
+    """页面重新生成使用的查询（与 DatabaseManager._iter_keyset、get_articles_by_month 中的SQL一致）"""
+    cutoff = to_epoch(now - timedelta(days=30))
+    month_start, month_end = beijing_month_range(ARCHIVE_MONTH)
+
+    first_batch = """
+        SELECT * FROM news_articles WHERE publish_ts >= ? AND translated = 1
+        AND publish_ts IS NOT NULL
+        ORDER BY publish_ts DESC, id ASC LIMIT ?
+    """
+    next_batch = """
+        SELECT * FROM news_articles WHERE publish_ts >= ? AND translated = 1
+        AND publish_ts IS NOT NULL AND publish_ts <= ? AND (publish_ts < ? OR id > ?)
+        ORDER BY publish_ts DESC, id ASC LIMIT ?
+    """
+    by_month = """
+        SELECT * FROM news_articles
+        WHERE publish_ts >= ? AND publish_ts < ?
+        AND translated = 1
+        ORDER BY publish_ts DESC
+    """
+    return [
+        ('分页首批', first_batch, (cutoff, 500)),
+        ('分页后续批', next_batch, (cutoff, month_end, month_end, 0, 500)),
+        ('单月归档', by_month, (month_start, month_end)),
+    ]
+
+
+def hot_reads(db_manager: DatabaseManager) -> list:
+    """页面重新生成实际调用的读取方法"""
+    def by_days(days):
+        return lambda: list(db_manager.iter_articles(days=days, translated_only=True))
+
+    return [
+        ('最近7天', by_days(7)),
+        ('最近30天', by_days(30)),
+        ('最近365天', by_days(365)),
+        ('单月归档', lambda: db_manager.get_articles_by_month(ARCHIVE_MONTH)),
+    ]
+
+
+def check_query_plans(cursor, queries: list) -> list:
+    """
+    检查执行计划
+
+    Returns:
+        list: 不符合预期的查询 [(名称, 执行计划)]
+    """
+    problems = []
+    for name, sql, params in queries:
+        plan = ' | '.join(row[3] for row in cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+        if INDEX_NAME not in plan or 'TEMP B-TREE' in plan:
+            problems.append((name, plan))
+    return problems
+
+
+# 改用计数表之前 get_stats 的逐项扫描
+LEGACY_STATS_QUERIES = {
+    'total_articles': "SELECT COUNT(*) FROM news_articles",
+    'category_stats': "SELECT category, COUNT(*) FROM news_articles GROUP BY category",
+    'language_stats': "SELECT language, COUNT(*) FROM news_articles GROUP BY language",
+    'translated_count': "SELECT COUNT(*) FROM news_articles WHERE translated = 1",
+    'with_ai_comments': "SELECT COUNT(*) FROM news_articles WHERE ai_comment IS NOT NULL",
+}
+
+
+def legacy_stats(cursor) -> dict:
+    """逐项扫描得到的统计信息"""
+    stats = {}
+    for key, sql in LEGACY_STATS_QUERIES.items():
+        rows = cursor.execute(sql).fetchall()
+        stats[key] = {row[0]: row[1] for row in rows} if key.endswith('_stats') else rows[0][0]
+    return stats
+
+
+def timed_call(func, repeat: int) -> float:
+    """多次调用取最短耗时（秒）"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def timed_decode(rows: list, decode, repeat: int) -> float:
+    """将查询结果转换为文章对象并访问模板字段的耗时（秒），多次运行取最短"""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for row in rows:
+            article = decode(row)
+            for field in PAGE_ARTICLE_FIELDS:
+                getattr(article, field)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='数据库热点查询基准')
+    parser.add_argument('--count', type=int, default=100000, help='模拟新闻数量，默认100000')
+    parser.add_argument('--repeat', type=int, default=10, help='重复次数（取最短耗时），默认10')
+    args = parser.parse_args()
+
+    logger.remove()
+    logger.add(sys.stderr, level="WARNING")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_manager = build_database(Path(tmp_dir) / "bench.db", args.count)
+        queries = hot_queries(NOW)
+        reads = hot_reads(db_manager)
+
+        with db_manager:
+            problems = check_query_plans(db_manager.cursor, queries)
+
+            # 读取模型：最近30天的结果
+            rows = db_manager.cursor.execute(
+                "SELECT * FROM news_articles WHERE publish_ts >= ? AND translated = 1 ORDER BY publish_ts DESC",
+                (to_epoch(NOW - timedelta(days=30)),)
+            ).fetchall()
+            pydantic_decode = timed_decode(rows, db_manager._row_to_article, args.repeat)
+            slots_decode = timed_decode(rows, ArticleRow.from_row, args.repeat)
+
+            # 统计信息：逐项扫描 vs 计数表
+            expected_stats = legacy_stats(db_manager.cursor)
+            legacy_stats_time = timed_call(lambda: legacy_stats(db_manager.cursor), args.repeat)
+
+        stats = db_manager.get_stats()
+        counters_stats_time = timed_call(db_manager.get_stats, args.repeat)
+        stats_ok = stats == expected_stats
+
+        # 读取方法每次调用都建立新连接，不受连接语句缓存中旧执行计划的影响
+        plain_index = [timed_call(read, args.repeat) for _, read in reads]
+
+        with db_manager:
+            db_manager.cursor.execute(PARTIAL_INDEX_SQL)
+            db_manager.cursor.execute("ANALYZE")
+            partial_plans = [
+                ' | '.join(row[3] for row in db_manager.cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+                for _, sql, params in queries
+            ]
+
+        partial_index = [timed_call(read, args.repeat) for _, read in reads]
+
+    print("=" * 70)
+    print(f"热点查询基准: {args.count} 条新闻（重复 {args.repeat} 次取最短）")
+    print("=" * 70)
+    print(f"{'':14}{INDEX_NAME:>14}{'+部分索引':>10}{'加速比':>10}")
+    for (name, _), plain, partial in zip(reads, plain_index, partial_index):
+        print(f"{name:10}{plain * 1000:12.1f}ms{partial * 1000:10.1f}ms{plain / partial:9.2f}x")
+
+    print(f"\n读取模型（最近30天 {len(rows)} 条，访问模板字段）:")
+    print(f"  NewsArticle(pydantic): {pydantic_decode * 1000:8.1f}ms")
+    print(f"  ArticleRow(__slots__): {slots_decode * 1000:8.1f}ms  ({pydantic_decode / slots_decode:.1f}x)")
+
+    print("\n统计信息（get_stats）:")
+    print(f"  逐项 COUNT/GROUP BY: {legacy_stats_time * 1000:8.1f}ms")
+    print(f"  计数表(含建立连接):  {counters_stats_time * 1000:8.1f}ms  ({legacy_stats_time / counters_stats_time:.0f}x)")
+    print(f"  结果一致: {'✓' if stats_ok else '✗'}")
+
+    print("\n加部分索引时的执行计划:")
+    for (name, _, _), plan in zip(queries, partial_plans):
+        print(f"  {name}: {plan}")
+
+    if problems:
+        print("\n✗ 执行计划不符合预期:")
+        for name, plan in problems:
+            print(f"  {name}: {plan}")
+    else:
+        print(f"\n✓ 所有查询都使用 {INDEX_NAME}，且无额外排序")
+    print("=" * 70)
+
+    if problems or not stats_ok:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,205 @@
+"""
+评分模块性能基准
+
+生成一批模拟新闻（中英文各半，标题和摘要随机混入各档关键词），
+对比逐个关键词子串检查（旧实现）与当前实现的耗时，并校验得分完全一致：
+calculate_priority_score 同样逐个检查（编译后的规则，逐条评分没有比逐个检查更快的扫描方式，
+见 src/keyword_matcher.py），score_batch 用字典树正则匹配器构建命中矩阵。
+分别测量每条新闻评分1次、按3个板块各评分1次，以及 score_batch 不使用缓存评分1次、
+使用命中统计缓存按3个板块各评分1次（只有第一次扫描文本）的情况。
+
+用法:
+    python benchmarks/bench_scorer.py
+    python benchmarks/bench_scorer.py --count 50000 --repeat 5
+"""
+
+import sys
+import time
+import random
+import argparse
+from pathlib import Path
+
+import yaml
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from news_bot.src.scorer import (
+    SCORING_RULES_FILE,
+    calculate_priority_score,
+    clear_score_cache,
+    score_batch
+)
+
+
+# 直接读取规则文件（不经过编译），作为对照实现的输入
+RULES = yaml.safe_load(SCORING_RULES_FILE.read_text(encoding='utf-8'))
+
+CATEGORIES = list(RULES['categories'])
+
+FILLER = {
+    'zh': list('市场投资者周二表示预计今年下半年将继续保持稳定增长态势但仍面临不确定性'),
+    'en': ['markets', 'investors', 'said', 'on', 'tuesday', 'they', 'expect', 'growth',
+           'to', 'remain', 'steady', 'this', 'year', 'despite', 'uncertainty', 'analysts']
+}
+
+
+def legacy_priority_score(article: dict, category: str = None) -> int:
+    """旧实现：逐个关键词执行子串检查（作为正确性和性能的对照）"""
+    if article.get('language') == 'en':
+        title = (article.get('title_original') or article.get('title') or '').lower()
+        content = (article.get('content_original') or article.get('content') or '').lower()
+        lang = 'en'
+    else:
+        title = (article.get('title') or '').lower()
+        content = (article.get('content') or '').lower()
+        lang = 'zh'
+
+    score = RULES['base_score']
+
+    for tier in RULES['tiers'].values():
+        keywords = tier['keywords'].get(lang) or []
+        for text, points, cap in (
+            (title, tier['title_points'], tier['title_cap']),
+            (content, tier['content_points'], tier['content_cap']),
+        ):
+            count = 0
+            for keyword in keywords:
+                if keyword in text:
+                    score += points
+                    count += 1
+                    if count >= cap:
+                        break
+
+    if category:
+        category_config = RULES['categories'].get(category, {})
+        for keyword in category_config.get('keywords', {}).get(lang) or []:
+            if keyword in title or keyword in content:
+                score += category_config.get('bonus', 0)
+                break
+
+    return min(score, RULES['max_score'])
+
+
+def make_text(rng: random.Random, lang: str, words: int, keyword_rate: float) -> str:
+    """生成一段混入关键词的文本"""
+    keywords = [
+        keyword
+        for group in list(RULES['tiers'].values()) + list(RULES['categories'].values())
+        for keyword in group['keywords'].get(lang) or []
+    ]
+    parts = []
+    for _ in range(words):
+        if rng.random() < keyword_rate:
+            parts.append(rng.choice(keywords))
+        else:
+            parts.append(rng.choice(FILLER[lang]))
+    separator = '' if lang == 'zh' else ' '
+    return separator.join(parts)
+
+
+def make_articles(count: int, seed: int = 42) -> list:
+    """生成模拟新闻"""
+    rng = random.Random(seed)
+    articles = []
+    for _ in range(count):
+        lang = rng.choice(['zh', 'en'])
+        # 长度接近真实数据：英文标题约70字符、摘要约130字符
+        if lang == 'en':
+            title = make_text(rng, lang, rng.randint(8, 14), 0.15)
+            content = make_text(rng, lang, rng.randint(15, 25), 0.08)
+        else:
+            title = make_text(rng, lang, rng.randint(10, 20), 0.15)
+            content = make_text(rng, lang, rng.randint(40, 80), 0.05)
+        if lang == 'en':
+            articles.append({
+                'title': '',
+                'title_original': title.title(),
+                'content_original': content,
+                'language': 'en'
+            })
+        else:
+            articles.append({'title': title, 'content': content, 'language': 'zh'})
+    return articles
+
+
+def timed(func, articles: list, categories: list, repeat: int, rounds: int = 1) -> float:
+    """
+    多次运行取最短耗时（秒）
+
+    rounds > 1 时每条新闻按不同板块评分 rounds 次，
+    模拟板块筛选、候补补齐、近似去重对同一条新闻的重复评分。
+    """
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for offset in range(rounds):
+            for i, article in enumerate(articles):
+                func(article, categories[(i + offset) % len(categories)])
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def timed_batch(articles: list, repeat: int, categories: list, use_cache: bool) -> float:
+    """score_batch 按各板块依次评分的耗时（每次重复前清空命中统计缓存）"""
+    best = float('inf')
+    for _ in range(repeat):
+        clear_score_cache()
+        start = time.perf_counter()
+        for category in categories:
+            score_batch(articles, category, use_cache=use_cache)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description='评分模块性能基准')
+    parser.add_argument('--count', type=int, default=10000, help='模拟新闻数量，默认10000')
+    parser.add_argument('--repeat', type=int, default=3, help='重复次数（取最短耗时），默认3')
+    args = parser.parse_args()
+
+    articles = make_articles(args.count)
+
+    # 正确性校验（每个板块和不指定板块）
+    mismatches = 0
+    for article in articles:
+        for category in CATEGORIES + [None]:
+            if calculate_priority_score(article, category) != legacy_priority_score(article, category):
+                mismatches += 1
+
+    for category in CATEGORIES + [None]:
+        batch_scores = score_batch(articles, category, use_cache=False).tolist()
+        for article, score in zip(articles, batch_scores):
+            if score != legacy_priority_score(article, category):
+                mismatches += 1
+
+    categories = CATEGORIES
+    legacy_single = timed(legacy_priority_score, articles, categories, args.repeat)
+    current_single = timed(calculate_priority_score, articles, categories, args.repeat)
+    legacy_multi = timed(legacy_priority_score, articles, categories, args.repeat, rounds=3)
+    current_multi = timed(calculate_priority_score, articles, categories, args.repeat, rounds=3)
+    batch_single = timed_batch(articles, args.repeat, CATEGORIES[:1], use_cache=False)
+    batch_multi = timed_batch(articles, args.repeat, CATEGORIES, use_cache=True)
+
+    print("=" * 60)
+    print(f"评分基准: {len(articles)} 条新闻（重复 {args.repeat} 次取最短）")
+    print("=" * 60)
+    print(f"{'':18}{'逐个检查':>12}{'当前实现':>12}{'加速比':>10}")
+    print(f"{'每条评分1次':14}{legacy_single * 1000:10.1f}ms{current_single * 1000:10.1f}ms"
+          f"{legacy_single / current_single:9.2f}x")
+    print(f"{'每条评分3次':14}{legacy_multi * 1000:10.1f}ms{current_multi * 1000:10.1f}ms"
+          f"{legacy_multi / current_multi:9.2f}x")
+    print(f"{'批量评分1次':14}{legacy_single * 1000:10.1f}ms{batch_single * 1000:10.1f}ms"
+          f"{legacy_single / batch_single:9.2f}x")
+    print(f"{'批量评分3次(缓存)':11}{legacy_multi * 1000:10.1f}ms{batch_multi * 1000:10.1f}ms"
+          f"{legacy_multi / batch_multi:9.2f}x")
+    print(f"得分不一致: {mismatches} 条")
+    print("=" * 60)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+时间解析性能基准
+
+生成一批模拟的RSS时间字符串（每个来源固定一种格式，少量来源混用两种格式），
+对比逐个尝试 strptime 格式（旧实现）与按形态分派 + 按来源记忆格式（当前实现）的耗时，
+并校验两者归一化到UTC后的结果完全一致。
+
+用法:
+    python benchmarks/bench_timestamps.py
+    python benchmarks/bench_timestamps.py --count 200000 --repeat 5
+"""
+
+import sys
+import time
+import random
+import argparse
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from news_bot.src.utils import STRPTIME_FORMATS, normalize_to_utc, parse_timestamp, _source_formats
+
+
+# 各来源的时间格式（与真实RSS源的情况接近）
+SOURCE_FORMATS = {
+    '华尔街日报': ['%a, %d %b %Y %H:%M:%S %z'],
+    '彭博社': ['%Y-%m-%dT%H:%M:%S.%fZ'],
+    'CNBC': ['%a, %d %b %Y %H:%M:%S GMT'],
+    'MarketWatch': ['%a, %d %b %Y %H:%M:%S %z', '%Y-%m-%dT%H:%M:%SZ'],
+    'Yahoo财经': ['%Y-%m-%dT%H:%M:%SZ'],
+    'crawl_time': ['%Y-%m-%dT%H:%M:%S.%f'],
+    '数据库': ['%Y-%m-%d %H:%M:%S'],
+    '东京': ['%Y-%m-%dT%H:%M:%S+09:00'],
+}
+
+
+def legacy_parse_timestamp(time_str: str) -> datetime:
+    """旧实现：按顺序逐个尝试 strptime 格式"""
+    if not time_str or not isinstance(time_str, str):
+        raise ValueError(f"无效的时间字符串: {time_str}")
+
+    time_str = time_str.strip()
+    for fmt in STRPTIME_FORMATS:
+        try:
+            return datetime.strptime(time_str, fmt)
+        except ValueError:
+            continue
+
+    raise ValueError(f"无法解析时间格式: {time_str}")
+
+
+def make_timestamps(count: int, seed: int = 42) -> list:
+    """生成 (来源, 时间字符串) 列表"""
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 26, tzinfo=timezone.utc)
+    sources = list(SOURCE_FORMATS)
+
+    items = []
+    for _ in range(count):
+        source = rng.choice(sources)
+        fmt = rng.choice(SOURCE_FORMATS[source])
+        moment = base - timedelta(seconds=rng.randint(0, 30 * 86400), microseconds=rng.randint(0, 999999))
+        items.append((source, moment.strftime(fmt)))
+    return items
+
+
+def timed(func, items: list, repeat: int) -> float:
+    """多次运行取最短耗时（秒）"""
+    best = float('inf')
+    for _ in range(repeat):
+        _source_formats.clear()
+        start = time.perf_counter()
+        func(items)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def run_legacy(items: list):
+    for _, time_str in items:
+        legacy_parse_timestamp(time_str)
+
+
+def run_current(items: list):
+    for source, time_str in items:
+        parse_timestamp(time_str, source)
+
+
+def run_current_without_source(items: list):
+    for _, time_str in items:
+        parse_timestamp(time_str)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='时间解析性能基准')
+    parser.add_argument('--count', type=int, default=100000, help='时间字符串数量，默认100000')
+    parser.add_argument('--repeat', type=int, default=3, help='重复次数（取最短耗时），默认3')
+    args = parser.parse_args()
+
+    items = make_timestamps(args.count)
+
+    # 正确性校验（归一化到UTC后比较）
+    mismatches = 0
+    _source_formats.clear()
+    for source, time_str in items:
+        expected = normalize_to_utc(legacy_parse_timestamp(time_str))
+        if normalize_to_utc(parse_timestamp(time_str, source)) != expected:
+            mismatches += 1
+        if normalize_to_utc(parse_timestamp(time_str)) != expected:
+            mismatches += 1
+
+    legacy = timed(run_legacy, items, args.repeat)
+    current = timed(run_current, items, args.repeat)
+    current_without_source = timed(run_current_without_source, items, args.repeat)
+
+    print("=" * 60)
+    print(f"时间解析基准: {len(items)} 条（重复 {args.repeat} 次取最短）")
+    print("=" * 60)
+    print(f"逐个尝试 strptime:   {legacy * 1000:10.1f}ms")
+    print(f"按形态分派:          {current_without_source * 1000:10.1f}ms"
+          f"  ({legacy / current_without_source:.1f}x)")
+    print(f"按形态分派+来源记忆: {current * 1000:10.1f}ms  ({legacy / current:.1f}x)")
+    print(f"结果不一致: {mismatches} 条")
+    print("=" * 60)
+
+    if mismatches:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
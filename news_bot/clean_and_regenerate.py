@@ -24,6 +24,7 @@ from news_bot.src.models import NewsArticle, Category, Language
 from news_bot.src.utils import get_effective_publish_time
 from news_bot.src.deduplicator import (
     deduplicate_by_title,
+    deduplicate_near_duplicates,
     cross_category_deduplicate,
     fill_top_10
 )
@@ -122,9 +123,13 @@ def process_and_save():
         for category, articles in grouped.items():
             before = len(articles)
             deduped = deduplicate_by_title(articles)
+            # 近似去重：同一事件的不同来源报道只保留一条
+            deduped, clusters = deduplicate_near_duplicates(deduped)
             after = len(deduped)
             deduped_by_category[category] = deduped
             logger.info(f"  {category}: {before} → {after}")
+            if clusters:
+                logger.info(f"    其中近似重复簇: {len(clusters)}个")
 
         # ========== 步骤5：跨板块去重 ==========
         logger.info("\n【步骤5】跨板块去重...")
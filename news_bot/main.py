@@ -1,9 +1,14 @@
 """主程序"""
 
+import os
 import sys
+import json
+import hashlib
 import argparse
+from itertools import groupby, islice
+from operator import attrgetter
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 from loguru import logger
 
 # 添加src目录到Python路径
@@ -13,7 +18,14 @@ from src.config import Config
 from src.database import DatabaseManager
 from src.scraper import fetch_all_sources
 from src.translator import translate_articles
-from src.html_generator import HTMLGenerator
+from src.html_generator import HTMLGenerator, render_pages_parallel
+from src.page_manifest import load_manifest, update_manifest, remove_pages_before
+from src.seen_filter import SeenFilter
+from src.interleave import interleave, fair_interleave, source_weights
+
+
+# 并行渲染时每个进程每批渲染的页面数（流式读取时积累够一批再提交给进程池）
+PARALLEL_RENDER_BATCH = 16
 
 
 def setup_logging():
@@ -27,18 +39,41 @@ def setup_logging():
     )
 
 
-def filter_and_sort_articles(articles: list, hours: int = 24, enable_time_filter: bool = True) -> list:
+def page_render_key(weights: dict = None) -> str:
+    """
+    页面内容除数据外还取决于模板和源权重，二者的摘要作为页面签名的一部分
+
+    Args:
+        weights: {源名称: 权重}
+
+    Returns:
+        str: 摘要
+    """
+    digest = hashlib.sha256()
+    for template_path in sorted(Config.TEMPLATES_DIR.glob("*.html")):
+        digest.update(template_path.read_bytes())
+    digest.update(json.dumps(sorted((weights or {}).items())).encode('utf-8'))
+    return digest.hexdigest()[:16]
+
+
+def filter_and_sort_articles(
+    articles: list,
+    hours: int = 24,
+    enable_time_filter: bool = True,
+    weights: dict = None
+) -> list:
     """
-    筛选并排序新闻（按时间筛选 + 按源分组轮询）
+    筛选并排序新闻（按时间筛选 + 按源加权公平排队）
 
     新逻辑：
     1. 筛选最近 N 小时内的新闻（不限制数量）
-    2. 按源分组轮询排列（彭博社→Yahoo→MarketWatch→...循环）
+    2. 按源分组加权公平排队（优先级高、近期健康的源出现得更频繁，各源均匀交错）
 
     Args:
         articles: 所有新闻列表
         hours: 时间筛选范围（小时），默认24小时
         enable_time_filter: 是否启用时间筛选，默认True。设为False则不筛选时间
+        weights: {源名称: 权重}，见 src.interleave.source_weights；不提供时各源等权轮询
 
     Returns:
         筛选并排序后的新闻列表
@@ -77,32 +112,17 @@ def filter_and_sort_articles(articles: list, hours: int = 24, enable_time_filter
     for source in source_articles:
         source_articles[source].sort(key=lambda x: x.publish_time, reverse=True)
 
-    # ========== 第三阶段：按源轮询排序 ==========
-    # 获取所有源列表（按源名排序保证一致性）
+    # ========== 第三阶段：按源加权公平排队 ==========
+    # 获取所有源列表（按源名排序，权重相同时按源名先后，保证结果确定）
     sources = sorted(source_articles.keys())
 
-    # 轮询从每个源取文章
-    sorted_articles = []
-    round_num = 1
-    has_articles = True
-
-    while has_articles:
-        has_articles = False
-
-        for source in sources:
-            if len(source_articles[source]) > 0:
-                # 每轮从每个源取1条（如果还有的话）
-                article = source_articles[source].pop(0)
-                sorted_articles.append(article)
-                has_articles = True
+    # 按虚拟完成时间从各源取文章，不在权重表中的源（如已停用的源）按最低权重
+    sorted_articles = list(fair_interleave(
+        {source: source_articles[source] for source in sources},
+        weights
+    ))
 
-        round_num += 1
-
-        # 如果某一轮没有任何文章了，退出循环
-        if not has_articles:
-            break
-
-    logger.info(f"  源轮询排序: {len(sources)} 个源，{round_num} 轮")
+    logger.info(f"  源{'加权' if weights else '轮询'}排序: {len(sources)} 个源")
     logger.info(f"  最终结果: {len(sorted_articles)} 条新闻")
 
     return sorted_articles
@@ -162,50 +182,40 @@ def select_top_news(articles: list, top_n: int = 20) -> list:
     # 获取所有源列表（按源优先级排序，这里按源名排序保证一致性）
     sources = sorted(source_queues.keys())
 
-    # 轮询从每个源取文章
-    top_articles = []
-    round_num = 1
-
-    while len(top_articles) < top_n:
-        round_has_articles = False
-
-        for source in sources:
-            if len(source_queues[source]) > 0:
-                # 每轮从每个源取1条（如果还有的话）
-                article = source_queues[source].pop(0)
-                top_articles.append(article)
-                round_has_articles = True
-
-                # 如果已经够了，退出
-                if len(top_articles) >= top_n:
-                    break
-
-        # 如果某一轮没有任何文章了，退出循环
-        if not round_has_articles:
-            break
-
-        round_num += 1
+    # 轮询从每个源取文章，凑够 top_n 条即停止
+    top_articles = list(islice(
+        interleave({source: source_queues[source] for source in sources}),
+        top_n
+    ))
+    rounds = max((len(source_queues[source]) for source in sources), default=0)
 
     logger.info(f"  源配额阶段: {len(quota_articles)} 条（每个源至少2条）")
     logger.info(f"  补充阶段: {len(remaining_articles[:top_n - len(quota_articles)])} 条")
-    logger.info(f"  轮询阶段: {len(sources)} 个源，{round_num} 轮")
+    logger.info(f"  轮询阶段: {len(sources)} 个源，最多 {rounds} 轮")
     logger.info(f"  最终筛选: {len(top_articles)} 条")
 
     return top_articles
 
 
-def regenerate_html_from_db(days: int = 7):
+def regenerate_html_from_db(days: int = 7, workers: int = 1, force: bool = False):
     """
     从数据库读取新闻并重新生成HTML
 
     流程：
-    1. 读取最近N天的所有新闻
-    2. 按发布日期分组
-    3. 每个日期分别筛选TOP 20并生成HTML
-    4. 更新首页
+    1. 计算源权重
+    2. 流式读取最近N天的新闻，按发布日期（北京时间）分组
+    3. 每个日期分别排序并生成HTML（页面已存在且数据签名未变的日期跳过）
+    4. 更新首页和搜索索引
+
+    来源健康度反映的是最近 SOURCE_HEALTH_DAYS 天的抓取情况，只用于这几天的页面；
+    更早的页面只按 sources.yaml 的优先级排序，不会因为健康度每天变化而重新排序、重新生成。
+
+    页面签名 = 该日期的 (记录数, 最大ID, 最大更新时间) + 模板和源权重的摘要，记录在页面清单中。
 
     Args:
         days: 天数，默认7天
+        workers: 渲染进程数，默认1（串行）；大于1时按日期分配到进程池并行渲染
+        force: 是否忽略页面签名，重新生成所有日期
     """
     from collections import defaultdict
     from datetime import timedelta
@@ -220,77 +230,118 @@ def regenerate_html_from_db(days: int = 7):
     db_manager.init_database()
     logger.info("✓ 数据库初始化完成")
 
-    # 2. 读取最近N天的所有新闻
-    logger.info(f"\n步骤2: 读取最近{days}天的新闻")
-    all_articles = db_manager.get_articles_by_days(days=days)
-
-    if not all_articles:
-        logger.warning(f"没有找到最近{days}天的新闻！")
-        return
-
-    logger.info(f"✓ 读取到 {len(all_articles)} 条新闻")
-
-    # 3. 按发布日期分组
-    logger.info("\n步骤3: 按发布日期分组")
-    from collections import defaultdict
-
-    articles_by_date = defaultdict(list)
-    for article in all_articles:
-        # 将UTC时间转换为北京时间后再提取日期（用于文件分组和命名）
-        from src.database import utc_to_beijing
-        publish_date = utc_to_beijing(article.publish_time).date()
-        articles_by_date[publish_date].append(article)
-
-    logger.info(f"✓ 分为 {len(articles_by_date)} 天:")
-    for date, articles in sorted(articles_by_date.items()):
-        logger.info(f"  {date}: {len(articles)} 条")
-
-    # 4. 为每个日期生成HTML
-    logger.info("\n步骤4: 为每个日期生成HTML")
+    # 2. 源权重：近期页面 = sources.yaml 的优先级 × 近期健康度，更早的页面只看优先级
+    logger.info("\n步骤2: 计算源权重")
+    sources = Config.load_sources()
+    recent_weights = source_weights(sources, db_manager.get_source_health(days=Config.SOURCE_HEALTH_DAYS))
+    base_weights = source_weights(sources)
+    health_start_date = (Config.get_beijing_time() - timedelta(days=Config.SOURCE_HEALTH_DAYS)).strftime("%Y-%m-%d")
+    logger.info("源权重: " + ", ".join(f"{source}={weight:.1f}" for source, weight in recent_weights.items())
+                + f"（{health_start_date} 之前的页面只按优先级）")
+
+    # 已生成页面的签名：页面文件存在且签名未变的日期不需要重新生成
+    recent_render_key = page_render_key(recent_weights)
+    base_render_key = page_render_key(base_weights)
+    date_signatures = db_manager.get_date_signatures(days)
+    existing_pages = {} if force else load_manifest(Config.OUTPUT_DIR).pages
+    skipped_dates = 0
+
+    # 3. 流式读取最近N天的新闻（按发布时间倒序），按北京日期分组后逐天排序、生成HTML
+    #    内存中只保留当前日期的新闻（并行渲染时最多保留一批待渲染的页面）
+    logger.info(f"\n步骤3: 读取最近{days}天的新闻并按日期生成HTML")
     generator = HTMLGenerator()
     generated_files = []
+    page_entries = []
+    pending_pages = []
+    total_articles = 0
 
-    for date, articles in sorted(articles_by_date.items(), reverse=True):
-        logger.info(f"\n处理日期: {date}")
+    pending_signatures = {}
 
-        # 按源轮询排序所有新闻（不限制数量，不筛选时间）
-        top_news = filter_and_sort_articles(articles, enable_time_filter=False)
-
-        # 生成HTML（使用指定日期）
-        date_str = date.strftime(Config.DATE_FORMAT)
+    def flush_pending_pages():
+        """并行渲染积累的页面"""
+        if not pending_pages:
+            return
+        logger.info(f"\n并行渲染 {len(pending_pages)} 个页面（{workers} 个进程）")
+        for entry in render_pages_parallel(pending_pages, workers):
+            entry['signature'] = pending_signatures.pop(entry['date'])
+            page_entries.append(entry)
+        for _, output_path, top_news in pending_pages:
+            generated_files.append(output_path)
+            logger.info(f"  ✓ 生成: {output_path.name} ({len(top_news)} 条新闻)")
+        pending_pages.clear()
+
+    articles_stream = db_manager.iter_articles(days=days, translated_only=True)
+    for beijing_date, group in groupby(articles_stream, key=attrgetter('beijing_date')):
+        if beijing_date >= health_start_date:
+            weights, render_key = recent_weights, recent_render_key
+        else:
+            weights, render_key = base_weights, base_render_key
+
+        signature = list(date_signatures.get(beijing_date, ())) + [render_key]
+        existing = existing_pages.get(beijing_date)
+        if existing and existing.get('signature') == signature:
+            # 页面已存在（清单只保留文件存在的页面）且数据、模板、权重都没有变化
+            total_articles += signature[0]
+            skipped_dates += 1
+            continue
+
+        articles = list(group)
+        total_articles += len(articles)
+        logger.info(f"\n处理日期: {beijing_date}（{len(articles)} 条）")
+
+        # 按源加权公平排队排序所有新闻（不限制数量，不筛选时间）
+        top_news = filter_and_sort_articles(articles, enable_time_filter=False, weights=weights)
+
+        date_str = datetime.strptime(beijing_date, "%Y-%m-%d").strftime(Config.DATE_FORMAT)
         filename = Config.OUTPUT_FILENAME_FORMAT.format(date=date_str)
         output_path = Config.OUTPUT_DIR / filename
 
-        # 临时修改系统时间以生成指定日期的HTML
-        # 实际上我们需要修改生成逻辑，让它接受日期参数
-        template = generator.env.get_template('daily_news.html')
-        html = template.render(
-            date=date_str,
-            articles=top_news,
-            total_articles=len(top_news)
-        )
+        if workers > 1:
+            pending_pages.append((date_str, output_path, top_news))
+            pending_signatures[date_str] = signature
+            if len(pending_pages) >= workers * PARALLEL_RENDER_BATCH:
+                flush_pending_pages()
+        else:
+            entry = generator.render_page(date_str, top_news, output_path)
+            entry['signature'] = signature
+            page_entries.append(entry)
+            generated_files.append(output_path)
+            logger.info(f"  ✓ 生成: {output_path.name} ({len(top_news)} 条新闻)")
+
+    flush_pending_pages()
+
+    if not total_articles:
+        logger.warning(f"没有找到最近{days}天的新闻！")
+        return
 
-        # 保存文件
-        output_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
+    logger.info(f"\n✓ 共 {total_articles} 条新闻，生成 {len(page_entries)} 个日期页面，"
+                f"{skipped_dates} 个日期未变化已跳过")
 
-        generated_files.append(output_path)
-        logger.info(f"  ✓ 生成: {output_path.name} ({len(top_news)} 条新闻)")
+    # 写入页面清单（首页更新只读取清单）
+    update_manifest(Config.OUTPUT_DIR, page_entries)
+    logger.info(f"✓ 页面清单已更新: {len(page_entries)} 个页面")
 
-    # 5. 更新首页
-    logger.info("\n步骤5: 更新首页")
+    # 4. 更新首页
+    logger.info("\n步骤4: 更新首页")
     from src.index_updater import IndexUpdater
     updater = IndexUpdater(project_root=Config.BASE_DIR.parent)
     index_path = Config.OUTPUT_DIR / "index.html"
-    success = updater.update_index(days=30)
+    success = updater.update_index(days=Config.INDEX_DAYS)
     if success:
-        logger.info("✓ 首页已更新（保留30天）")
+        logger.info(f"✓ 首页已更新（首页{Config.INDEX_DAYS}天，更早的按月归档）")
         # 将 index.html 添加到生成的文件列表中
         generated_files.append(index_path)
     else:
         logger.warning("⚠ 首页更新失败")
 
+    # 5. 增量更新静态搜索索引
+    logger.info("\n步骤5: 更新搜索索引")
+    from src.search_index import SearchIndexBuilder
+    try:
+        SearchIndexBuilder(db_manager, Config.OUTPUT_DIR).build()
+    except Exception as e:
+        logger.warning(f"⚠ 搜索索引更新失败: {e}")
+
     # 完成
     logger.info("\n" + "=" * 60)
     logger.success(f"HTML重新生成完成！共生成 {len(generated_files)} 个文件")
@@ -310,15 +361,21 @@ def main():
                         help='读取最近N天的新闻，默认7天（仅用于--html-only）')
     parser.add_argument('--test', action='store_true',
                         help='测试模式：每个源只抓取1条新闻，但完整跑完端到端流程')
+    parser.add_argument('--workers', type=int, default=1,
+                        help='HTML渲染进程数，默认1（串行）；0表示使用全部CPU核心')
+    parser.add_argument('--force', action='store_true',
+                        help='重新生成所有日期的页面（默认跳过数据未变化的日期）')
     args = parser.parse_args()
 
+    workers = args.workers if args.workers > 0 else (os.cpu_count() or 1)
+
     logger.info("=" * 60)
     logger.info("新闻抓取系统启动")
     logger.info("=" * 60)
 
     # 分支：只生成HTML模式
     if args.html_only:
-        regenerate_html_from_db(days=args.days)
+        regenerate_html_from_db(days=args.days, workers=workers, force=args.force)
         return
 
     try:
@@ -368,13 +425,18 @@ def main():
         new_articles = []
         cached_articles = []
 
+        # 布隆过滤器判定一定不存在的新闻不再查询数据库，其余一次批量查询确认
+        seen_filter = SeenFilter.for_database(db_manager)
+        candidates = [a for a in all_articles if seen_filter.might_contain(a)]
+        existing = dict(zip(map(id, candidates), db_manager.find_existing_articles(candidates)))
+        logger.info(f"  布隆过滤器: {len(all_articles)} 条中 {len(candidates)} 条可能已存在")
+
         for article in all_articles:
-            if db_manager.article_exists(article.title, article.title_original):
-                # 新闻已存在，从数据库读取
-                cached = db_manager.get_article_by_title(article.title, article.title_original)
-                if cached:
-                    cached_articles.append(cached)
-                    logger.info(f"  缓存命中: {cached.title_original or cached.title}")
+            cached = existing.get(id(article))
+            if cached:
+                # 新闻已存在，使用数据库中的版本
+                cached_articles.append(cached)
+                logger.info(f"  缓存命中: {cached.title_original or cached.title}")
             else:
                 # 新新闻，需要处理
                 new_articles.append(article)
@@ -389,13 +451,13 @@ def main():
 
         # 6. 保存所有新新闻到数据库
         logger.info("\n步骤6: 保存新新闻到数据库")
-        saved_count = 0
+        saved_articles = []
         for article in translated_new:
             # 保存到数据库（检查重复）
             try:
                 db_manager.save_article(article)
                 logger.debug(f"  已保存: {article.title_original or article.title}")
-                saved_count += 1
+                saved_articles.append(article)
             except Exception as e:
                 if "UNIQUE constraint" in str(e):
                     logger.warning(f"  跳过重复新闻: {article.title_original or article.title}")
@@ -403,15 +465,31 @@ def main():
                     logger.error(f"  保存失败: {e}")
                     raise
 
-        logger.info(f"✓ 已保存 {saved_count} 条新新闻到数据库")
+        seen_filter.add_articles(saved_articles)
+        seen_filter.save()
+        logger.info(f"✓ 已保存 {len(saved_articles)} 条新新闻到数据库")
 
-        # 7. 删除超过30天的旧文章
-        logger.info("\n步骤7: 清理旧文章")
-        deleted_count = db_manager.delete_old_articles(days=30)
-
-        # 8. 重新生成最近30天的HTML
-        logger.info("\n步骤8: 重新生成最近30天的HTML")
-        regenerate_html_from_db(days=30)
+        # 7. 删除超过保留期的旧文章
+        logger.info(f"\n步骤7: 清理旧文章（保留{Config.RETENTION_DAYS}天）")
+        deleted_count = db_manager.delete_old_articles(
+            days=Config.RETENTION_DAYS,
+            archive_dir=Config.ARCHIVE_DIR if Config.RETENTION_ARCHIVE else None,
+            vacuum_pages=Config.RETENTION_VACUUM_PAGES
+        )
+        if deleted_count:
+            # 布隆过滤器不支持删除，过期键只会造成多余的数据库查询，不必重建；
+            # 记录删除后的数据库指纹，下次加载时不会误判为有未知写入
+            seen_filter.save()
+
+        # 超过保留期的页面一并删除（数据已不在数据库中，页面不会再更新）
+        cutoff_date = (Config.get_beijing_time() - timedelta(days=Config.RETENTION_DAYS)).strftime("%Y-%m-%d")
+        removed_pages = remove_pages_before(Config.OUTPUT_DIR, cutoff_date)
+        if removed_pages:
+            logger.info(f"✓ 删除了 {removed_pages} 个超过保留期的页面")
+
+        # 8. 重新生成保留期内的HTML（首页和按月归档），数据未变化的日期跳过
+        logger.info(f"\n步骤8: 更新最近{Config.RETENTION_DAYS}天的HTML")
+        regenerate_html_from_db(days=Config.RETENTION_DAYS, workers=workers, force=args.force)
 
         # 注意：首页更新已在 regenerate_html_from_db() 中完成
         logger.info("\n步骤9: 首页已在步骤8中更新")
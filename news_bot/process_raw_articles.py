@@ -27,10 +27,13 @@ from loguru import logger
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+from news_bot.src.config import Config
 from news_bot.src.database import DatabaseManager
 from news_bot.src.utils import get_effective_publish_time
 from news_bot.src.deduplicator import (
     deduplicate_by_title,
+    deduplicate_near_duplicates,
+    deduplicate_cross_language,
     cross_category_deduplicate,
     fill_top_10
 )
@@ -96,9 +99,13 @@ def process_raw_articles():
         for category, articles in grouped.items():
             before_count = len(articles)
             deduped = deduplicate_by_title(articles)
+            # 近似去重：同一事件的不同来源报道只保留一条
+            deduped, clusters = deduplicate_near_duplicates(deduped)
             after_count = len(deduped)
             deduped_by_category[category] = deduped
             logger.info(f"  {category}: {before_count} → {after_count} (删除{before_count - after_count}条)")
+            if clusters:
+                logger.info(f"    其中近似重复簇: {len(clusters)}个")
 
         # ========== 步骤5：跨板块去重 ==========
         logger.info("\n【步骤5】跨板块去重（全局）...")
@@ -143,6 +150,20 @@ def process_raw_articles():
 
         logger.info(f"  需要翻译: {translation_count}条")
 
+        # ========== 步骤8.5：跨语言去重 ==========
+        # 在生成AI评论之前进行，避免中英文报道同一事件时重复调用API
+        logger.info("\n【步骤8.5】跨语言去重...")
+        all_selected = [a for articles in final_selected.values() for a in articles]
+        _, cross_lang_pairs = deduplicate_cross_language(
+            all_selected, Config.CROSS_LANG_DEDUP_THRESHOLD
+        )
+        removed_ids = {id(en_article) for en_article, _, _ in cross_lang_pairs}
+        for category in final_selected:
+            final_selected[category] = [
+                a for a in final_selected[category] if id(a) not in removed_ids
+            ]
+        logger.info(f"  删除 {len(cross_lang_pairs)} 条与中文新闻重复的英文新闻")
+
         # ========== 步骤9：生成AI评论（模拟） ==========
         logger.info("\n【步骤9】生成AI评论...")
         comment_count = 0
@@ -15,6 +15,7 @@ from src.config import Config
 from src.scraper import fetch_all_sources
 from src.translator import translate_articles
 from src.ai_comment import generate_comments
+from src.deduplicator import deduplicate_cross_language
 from src.html_generator import HTMLGenerator
 from src.models import Category
 
@@ -45,6 +46,12 @@ def main():
         translated_articles = translate_articles(all_articles)
         print("✓ 翻译完成")
 
+        # 跨语言去重：中英文报道同一事件时只保留中文原生新闻，避免重复生成评论
+        translated_articles, cross_lang_pairs = deduplicate_cross_language(
+            translated_articles, Config.CROSS_LANG_DEDUP_THRESHOLD
+        )
+        print(f"✓ 跨语言去重: 删除 {len(cross_lang_pairs)} 条")
+
         # 4. 筛选TOP新闻
         print("\n步骤4: 筛选重要新闻...")
         domestic = [a for a in translated_articles if a.category == Category.DOMESTIC]
@@ -0,0 +1,63 @@
+"""
+按关键词搜索数据库中的新闻（基于FTS5全文索引）
+
+用法:
+    python search_articles.py 美联储
+    python search_articles.py "rate cut" --days 30 --limit 10
+"""
+
+import sys
+import argparse
+from pathlib import Path
+
+# 添加项目根目录到Python路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from news_bot.src.database import DatabaseManager
+
+
+def search_articles(query: str, days: int = None, limit: int = 20):
+    """搜索并显示新闻"""
+    db_path = Path("data/news.db")
+    db_manager = DatabaseManager(db_path)
+    db_manager.init_database()
+
+    try:
+        print("=" * 80)
+        print(f"搜索: {query}" + (f"（最近{days}天）" if days else ""))
+        print("=" * 80)
+
+        articles = db_manager.search(query, days=days, limit=limit)
+
+        for i, article in enumerate(articles, 1):
+            print(f"\n{i}. 【{article.source}】{article.title}")
+            print(f"   原文: {article.title_original or '无'}")
+            print(f"   发布时间: {article.publish_time}")
+            print(f"   链接: {article.url}")
+            if article.ai_comment:
+                print(f"   AI评论: {article.ai_comment}")
+
+        print("\n" + "=" * 80)
+        print(f"共找到: {len(articles)}条新闻")
+        print("=" * 80)
+
+    except Exception as e:
+        print(f"错误: {e}")
+        import traceback
+        traceback.print_exc()
+
+    finally:
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description='按关键词搜索新闻')
+    parser.add_argument('query', help='搜索关键词，多个关键词用空格分隔（需全部命中）')
+    parser.add_argument('--days', type=int, default=None,
+                        help='只搜索最近N天的新闻，默认不限制')
+    parser.add_argument('--limit', type=int, default=20,
+                        help='最多显示条数，默认20')
+    args = parser.parse_args()
+
+    search_articles(args.query, days=args.days, limit=args.limit)
@@ -0,0 +1,386 @@
+"""
+历史新闻的列式归档
+
+超出数据库保留期的新闻按月（北京时间）存成一个压缩的列式文件，
+长时间跨度的统计和回填直接扫描归档，不需要访问线上数据库。
+
+文件结构（news-YYYY-MM.ncol）：
+
+    ARCHIVE_MAGIC
+    块0: 列0 | 列1 | ...      每列是 zlib 压缩的 JSON 数组
+    块1: ...
+    尾部元数据                 zlib 压缩的 JSON：列名、每个块的行数、
+                              publish_ts 最小/最大值、来源集合、各列的偏移和长度
+    FOOTER_TAIL               尾部元数据的长度 + ARCHIVE_MAGIC
+
+- 行按 publish_ts 排序后每 BLOCK_ROWS 行分成一块，按时间范围查询时大部分块可以直接跳过
+- 按来源筛选时，来源集合中没有目标来源的块同样跳过
+- 只解压需要的列（columns 参数），同一列的值放在一起压缩，重复的来源、板块等压缩率很高
+
+只用标准库（zlib + json），不引入额外依赖。
+"""
+
+import json
+import os
+import struct
+import zlib
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional
+
+from loguru import logger
+
+from .database import beijing_month_range, to_epoch
+
+
+ARCHIVE_MAGIC = b'NEWSCOL1'
+ARCHIVE_VERSION = 1
+ARCHIVE_SUFFIX = '.ncol'
+ARCHIVE_FILENAME_FORMAT = "news-{month}" + ARCHIVE_SUFFIX
+
+# 尾部：元数据长度 + 文件标识
+FOOTER_TAIL = struct.Struct('<Q8s')
+
+# 每块的行数
+BLOCK_ROWS = 1024
+
+COMPRESSION_LEVEL = 9
+
+# 导入时每批插入的行数
+IMPORT_BATCH_SIZE = 500
+
+
+def archive_path(archive_dir: Path, month: str) -> Path:
+    """某月（YYYY-MM，北京时间）的归档文件路径"""
+    return Path(archive_dir) / ARCHIVE_FILENAME_FORMAT.format(month=month)
+
+
+def _sort_key(record: dict) -> tuple:
+    publish_ts = record.get('publish_ts')
+    return (publish_ts is None, publish_ts or 0, record.get('id') or 0)
+
+
+def write_archive(path: Path, records: Iterable[dict]) -> int:
+    """
+    把新闻写成列式归档文件（覆盖已有文件，先写临时文件再替换）
+
+    Args:
+        path: 归档文件路径
+        records: 新闻记录（news_articles 的行转换成的字典）
+
+    Returns:
+        int: 写入的行数
+    """
+    records = sorted(records, key=_sort_key)
+
+    # 列名：按首次出现的顺序
+    columns = list(dict.fromkeys(key for record in records for key in record))
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+
+    blocks = []
+    with open(tmp_path, 'wb') as f:
+        f.write(ARCHIVE_MAGIC)
+
+        for start in range(0, len(records), BLOCK_ROWS):
+            block = records[start:start + BLOCK_ROWS]
+            timestamps = [record['publish_ts'] for record in block if record.get('publish_ts') is not None]
+
+            chunks = []
+            for column in columns:
+                values = [record.get(column) for record in block]
+                data = zlib.compress(
+                    json.dumps(values, ensure_ascii=False, separators=(',', ':')).encode('utf-8'),
+                    COMPRESSION_LEVEL
+                )
+                chunks.append((f.tell(), len(data)))
+                f.write(data)
+
+            blocks.append({
+                'rows': len(block),
+                'min_ts': min(timestamps) if timestamps else None,
+                'max_ts': max(timestamps) if timestamps else None,
+                'sources': sorted({record.get('source') for record in block if record.get('source')}),
+                'chunks': chunks,
+            })
+
+        footer = zlib.compress(json.dumps({
+            'version': ARCHIVE_VERSION,
+            'columns': columns,
+            'rows': len(records),
+            'blocks': blocks,
+        }, ensure_ascii=False).encode('utf-8'), COMPRESSION_LEVEL)
+        f.write(footer)
+        f.write(FOOTER_TAIL.pack(len(footer), ARCHIVE_MAGIC))
+
+    os.replace(tmp_path, path)
+    return len(records)
+
+
+def read_footer(path: Path) -> dict:
+    """
+    读取归档文件的尾部元数据
+
+    Args:
+        path: 归档文件路径
+
+    Returns:
+        dict: {'version', 'columns', 'rows', 'blocks'}
+
+    Raises:
+        ValueError: 文件不是有效的归档文件
+    """
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        if size < len(ARCHIVE_MAGIC) + FOOTER_TAIL.size:
+            raise ValueError(f"文件过短: {path}")
+
+        f.seek(size - FOOTER_TAIL.size)
+        footer_size, magic = FOOTER_TAIL.unpack(f.read(FOOTER_TAIL.size))
+        if magic != ARCHIVE_MAGIC:
+            raise ValueError(f"文件标识不匹配: {path}")
+
+        f.seek(size - FOOTER_TAIL.size - footer_size)
+        footer = json.loads(zlib.decompress(f.read(footer_size)))
+
+    if footer.get('version') != ARCHIVE_VERSION:
+        raise ValueError(f"不支持的归档版本: {footer.get('version')} ({path})")
+    return footer
+
+
+def _block_matches(block: dict, start_ts: Optional[int], end_ts: Optional[int], sources: Optional[set]) -> bool:
+    """根据块的统计信息判断块中是否可能有符合条件的行"""
+    if start_ts is not None or end_ts is not None:
+        if block['min_ts'] is None:
+            return False
+        if start_ts is not None and block['max_ts'] < start_ts:
+            return False
+        if end_ts is not None and block['min_ts'] >= end_ts:
+            return False
+    if sources is not None and sources.isdisjoint(block['sources']):
+        return False
+    return True
+
+
+def iter_archive_file(
+    path: Path,
+    start_ts: Optional[int] = None,
+    end_ts: Optional[int] = None,
+    sources: Optional[Iterable[str]] = None,
+    columns: Optional[List[str]] = None
+) -> Iterator[dict]:
+    """
+    扫描一个归档文件（按 publish_ts 升序）
+
+    Args:
+        path: 归档文件路径
+        start_ts: publish_ts 下限（含），None 表示不限制
+        end_ts: publish_ts 上限（不含），None 表示不限制
+        sources: 只返回这些来源的新闻，None 表示不限制
+        columns: 只返回这些列，None 表示全部列
+
+    Yields:
+        dict: 新闻记录
+    """
+    footer = read_footer(path)
+    all_columns = footer['columns']
+    sources = set(sources) if sources is not None else None
+    filter_by_time = start_ts is not None or end_ts is not None
+
+    output_columns = [c for c in columns if c in all_columns] if columns is not None else all_columns
+    needed = set(output_columns)
+    if filter_by_time:
+        needed.add('publish_ts')
+    if sources is not None:
+        needed.add('source')
+    read_columns = [c for c in all_columns if c in needed]
+
+    with open(path, 'rb') as f:
+        for block in footer['blocks']:
+            if not _block_matches(block, start_ts, end_ts, sources):
+                continue
+
+            values = {}
+            for column in read_columns:
+                offset, length = block['chunks'][all_columns.index(column)]
+                f.seek(offset)
+                values[column] = json.loads(zlib.decompress(f.read(length)))
+
+            for i in range(block['rows']):
+                if filter_by_time:
+                    publish_ts = values['publish_ts'][i]
+                    if publish_ts is None:
+                        continue
+                    if start_ts is not None and publish_ts < start_ts:
+                        continue
+                    if end_ts is not None and publish_ts >= end_ts:
+                        continue
+                if sources is not None and values['source'][i] not in sources:
+                    continue
+                yield {column: values[column][i] for column in output_columns}
+
+
+def iter_archive(
+    archive_dir: Path,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    sources: Optional[Iterable[str]] = None,
+    columns: Optional[List[str]] = None
+) -> Iterator[dict]:
+    """
+    按时间范围和来源扫描归档目录中的所有归档文件（按月份、publish_ts 升序）
+
+    Args:
+        archive_dir: 归档目录
+        start: 发布时间下限（UTC，含），None 表示不限制
+        end: 发布时间上限（UTC，不含），None 表示不限制
+        sources: 只返回这些来源的新闻，None 表示不限制
+        columns: 只返回这些列，None 表示全部列
+
+    Yields:
+        dict: 新闻记录
+    """
+    start_ts = to_epoch(start) if start else None
+    end_ts = to_epoch(end) if end else None
+    sources = set(sources) if sources is not None else None
+
+    for path in sorted(Path(archive_dir).glob(ARCHIVE_FILENAME_FORMAT.format(month='*'))):
+        yield from iter_archive_file(path, start_ts, end_ts, sources, columns)
+
+
+def append_archive(path: Path, records: List[dict]) -> int:
+    """
+    把新闻合并进已有的归档文件（按 id 去重，新记录覆盖旧记录）
+
+    Args:
+        path: 归档文件路径
+        records: 新闻记录
+
+    Returns:
+        int: 合并后的总行数
+    """
+    merged = {}
+    if Path(path).exists():
+        for record in iter_archive_file(path):
+            merged[record.get('id')] = record
+    for record in records:
+        merged[record.get('id')] = record
+
+    return write_archive(path, merged.values())
+
+
+def export_month(db_manager, month: str, archive_dir: Path) -> int:
+    """
+    把数据库中某月（北京时间）的新闻导出到归档文件（与已有归档合并，不删除数据库中的数据）
+
+    Args:
+        db_manager: DatabaseManager
+        month: 月份（YYYY-MM）
+        archive_dir: 归档目录
+
+    Returns:
+        int: 导出的行数
+    """
+    start_ts, end_ts = beijing_month_range(month)
+
+    with db_manager as db:
+        rows = db.cursor.execute("""
+            SELECT * FROM news_articles
+            WHERE publish_ts >= ? AND publish_ts < ?
+        """, (start_ts, end_ts)).fetchall()
+
+    if not rows:
+        return 0
+
+    path = archive_path(archive_dir, month)
+    total = append_archive(path, [dict(row) for row in rows])
+    logger.info(f"✓ 已导出 {month}: {len(rows)} 条（归档共 {total} 条）-> {path}")
+    return len(rows)
+
+
+def import_archive(
+    db_manager,
+    archive_dir: Path,
+    start: Optional[datetime] = None,
+    end: Optional[datetime] = None,
+    sources: Optional[Iterable[str]] = None
+) -> int:
+    """
+    把归档中的新闻导回数据库（回填），已存在的新闻（id 或规范化URL相同）跳过
+
+    Args:
+        db_manager: DatabaseManager（需已 init_database）
+        archive_dir: 归档目录
+        start: 发布时间下限（UTC，含）
+        end: 发布时间上限（UTC，不含）
+        sources: 只导入这些来源
+
+    Returns:
+        int: 导入的行数
+    """
+    imported = 0
+
+    with db_manager as db:
+        table_columns = [row['name'] for row in db.cursor.execute("PRAGMA table_info(news_articles)")]
+
+        def insert(batch: list):
+            columns = [c for c in table_columns if c in batch[0]]
+            placeholders = ", ".join("?" * len(columns))
+            db.cursor.executemany(
+                f"INSERT OR IGNORE INTO news_articles ({', '.join(columns)}) VALUES ({placeholders})",
+                [tuple(record.get(c) for c in columns) for record in batch]
+            )
+            # rowcount 不包括触发器写入的行（total_changes 包括）
+            return db.cursor.rowcount
+
+        batch = []
+        for record in iter_archive(archive_dir, start, end, sources):
+            # 不同月份的归档列可能不同，列集合变化时先提交当前批次
+            if batch and record.keys() != batch[0].keys():
+                imported += insert(batch)
+                batch = []
+            batch.append(record)
+            if len(batch) >= IMPORT_BATCH_SIZE:
+                imported += insert(batch)
+                batch = []
+        if batch:
+            imported += insert(batch)
+
+    logger.info(f"✓ 从归档导入了 {imported} 条新闻")
+    return imported
+
+
+# 测试代码
+if __name__ == "__main__":
+    # python -m news_bot.src.archive
+    import tempfile
+    import time
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / ARCHIVE_FILENAME_FORMAT.format(month='2026-01')
+        base_ts = to_epoch(datetime(2026, 1, 1))
+        records = [
+            {
+                'id': i,
+                'title': f"标题 {i}",
+                'content': "摘要" * 40,
+                'source': ['华尔街日报', '彭博社', 'CNBC'][i % 3],
+                'category': 'global',
+                'publish_ts': base_ts + i * 60,
+            }
+            for i in range(20000)
+        ]
+
+        write_archive(path, records)
+        footer = read_footer(path)
+        raw_size = len(json.dumps(records, ensure_ascii=False).encode('utf-8'))
+        print(f"{footer['rows']} 行, {len(footer['blocks'])} 块, "
+              f"{path.stat().st_size / 1024:.0f}KB（JSON {raw_size / 1024:.0f}KB）")
+
+        start = time.perf_counter()
+        hits = list(iter_archive(tmp_dir, start=datetime(2026, 1, 5), end=datetime(2026, 1, 6),
+                                 sources=['彭博社'], columns=['id', 'title']))
+        print(f"1月5日 彭博社: {len(hits)} 条, {(time.perf_counter() - start) * 1000:.1f}ms, 首条 {hits[0]}")
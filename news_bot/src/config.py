@@ -27,6 +27,7 @@ class Config:
     # 数据库配置
     DATABASE_DIR = BASE_DIR / "data"
     DATABASE_PATH = DATABASE_DIR / "news.db"
+    ARCHIVE_DIR = DATABASE_DIR / "archive"  # 过期新闻的按月归档
 
     # Claude API配置
     ANTHROPIC_API_KEY = os.getenv("ANTHROPIC_API_KEY", "")
@@ -44,8 +45,18 @@ class Config:
 
     # 新闻筛选
     TOP_NEWS_COUNT = 20           # 总共筛选TOP新闻数量
+    SOURCE_HEALTH_DAYS = int(os.getenv("SOURCE_HEALTH_DAYS", "7"))  # 来源健康度统计天数（影响来源交错排列的权重）
     MAX_AGE_HOURS = 48            # 新闻最大时效（小时）
 
+    # 去重配置
+    CROSS_LANG_DEDUP_THRESHOLD = float(os.getenv("CROSS_LANG_DEDUP_THRESHOLD", "0.4"))  # 跨语言标题相似度阈值
+
+    # 保留与展示
+    RETENTION_DAYS = int(os.getenv("RETENTION_DAYS", "365"))  # 数据库保留天数（也是每次重新生成页面的范围）
+    RETENTION_ARCHIVE = os.getenv("RETENTION_ARCHIVE", "false").lower() == "true"  # 删除前是否归档到 ARCHIVE_DIR
+    RETENTION_VACUUM_PAGES = int(os.getenv("RETENTION_VACUUM_PAGES", "5000"))  # 每次最多回收的空闲页数（0为不回收）
+    INDEX_DAYS = 30               # 首页展示天数，更早的历史通过按月归档浏览
+
     # 输出配置
     OUTPUT_FILENAME_FORMAT = "{date}.html"
     DATE_FORMAT = "%Y-%m-%d"
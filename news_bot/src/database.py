@@ -1,13 +1,43 @@
 """数据库管理模块"""
 
 import sqlite3
+from itertools import islice
 from pathlib import Path
 from datetime import datetime, timedelta, timezone
-from typing import Optional, List
+from typing import Callable, Dict, Iterator, Optional, List, Tuple
 from loguru import logger
 
-from .models import NewsArticle, Category, Language
+from .models import NewsArticle, ArticleRow, Category, Language
 from .config import Config
+from .url_utils import URL_RULES_VERSION, canonicalize_url
+
+
+# 批量存在性检查每批的文章数（SQLite单条语句的参数个数有限制）
+EXISTING_LOOKUP_BATCH = 200
+
+# 流式读取（iter_*）每批读取的行数
+ITER_BATCH_SIZE = 500
+
+# 全文索引覆盖的列
+FTS_COLUMNS = ('title', 'title_original', 'content', 'content_original', 'ai_comment')
+
+# 计数表（stats_counters）维护的统计维度：{表名: ((维度, 取值表达式, 依赖的列), ...)}
+# 表达式中的 {row} 在触发器中替换为 new/old，回填时替换为表名；取值为 NULL 的行不计入该维度
+STATS_DIMENSIONS = {
+    'news_articles': (
+        ('total', "''", None),
+        ('category', "{row}.category", 'category'),
+        ('language', "{row}.language", 'language'),
+        ('translated', "CASE WHEN {row}.translated = 1 THEN '' END", 'translated'),
+        ('ai_comment', "CASE WHEN {row}.ai_comment IS NOT NULL THEN '' END", 'ai_comment'),
+    ),
+    'raw_articles': (
+        ('total', "''", None),
+        ('category', "{row}.category", 'category'),
+        ('source', "{row}.source", 'source'),
+        ('language', "{row}.language", 'language'),
+    ),
+}
 
 
 def get_utc_now() -> datetime:
@@ -34,6 +64,69 @@ def utc_to_beijing(utc_dt: datetime) -> datetime:
     return utc_dt + timedelta(hours=8)
 
 
+def to_epoch(utc_dt: datetime) -> int:
+    """
+    将UTC时间（不带时区信息）转换为Unix时间戳（秒），用于 publish_ts 列
+
+    Args:
+        utc_dt: UTC时间对象
+
+    Returns:
+        int: Unix时间戳
+    """
+    return int(utc_dt.replace(tzinfo=timezone.utc).timestamp())
+
+
+def to_beijing_date(utc_dt: datetime) -> str:
+    """
+    UTC时间对应的北京日期（YYYY-MM-DD），用于 beijing_date 列
+
+    Args:
+        utc_dt: UTC时间对象
+
+    Returns:
+        str: 北京日期
+    """
+    return utc_to_beijing(utc_dt).strftime("%Y-%m-%d")
+
+
+def beijing_cutoff_ts(days: int) -> int:
+    """
+    "最近N天"的起点（基于北京时间计算，无论在哪个时区运行结果都一致），返回 publish_ts 时间戳
+
+    Args:
+        days: 天数
+
+    Returns:
+        int: Unix时间戳
+    """
+    cutoff_beijing = Config.get_beijing_time() - timedelta(days=days)
+    return to_epoch(cutoff_beijing - timedelta(hours=8))  # 转回 UTC
+
+
+def beijing_month_range(month: str) -> tuple:
+    """
+    北京时间某月的 publish_ts 范围
+
+    Args:
+        month: 月份（YYYY-MM）
+
+    Returns:
+        tuple: (月初, 下月初) 的UTC时间戳，左闭右开
+    """
+    start_beijing = datetime.strptime(month, "%Y-%m")
+    if start_beijing.month == 12:
+        end_beijing = start_beijing.replace(year=start_beijing.year + 1, month=1)
+    else:
+        end_beijing = start_beijing.replace(month=start_beijing.month + 1)
+
+    # 北京时间的月初/下月初，转回 UTC
+    return (
+        to_epoch(start_beijing - timedelta(hours=8)),
+        to_epoch(end_beijing - timedelta(hours=8))
+    )
+
+
 class DatabaseManager:
     """数据库管理器"""
 
@@ -47,6 +140,7 @@ class DatabaseManager:
         self.db_path = db_path
         self.conn = None
         self.cursor = None
+        self.fts_enabled = None  # 全文索引是否可用（init_database后确定）
 
     def connect(self):
         """建立数据库连接"""
@@ -97,11 +191,26 @@ class DatabaseManager:
                 self._upgrade_table_if_needed()
                 logger.info("✓ 数据库表检查完成")
 
+            # 删除旧版本创建的部分索引（没有带来收益，见 _drop_translated_index）
+            self._drop_translated_index()
+
             # 创建原始抓取数据临时表（每次都确保存在）
             self._create_raw_articles_table()
 
+            # 创建全文索引（每次都确保存在）
+            self._create_fts_index()
+
+            # 创建统计计数表（每次都确保存在）
+            self._create_stats_counters()
+
+            # URL规范化规则变化后重新计算 url_canonical（在全文索引触发器升级之后，避免逐行触发）
+            self._upgrade_url_canonical()
+
     def _create_tables(self):
         """创建数据库表"""
+        # 新数据库直接使用增量回收模式（必须在建第一张表之前设置），见 retention.py
+        self.cursor.execute("PRAGMA auto_vacuum = INCREMENTAL")
+
         # 创建新闻文章表
         self.cursor.execute("""
             CREATE TABLE news_articles (
@@ -113,9 +222,12 @@ class DatabaseManager:
                 source TEXT NOT NULL,
                 source_original TEXT,
                 url TEXT,
+                url_canonical TEXT,
                 category TEXT NOT NULL,
                 language TEXT NOT NULL,
                 publish_time TIMESTAMP NOT NULL,
+                publish_ts INTEGER,
+                beijing_date TEXT,
                 crawl_time TIMESTAMP NOT NULL,
                 tags TEXT,
                 ai_comment TEXT,
@@ -130,7 +242,11 @@ class DatabaseManager:
 
         # 创建索引
         self.cursor.execute("""
-            CREATE INDEX idx_publish_time ON news_articles(publish_time DESC)
+            CREATE INDEX idx_publish_ts ON news_articles(publish_ts DESC)
+        """)
+
+        self.cursor.execute("""
+            CREATE INDEX idx_beijing_date ON news_articles(beijing_date)
         """)
 
         self.cursor.execute("""
@@ -141,6 +257,10 @@ class DatabaseManager:
             CREATE INDEX idx_title_original ON news_articles(title_original)
         """)
 
+        self.cursor.execute("""
+            CREATE UNIQUE INDEX idx_url_canonical ON news_articles(url_canonical)
+        """)
+
         logger.debug("数据库表和索引已创建")
 
     def _upgrade_table_if_needed(self):
@@ -157,7 +277,8 @@ class DatabaseManager:
         required_columns = {
             'title_original', 'source_original', 'content_original',
             'url', 'language', 'tags', 'ai_comment',
-            'translated', 'translation_method', 'featured'
+            'translated', 'translation_method', 'featured', 'url_canonical',
+            'publish_ts', 'beijing_date'
         }
 
         missing_columns = required_columns - columns
@@ -186,6 +307,15 @@ class DatabaseManager:
                 self.cursor.execute("ALTER TABLE news_articles ADD COLUMN translation_method TEXT")
             if 'featured' not in columns:
                 self.cursor.execute("ALTER TABLE news_articles ADD COLUMN featured BOOLEAN DEFAULT 0")
+            if 'url_canonical' not in columns:
+                self.cursor.execute("ALTER TABLE news_articles ADD COLUMN url_canonical TEXT")
+                self._backfill_url_canonical()
+            if 'publish_ts' not in columns:
+                self.cursor.execute("ALTER TABLE news_articles ADD COLUMN publish_ts INTEGER")
+            if 'beijing_date' not in columns:
+                self.cursor.execute("ALTER TABLE news_articles ADD COLUMN beijing_date TEXT")
+            if {'publish_ts', 'beijing_date'} & missing_columns:
+                self._backfill_publish_ts()
 
             # 检查并创建唯一索引
             self.cursor.execute("""
@@ -197,65 +327,259 @@ class DatabaseManager:
                     CREATE INDEX idx_title_original ON news_articles(title_original)
                 """)
 
+            self.cursor.execute("""
+                CREATE UNIQUE INDEX IF NOT EXISTS idx_url_canonical ON news_articles(url_canonical)
+            """)
+
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_publish_ts ON news_articles(publish_ts DESC)
+            """)
+
+            self.cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_beijing_date ON news_articles(beijing_date)
+            """)
+
+            # 范围查询和排序已改用 publish_ts，旧的字符串时间索引不再需要
+            self.cursor.execute("DROP INDEX IF EXISTS idx_publish_time")
+
             logger.info("✓ 数据库表升级完成")
 
-    def article_exists(self, title: str, title_original: Optional[str] = None) -> bool:
+    def _drop_translated_index(self):
+        """
+        删除旧版本创建的部分索引 idx_translated_publish_ts（publish_ts DESC WHERE translated = 1）
+
+        页面重新生成、按月归档的查询（SELECT *，已翻译，按 publish_ts 倒序）用 idx_publish_ts 即可按索引顺序读取、
+        无需额外排序，未翻译的行（约15%）只是逐行跳过。benchmarks/bench_db_queries.py（10万条）中，
+        加上部分索引后各读取的耗时在 0.7x-1.3x 之间波动，没有稳定的收益；
+        查询读取几乎所有列（包括两份摘要），覆盖索引等于复制整张表。每次写入都要维护的索引不值得保留。
+        """
+        self.cursor.execute("DROP INDEX IF EXISTS idx_translated_publish_ts")
+
+    def _backfill_url_canonical(self):
+        """
+        为已有数据填充 url_canonical
+
+        多条记录规范化后URL相同时，只有最早的一条（ID最小）保留规范化URL，
+        其余置为NULL，以便创建唯一索引。
+        """
+        rows = self.cursor.execute(
+            "SELECT id, url FROM news_articles WHERE url IS NOT NULL ORDER BY id"
+        ).fetchall()
+
+        seen = set()
+        updates = []
+        collisions = 0
+        for row in rows:
+            canonical = canonicalize_url(row['url'])
+            if not canonical:
+                continue
+            if canonical in seen:
+                collisions += 1
+                continue
+            seen.add(canonical)
+            updates.append((canonical, row['id']))
+
+        self.cursor.executemany(
+            "UPDATE news_articles SET url_canonical = ? WHERE id = ?", updates
+        )
+        logger.info(f"✓ 已填充规范化URL: {len(updates)} 条（重复 {collisions} 条）")
+
+    def _upgrade_url_canonical(self):
+        """
+        URL规范化规则（URL_RULES_VERSION）变化后，按新规则重新计算已有数据的 url_canonical
+
+        数据库按哪个版本的规则计算，记录在 PRAGMA user_version 中。
+        先全部置为NULL再回填，避免新旧规则的值在唯一索引上冲突。
+        """
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version >= URL_RULES_VERSION:
+            return
+
+        self.cursor.execute("UPDATE news_articles SET url_canonical = NULL")
+        self._backfill_url_canonical()
+        self.cursor.execute(f"PRAGMA user_version = {URL_RULES_VERSION}")
+        logger.info(f"✓ 规范化URL已按新规则重新计算（规则版本 {version} -> {URL_RULES_VERSION}）")
+
+    def _backfill_publish_ts(self):
+        """
+        为已有数据填充 publish_ts（UTC时间戳）和 beijing_date（北京日期）
+
+        publish_time 以ISO字符串存储（UTC，不带时区），直接用SQLite的日期函数一次性换算。
+        """
+        self.cursor.execute("""
+            UPDATE news_articles
+            SET publish_ts = CAST(strftime('%s', publish_time) AS INTEGER),
+                beijing_date = date(publish_time, '+8 hours')
+        """)
+        logger.info(f"✓ 已填充发布时间戳和北京日期: {self.cursor.rowcount} 条")
+
+    def article_exists(
+        self,
+        title: str,
+        title_original: Optional[str] = None,
+        url: Optional[str] = None
+    ) -> bool:
         """
         检查新闻是否已存在
 
+        先按规范化URL查找（url_canonical 唯一索引），未命中再按标题查找
+
         Args:
             title: 新闻标题（中文）
             title_original: 原始标题（英文）
+            url: 新闻链接（可选）
 
         Returns:
             bool: 如果新闻已存在返回True，否则返回False
         """
         with self:
-            if title_original:
-                # 英文新闻：通过原始标题去重
-                query = "SELECT id FROM news_articles WHERE title_original = ?"
-                params = [title_original]
-            else:
-                # 中文新闻：通过中文标题去重
-                query = "SELECT id FROM news_articles WHERE title = ? AND title_original IS NULL"
-                params = [title]
-
-            result = self.cursor.execute(query, params).fetchone()
-            return result is not None
+            return self._find_article_row(title, title_original, url, "id") is not None
 
-    def get_article_by_title(self, title: str, title_original: Optional[str] = None) -> Optional[NewsArticle]:
+    def get_article_by_title(
+        self,
+        title: str,
+        title_original: Optional[str] = None,
+        url: Optional[str] = None
+    ) -> Optional[NewsArticle]:
         """
-        根据标题获取新闻文章
+        根据标题（或规范化URL）获取新闻文章
 
         Args:
             title: 新闻标题（中文）
             title_original: 原始标题（英文）
+            url: 新闻链接（可选，优先按规范化URL查找）
 
         Returns:
             NewsArticle: 新闻文章对象，如果不存在返回None
         """
         with self:
-            if title_original:
-                # 英文新闻：通过原始标题查询
-                query = """
-                    SELECT * FROM news_articles
-                    WHERE title_original = ?
-                """
-                params = [title_original]
-            else:
-                # 中文新闻：通过中文标题查询
-                query = """
-                    SELECT * FROM news_articles
-                    WHERE title = ? AND title_original IS NULL
-                """
-                params = [title]
-
-            result = self.cursor.execute(query, params).fetchone()
+            result = self._find_article_row(title, title_original, url, "*")
 
             if result:
                 return self._row_to_article(result)
             return None
 
+    def _find_article_row(
+        self,
+        title: str,
+        title_original: Optional[str],
+        url: Optional[str],
+        columns: str
+    ) -> Optional[sqlite3.Row]:
+        """按规范化URL或标题查找一条记录（每一步都是索引查找）"""
+        url_canonical = canonicalize_url(url)
+        if url_canonical:
+            result = self.cursor.execute(
+                f"SELECT {columns} FROM news_articles WHERE url_canonical = ?",
+                [url_canonical]
+            ).fetchone()
+            if result:
+                return result
+
+        if title_original:
+            # 英文新闻：通过原始标题去重
+            query = f"SELECT {columns} FROM news_articles WHERE title_original = ?"
+            params = [title_original]
+        else:
+            # 中文新闻：通过中文标题去重
+            query = f"SELECT {columns} FROM news_articles WHERE title = ? AND title_original IS NULL"
+            params = [title]
+
+        return self.cursor.execute(query, params).fetchone()
+
+    def find_existing_articles(self, articles: List[NewsArticle]) -> List[Optional[NewsArticle]]:
+        """
+        批量检查新闻是否已存在（规则与 get_article_by_title 相同）
+
+        每批最多 EXISTING_LOOKUP_BATCH 条，一次查询同时匹配规范化URL、原始标题和中文标题。
+
+        Args:
+            articles: 待检查的新闻列表
+
+        Returns:
+            List[Optional[NewsArticle]]: 与输入一一对应，已存在时为数据库中的文章，否则为None
+        """
+        results = [None] * len(articles)
+
+        with self:
+            for start in range(0, len(articles), EXISTING_LOOKUP_BATCH):
+                batch = articles[start:start + EXISTING_LOOKUP_BATCH]
+                url_keys = [canonicalize_url(a.url) for a in batch]
+
+                urls = sorted({u for u in url_keys if u})
+                originals = sorted({a.title_original for a in batch if a.title_original})
+                titles = sorted({a.title for a in batch if not a.title_original and a.title})
+
+                conditions = []
+                params = []
+                if urls:
+                    conditions.append(f"url_canonical IN ({', '.join('?' * len(urls))})")
+                    params.extend(urls)
+                if originals:
+                    conditions.append(f"title_original IN ({', '.join('?' * len(originals))})")
+                    params.extend(originals)
+                if titles:
+                    conditions.append(
+                        f"(title IN ({', '.join('?' * len(titles))}) AND title_original IS NULL)"
+                    )
+                    params.extend(titles)
+                if not conditions:
+                    continue
+
+                rows = self.cursor.execute(
+                    f"SELECT * FROM news_articles WHERE {' OR '.join(conditions)}", params
+                ).fetchall()
+
+                by_url, by_original, by_title = {}, {}, {}
+                for row in rows:
+                    if row['url_canonical']:
+                        by_url.setdefault(row['url_canonical'], row)
+                    if row['title_original']:
+                        by_original.setdefault(row['title_original'], row)
+                    else:
+                        by_title.setdefault(row['title'], row)
+
+                for offset, (article, url_key) in enumerate(zip(batch, url_keys)):
+                    row = by_url.get(url_key) if url_key else None
+                    if row is None:
+                        if article.title_original:
+                            row = by_original.get(article.title_original)
+                        else:
+                            row = by_title.get(article.title)
+                    if row is not None:
+                        results[start + offset] = self._row_to_article(row)
+
+        return results
+
+    def iter_article_keys(self) -> Iterator[tuple]:
+        """
+        逐行读取所有文章的去重键（用于重建布隆过滤器，不一次性读入内存）
+
+        Yields:
+            tuple: (title, title_original, url)
+        """
+        with self:
+            for row in self.cursor.execute("SELECT title, title_original, url FROM news_articles"):
+                yield tuple(row)
+
+    def get_articles_fingerprint(self) -> Tuple[int, int]:
+        """
+        news_articles 的指纹：(文章数, 最大ID)
+
+        文章数取自计数表，最大ID走主键，都不需要扫描全表。
+        id 是 AUTOINCREMENT，任何新增都会使最大ID变大；只删除时最大ID不增、文章数减少。
+
+        Returns:
+            Tuple[int, int]: (文章数, 最大ID)，空表时为 (0, 0)
+        """
+        with self:
+            row = self.cursor.execute("""
+                SELECT count FROM stats_counters
+                WHERE table_name = 'news_articles' AND dimension = 'total' AND value = ''
+            """).fetchone()
+            max_id = self.cursor.execute("SELECT MAX(id) FROM news_articles").fetchone()[0]
+            return (row[0] if row else 0, max_id or 0)
+
     def save_article(self, article: NewsArticle) -> int:
         """
         保存新闻文章到数据库
@@ -273,10 +597,10 @@ class DatabaseManager:
             query = """
                 INSERT INTO news_articles (
                     title, title_original, content, content_original,
-                    source, source_original, url, category, language,
-                    publish_time, crawl_time, tags, ai_comment,
+                    source, source_original, url, url_canonical, category, language,
+                    publish_time, publish_ts, beijing_date, crawl_time, tags, ai_comment,
                     translated, translation_method, featured
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """
 
             params = (
@@ -287,9 +611,12 @@ class DatabaseManager:
                 article.source,
                 article.source_original,
                 article.url,
+                canonicalize_url(article.url),
                 article.category.value,
                 article.language.value,
                 article.publish_time.isoformat(),
+                to_epoch(article.publish_time),
+                to_beijing_date(article.publish_time),
                 article.crawl_time.isoformat(),
                 tags_json,
                 article.ai_comment,
@@ -342,24 +669,121 @@ class DatabaseManager:
         Returns:
             List[NewsArticle]: 新闻文章列表
         """
-        with self:
-            query = """
-                SELECT * FROM news_articles
-                ORDER BY publish_time DESC
-            """
+        rows = self.iter_articles(batch_size=min(limit, ITER_BATCH_SIZE) if limit else ITER_BATCH_SIZE)
+        return [row.to_article() for row in islice(rows, limit or None)]
+
+    def _iter_keyset(
+        self,
+        table: str,
+        conditions: List[str],
+        params: list,
+        decode: Callable,
+        batch_size: int = ITER_BATCH_SIZE,
+        order_column: str = 'publish_ts'
+    ) -> Iterator:
+        """
+        按 order_column 倒序（相同时按 id 正序）分批读取（键集分页）
+
+        排序与 order_column 上的倒序索引的自然顺序一致，不需要额外排序。
+        每批是一条独立的查询，从上一批最后一行 (k, id) 之后继续：
+            WHERE ... AND order_column <= k AND (order_column < k OR id > id)
+        LIMIT batch_size 后用 fetchmany 读取。内存中最多只有一批数据，
+        两批之间不持有读事务，调用方在遍历过程中也可以写数据库。
+        使用独立的连接，不影响 with self 的连接。
+
+        NULL 无法参与上面的比较（混进某一批的末尾会使下一批查询为空、提前结束），
+        所以 order_column 为 NULL 的行不参与键集分页，在最后按 id 正序单独分批读取，
+        整体顺序与 ORDER BY order_column DESC（NULL 排在最后）一致。
+
+        Args:
+            table: 表名
+            conditions: WHERE 条件列表（AND 连接）
+            params: 条件参数
+            decode: 将 sqlite3.Row 转换为结果对象的函数
+            batch_size: 每批行数
+            order_column: 排序列
+
+        Yields:
+            decode 的结果
+        """
+        where_sql = f"SELECT * FROM {table} WHERE " + " AND ".join(conditions or ["1=1"])
+        base_sql = where_sql + f" AND {order_column} IS NOT NULL"
+        keyset_sql = f" AND {order_column} <= ? AND ({order_column} < ? OR id > ?)"
+        order_sql = f" ORDER BY {order_column} DESC, id ASC LIMIT ?"
+        null_sql = where_sql + f" AND {order_column} IS NULL AND id > ? ORDER BY id LIMIT ?"
+
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        try:
+            cursor = conn.cursor()
+            last_key = None
+            while True:
+                if last_key is None:
+                    cursor.execute(base_sql + order_sql, (*params, batch_size))
+                else:
+                    last_value, last_id = last_key
+                    cursor.execute(
+                        base_sql + keyset_sql + order_sql,
+                        (*params, last_value, last_value, last_id, batch_size)
+                    )
+
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+
+                last_key = (rows[-1][order_column], rows[-1]['id'])
+                for row in rows:
+                    yield decode(row)
+
+                if len(rows) < batch_size:
+                    break
+
+            last_id = 0
+            while True:
+                cursor.execute(null_sql, (*params, last_id, batch_size))
+                rows = cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+
+                last_id = rows[-1]['id']
+                for row in rows:
+                    yield decode(row)
+
+                if len(rows) < batch_size:
+                    break
+        finally:
+            conn.close()
+
+    def iter_articles(
+        self,
+        days: Optional[int] = None,
+        translated_only: bool = False,
+        batch_size: int = ITER_BATCH_SIZE
+    ) -> Iterator[ArticleRow]:
+        """
+        按发布时间倒序流式读取新闻（内存占用与表大小无关）
 
-            if limit:
-                query += f" LIMIT {limit}"
+        publish_ts 为空的新闻（发布时间无法换算）排在最后；指定 days 时不返回。
 
-            results = self.cursor.execute(query).fetchall()
+        Args:
+            days: 只读取最近N天（基于北京时间），None表示不限制
+            translated_only: 只读取已翻译的新闻
+            batch_size: 每批读取的行数
 
-            articles = []
-            for row in results:
-                articles.append(self._row_to_article(row))
+        Yields:
+            ArticleRow: 只读新闻对象
+        """
+        conditions = []
+        params = []
+        if days is not None:
+            conditions.append("publish_ts >= ?")
+            params.append(beijing_cutoff_ts(days))
+        if translated_only:
+            conditions.append("translated = 1")
 
-            return articles
+        yield from self._iter_keyset("news_articles", conditions, params, ArticleRow.from_row, batch_size)
 
-    def get_articles_by_days(self, days: int = 7) -> List[NewsArticle]:
+    def get_articles_by_days(self, days: int = 7) -> List[ArticleRow]:
         """
         获取最近N天的所有新闻文章（已翻译）
 
@@ -369,76 +793,126 @@ class DatabaseManager:
             days: 天数，默认7天
 
         Returns:
-            List[NewsArticle]: 新闻文章列表
+            List[ArticleRow]: 新闻文章列表（只读模型，时间和标签在访问时才解析）
         """
-        with self:
-            # 基于北京时间计算"最近N天"，然后转回 UTC 用于数据库查询
-            # 这样无论在本地还是 GitHub Actions (UTC环境) 运行，结果都一致
-            from .config import Config
-            beijing_now = Config.get_beijing_time()
-            cutoff_beijing = beijing_now - timedelta(days=days)
-            cutoff_time = cutoff_beijing - timedelta(hours=8)  # 转回 UTC
+        articles = list(self.iter_articles(days=days, translated_only=True))
 
-            query = """
-                SELECT * FROM news_articles
-                WHERE publish_time >= ?
+        logger.info(f"从数据库读取最近 {days} 天的新闻: {len(articles)} 条")
+        return articles
+
+    def get_date_signatures(self, days: int) -> dict:
+        """
+        获取最近 days 天每个日期（北京时间）已翻译新闻的数据签名
+
+        签名为 (记录数, 最大ID, 最大更新时间)，任一变化说明该日期有新增、修改或删除。
+
+        Args:
+            days: 天数
+
+        Returns:
+            dict: {YYYY-MM-DD: (count, max_id, max_updated_at)}
+        """
+        with self:
+            results = self.cursor.execute("""
+                SELECT beijing_date, COUNT(*), MAX(id), MAX(updated_at)
+                FROM news_articles
+                WHERE publish_ts >= ?
                 AND translated = 1
-                ORDER BY publish_time DESC
-            """
+                GROUP BY beijing_date
+            """, (beijing_cutoff_ts(days),)).fetchall()
 
-            results = self.cursor.execute(query, (cutoff_time,)).fetchall()
+            return {row[0]: (row[1], row[2], row[3]) for row in results if row[0]}
 
-            articles = []
-            for row in results:
-                articles.append(self._row_to_article(row))
+    def get_month_signatures(self) -> dict:
+        """
+        获取每个月（北京时间）已翻译新闻的数据签名
 
-            logger.info(f"从数据库读取最近 {days} 天的新闻: {len(articles)} 条")
-            return articles
+        签名为 (记录数, 最大ID, 最大更新时间)，任一变化说明该月有新增、修改或删除。
+
+        Returns:
+            dict: {YYYY-MM: (count, max_id, max_updated_at)}
+        """
+        with self:
+            results = self.cursor.execute("""
+                SELECT substr(beijing_date, 1, 7) AS month,
+                       COUNT(*), MAX(id), MAX(updated_at)
+                FROM news_articles
+                WHERE translated = 1
+                GROUP BY month
+            """).fetchall()
+
+            return {row[0]: (row[1], row[2], row[3]) for row in results if row[0]}
+
+    def get_articles_by_month(self, month: str) -> List[ArticleRow]:
+        """
+        获取指定月份（北京时间）的所有已翻译新闻
+
+        Args:
+            month: 月份（YYYY-MM）
+
+        Returns:
+            List[ArticleRow]: 新闻文章列表（只读模型，按发布时间倒序）
+        """
+        # 与 beijing_date 的月份范围一致，按 publish_ts 范围查询可以使用 idx_publish_ts
+        start_ts, end_ts = beijing_month_range(month)
+
+        with self:
+            results = self.cursor.execute("""
+                SELECT * FROM news_articles
+                WHERE publish_ts >= ? AND publish_ts < ?
+                AND translated = 1
+                ORDER BY publish_ts DESC
+            """, (start_ts, end_ts)).fetchall()
+
+            return [ArticleRow.from_row(row) for row in results]
 
     def get_stats(self) -> dict:
         """
         获取数据库统计信息
 
+        读取触发器维护的计数表，耗时与文章数量无关
+
         Returns:
             dict: 统计信息
         """
         with self:
-            # 总文章数
-            total = self.cursor.execute(
-                "SELECT COUNT(*) FROM news_articles"
-            ).fetchone()[0]
+            counters = self._read_stats_counters('news_articles')
+
+        return {
+            'total_articles': counters['total'].get('', 0),
+            'category_stats': counters['category'],
+            'language_stats': counters['language'],
+            'translated_count': counters['translated'].get('', 0),
+            'with_ai_comments': counters['ai_comment'].get('', 0)
+        }
 
-            # 按板块统计
-            category_stats = self.cursor.execute("""
-                SELECT category, COUNT(*) as count
-                FROM news_articles
-                GROUP BY category
-            """).fetchall()
+    def get_source_health(self, days: int = 7) -> dict:
+        """
+        统计各来源近期的健康度
 
-            # 按语言统计
-            language_stats = self.cursor.execute("""
-                SELECT language, COUNT(*) as count
-                FROM news_articles
-                GROUP BY language
-            """).fetchall()
+        健康度 = 最近 days 天中抓取到新文章的天数 / days（按抓取时间计，0-1）。
+        抓取失败或RSS停更的来源不会产生新文章，健康度随之下降。
 
-            # 已翻译数量
-            translated = self.cursor.execute(
-                "SELECT COUNT(*) FROM news_articles WHERE translated = 1"
-            ).fetchone()[0]
+        Args:
+            days: 统计天数，默认7天
 
-            # 已生成AI评论数量
-            with_comments = self.cursor.execute(
-                "SELECT COUNT(*) FROM news_articles WHERE ai_comment IS NOT NULL"
-            ).fetchone()[0]
+        Returns:
+            dict: {来源名称: 健康度}，统计期内没有新文章的来源不在结果中
+        """
+        if days <= 0:
+            return {}
 
-            return {
-                'total_articles': total,
-                'category_stats': {row[0]: row[1] for row in category_stats},
-                'language_stats': {row[0]: row[1] for row in language_stats},
-                'translated_count': translated,
-                'with_ai_comments': with_comments
-            }
+        with self:
+            cutoff_time = (get_utc_now() - timedelta(days=days)).isoformat()
+
+            rows = self.cursor.execute("""
+                SELECT source, COUNT(DISTINCT substr(crawl_time, 1, 10)) AS active_days
+                FROM news_articles
+                WHERE crawl_time >= ?
+                GROUP BY source
+            """, (cutoff_time,)).fetchall()
+
+            return {row[0]: min(row[1] / days, 1.0) for row in rows}
 
     def _row_to_article(self, row: sqlite3.Row) -> NewsArticle:
         """
@@ -482,6 +956,164 @@ class DatabaseManager:
 
         return article
 
+    # ========== 全文索引相关方法 ==========
+
+    def _create_fts_index(self):
+        """
+        创建FTS5全文索引（news_articles_fts）
+
+        - 外部内容表，数据仍只存一份在 news_articles
+        - 使用 trigram 分词器，中文和英文都可以按子串匹配（不区分大小写）
+        - 通过触发器与 news_articles 保持同步
+        - 当前SQLite不支持 trigram 时退回 unicode61；不支持FTS5时跳过
+        """
+        self.cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='news_articles_fts'
+        """)
+        if self.cursor.fetchone() is not None:
+            self.fts_enabled = True
+            self._upgrade_fts_update_trigger()
+            logger.debug("全文索引已存在")
+            return
+
+        columns = ", ".join(FTS_COLUMNS)
+
+        for tokenizer in ('trigram', 'unicode61'):
+            try:
+                self.cursor.execute(f"""
+                    CREATE VIRTUAL TABLE news_articles_fts USING fts5(
+                        {columns},
+                        content='news_articles',
+                        content_rowid='id',
+                        tokenize='{tokenizer}'
+                    )
+                """)
+                break
+            except sqlite3.OperationalError as e:
+                logger.warning(f"创建全文索引失败（tokenize={tokenizer}）: {e}")
+        else:
+            self.fts_enabled = False
+            logger.warning("当前SQLite不支持FTS5，关键词搜索将使用LIKE扫描")
+            return
+
+        new_values = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+        old_values = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+        self.cursor.execute(f"""
+            CREATE TRIGGER news_articles_fts_insert AFTER INSERT ON news_articles BEGIN
+                INSERT INTO news_articles_fts(rowid, {columns})
+                VALUES (new.id, {new_values});
+            END
+        """)
+
+        self.cursor.execute(f"""
+            CREATE TRIGGER news_articles_fts_delete AFTER DELETE ON news_articles BEGIN
+                INSERT INTO news_articles_fts(news_articles_fts, rowid, {columns})
+                VALUES ('delete', old.id, {old_values});
+            END
+        """)
+
+        self._create_fts_update_trigger()
+
+        # 为已有数据建立索引
+        self.cursor.execute("INSERT INTO news_articles_fts(news_articles_fts) VALUES ('rebuild')")
+
+        self.fts_enabled = True
+        logger.info(f"✓ 全文索引创建成功（tokenize={tokenizer}）")
+
+    def _create_fts_update_trigger(self):
+        """
+        创建全文索引的更新触发器
+
+        只在索引列变化时触发（UPDATE OF），更新 featured、url_canonical、publish_ts 等
+        其他列不会重写全文索引。
+        """
+        columns = ", ".join(FTS_COLUMNS)
+        new_values = ", ".join(f"new.{c}" for c in FTS_COLUMNS)
+        old_values = ", ".join(f"old.{c}" for c in FTS_COLUMNS)
+
+        self.cursor.execute(f"""
+            CREATE TRIGGER news_articles_fts_update AFTER UPDATE OF {columns} ON news_articles BEGIN
+                INSERT INTO news_articles_fts(news_articles_fts, rowid, {columns})
+                VALUES ('delete', old.id, {old_values});
+                INSERT INTO news_articles_fts(rowid, {columns})
+                VALUES (new.id, {new_values});
+            END
+        """)
+
+    def _upgrade_fts_update_trigger(self):
+        """旧版本的更新触发器对任何列的更新都会触发，替换为只监听索引列的版本"""
+        row = self.cursor.execute("""
+            SELECT sql FROM sqlite_master
+            WHERE type='trigger' AND name='news_articles_fts_update'
+        """).fetchone()
+        if row is not None and 'UPDATE OF' in row[0].upper():
+            return
+
+        self.cursor.execute("DROP TRIGGER IF EXISTS news_articles_fts_update")
+        self._create_fts_update_trigger()
+        logger.info("✓ 全文索引更新触发器已改为只监听索引列")
+
+    def search(self, query: str, days: Optional[int] = None, limit: int = 20) -> List[NewsArticle]:
+        """
+        关键词搜索新闻（标题、原标题、摘要、原文摘要、AI评论）
+
+        多个关键词以空格分隔，需全部命中。
+        3个字符及以上的关键词走FTS5全文索引；更短的关键词（如"降息"）
+        trigram 无法索引，改用 LIKE 在候选结果上过滤。
+
+        Args:
+            query: 搜索关键词
+            days: 只搜索最近N天（基于北京时间），None表示不限制
+            limit: 最多返回条数
+
+        Returns:
+            List[NewsArticle]: 匹配的新闻（全文索引命中时按相关度，否则按发布时间倒序）
+        """
+        terms = [term for term in query.split() if term]
+        if not terms:
+            return []
+
+        if self.fts_enabled is None:
+            self.init_database()
+
+        fts_terms = [t for t in terms if len(t) >= 3] if self.fts_enabled else []
+        like_terms = [t for t in terms if t not in fts_terms]
+
+        sql = "SELECT a.* FROM news_articles a"
+        params = []
+
+        if fts_terms:
+            # 每个关键词作为短语匹配（双引号转义）
+            match = " AND ".join('"' + t.replace('"', '""') + '"' for t in fts_terms)
+            sql += " JOIN news_articles_fts f ON f.rowid = a.id AND news_articles_fts MATCH ?"
+            params.append(match)
+
+        sql += " WHERE 1=1"
+
+        if days is not None:
+            sql += " AND a.publish_ts >= ?"
+            params.append(beijing_cutoff_ts(days))
+
+        for term in like_terms:
+            pattern = '%' + term.replace('\\', '\\\\').replace('%', '\\%').replace('_', '\\_') + '%'
+            conditions = " OR ".join(f"a.{c} LIKE ? ESCAPE '\\'" for c in FTS_COLUMNS)
+            sql += f" AND ({conditions})"
+            params.extend([pattern] * len(FTS_COLUMNS))
+
+        if fts_terms:
+            sql += " ORDER BY bm25(news_articles_fts), a.publish_ts DESC"
+        else:
+            sql += " ORDER BY a.publish_ts DESC"
+
+        sql += " LIMIT ?"
+        params.append(limit)
+
+        with self:
+            results = self.cursor.execute(sql, params).fetchall()
+            return [self._row_to_article(row) for row in results]
+
     # ========== 原始抓取数据临时表相关方法 ==========
 
     def _create_raw_articles_table(self):
@@ -585,28 +1217,35 @@ class DatabaseManager:
         Returns:
             List[dict]: 原始文章列表（字典格式）
         """
-        with self:
-            query = "SELECT * FROM raw_articles WHERE 1=1"
-            params = []
-
-            if category:
-                query += " AND category = ?"
-                params.append(category)
-
-            query += " ORDER BY crawl_time DESC"
-
-            if limit:
-                query += " LIMIT ?"
-                params.append(limit)
+        rows = self.iter_raw_articles(
+            category, batch_size=min(limit, ITER_BATCH_SIZE) if limit else ITER_BATCH_SIZE
+        )
+        return list(islice(rows, limit or None))
 
-            results = self.cursor.execute(query, params).fetchall()
+    def iter_raw_articles(
+        self,
+        category: Optional[str] = None,
+        batch_size: int = ITER_BATCH_SIZE
+    ) -> Iterator[dict]:
+        """
+        按抓取时间倒序流式读取临时表中的原始数据（内存占用与表大小无关）
 
-            # 转为字典列表
-            articles = []
-            for row in results:
-                articles.append(dict(row))
+        Args:
+            category: 板块筛选，None表示所有板块
+            batch_size: 每批读取的行数
 
-            return articles
+        Yields:
+            dict: 原始文章（字典格式）
+        """
+        conditions = []
+        params = []
+        if category:
+            conditions.append("category = ?")
+            params.append(category)
+
+        yield from self._iter_keyset(
+            "raw_articles", conditions, params, dict, batch_size, order_column='crawl_time'
+        )
 
     def get_raw_articles_count(self) -> int:
         """
@@ -632,35 +1271,38 @@ class DatabaseManager:
             deleted_count = self.cursor.rowcount
             logger.info(f"✓ 已清空临时表，删除了 {deleted_count} 条记录")
 
-    def delete_old_articles(self, days: int = 30) -> int:
+    def delete_old_articles(
+        self,
+        days: int = 30,
+        archive_dir: Optional[Path] = None,
+        vacuum_pages: Optional[int] = None
+    ) -> int:
         """
         删除超过指定天数的旧文章（基于北京时间）
 
+        分批删除，可选先写入按月归档，删除后增量回收空闲页，见 RetentionManager。
+
         Args:
             days: 保留最近几天的文章，默认30天
+            archive_dir: 归档目录，None 表示不归档
+            vacuum_pages: 最多回收的空闲页数，None 使用默认值，0 表示不回收
 
         Returns:
             int: 删除的文章数量
         """
-        from datetime import timedelta
-
-        # 基于北京时间计算"最近N天"，然后转回 UTC 用于数据库查询
-        # 这样无论在本地还是 GitHub Actions (UTC环境) 运行，结果都一致
-        from .config import Config
-        beijing_now = Config.get_beijing_time()
-        cutoff_beijing = beijing_now - timedelta(days=days)
-        cutoff_time = cutoff_beijing - timedelta(hours=8)  # 转回 UTC
+        from .retention import RetentionManager, VACUUM_PAGE_BUDGET
 
-        with self:
-            self.cursor.execute("""
-                DELETE FROM news_articles
-                WHERE publish_time < ?
-            """, (cutoff_time.isoformat(),))
-
-            deleted_count = self.cursor.rowcount
-            self.conn.commit()
+        retention = RetentionManager(
+            self,
+            archive_dir=archive_dir,
+            vacuum_pages=VACUUM_PAGE_BUDGET if vacuum_pages is None else vacuum_pages
+        )
+        result = retention.apply(days)
 
-            logger.info(f"✓ 删除了 {deleted_count} 条超过 {days} 天的旧文章")
+        deleted_count = result['deleted']
+        logger.info(f"✓ 删除了 {deleted_count} 条超过 {days} 天的旧文章")
+        if result['archived']:
+            logger.info(f"✓ 归档了 {result['archived']} 条到 {len(result['archive_files'])} 个文件")
 
         return deleted_count
 
@@ -668,42 +1310,142 @@ class DatabaseManager:
         """
         获取临时表的统计信息
 
+        读取触发器维护的计数表，耗时与记录数量无关
+
         Returns:
             dict: 统计信息
         """
         with self:
-            # 总记录数
-            total = self.cursor.execute(
-                "SELECT COUNT(*) FROM raw_articles"
-            ).fetchone()[0]
+            counters = self._read_stats_counters('raw_articles')
 
-            # 按板块统计
-            category_stats = self.cursor.execute("""
-                SELECT category, COUNT(*) as count
-                FROM raw_articles
-                GROUP BY category
-            """).fetchall()
+        return {
+            'total_articles': counters['total'].get('', 0),
+            'category_stats': counters['category'],
+            'source_stats': counters['source'],
+            'language_stats': counters['language']
+        }
 
-            # 按来源统计
-            source_stats = self.cursor.execute("""
-                SELECT source, COUNT(*) as count
-                FROM raw_articles
-                GROUP BY source
-            """).fetchall()
+    # ========== 统计计数表相关方法 ==========
 
-            # 按语言统计
-            language_stats = self.cursor.execute("""
-                SELECT language, COUNT(*) as count
-                FROM raw_articles
-                GROUP BY language
-            """).fetchall()
+    def _create_stats_counters(self):
+        """
+        创建统计计数表（stats_counters）
 
-            return {
-                'total_articles': total,
-                'category_stats': {row[0]: row[1] for row in category_stats},
-                'source_stats': {row[0]: row[1] for row in source_stats},
-                'language_stats': {row[0]: row[1] for row in language_stats}
-            }
+        - 每个 (表, 维度, 取值) 一行计数，维度见 STATS_DIMENSIONS
+        - 通过触发器在插入、删除和更新相关列时增减计数，读取统计只需查询这张小表
+        - 首次创建时用现有数据回填
+        """
+        self.cursor.execute("""
+            SELECT name FROM sqlite_master
+            WHERE type='table' AND name='stats_counters'
+        """)
+        if self.cursor.fetchone() is not None:
+            logger.debug("统计计数表已存在")
+            return
+
+        self.cursor.execute("""
+            CREATE TABLE stats_counters (
+                table_name TEXT NOT NULL,
+                dimension TEXT NOT NULL,
+                value TEXT NOT NULL,
+                count INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (table_name, dimension, value)
+            ) WITHOUT ROWID
+        """)
+
+        for table, dimensions in STATS_DIMENSIONS.items():
+            self._create_stats_triggers(table, dimensions)
+            self.rebuild_stats_counters(table)
+
+        logger.info("✓ 统计计数表创建成功")
+
+    def _create_stats_triggers(self, table: str, dimensions: tuple):
+        """
+        为表创建维护计数的触发器
+
+        Args:
+            table: 表名
+            dimensions: STATS_DIMENSIONS 中该表的维度
+        """
+        def increment(row):
+            return "".join(f"""
+                INSERT INTO stats_counters (table_name, dimension, value, count)
+                SELECT '{table}', '{dimension}', {expr.format(row=row)}, 1
+                WHERE {expr.format(row=row)} IS NOT NULL
+                ON CONFLICT (table_name, dimension, value) DO UPDATE SET count = count + 1;"""
+                for dimension, expr, _ in dimensions
+            )
+
+        def decrement(row):
+            return "".join(f"""
+                UPDATE stats_counters SET count = count - 1
+                WHERE table_name = '{table}' AND dimension = '{dimension}'
+                AND value = {expr.format(row=row)};"""
+                for dimension, expr, _ in dimensions
+            )
+
+        columns = ", ".join(column for _, _, column in dimensions if column)
+
+        self.cursor.execute(f"""
+            CREATE TRIGGER {table}_stats_insert AFTER INSERT ON {table} BEGIN
+                {increment('new')}
+            END
+        """)
+
+        self.cursor.execute(f"""
+            CREATE TRIGGER {table}_stats_delete AFTER DELETE ON {table} BEGIN
+                {decrement('old')}
+            END
+        """)
+
+        self.cursor.execute(f"""
+            CREATE TRIGGER {table}_stats_update AFTER UPDATE OF {columns} ON {table} BEGIN
+                {decrement('old')}
+                {increment('new')}
+            END
+        """)
+
+    def rebuild_stats_counters(self, table: str):
+        """
+        按表中现有数据重新计算计数（需要在连接内调用）
+
+        Args:
+            table: 表名（STATS_DIMENSIONS 中的键）
+        """
+        self.cursor.execute("DELETE FROM stats_counters WHERE table_name = ?", (table,))
+
+        for dimension, expr, _ in STATS_DIMENSIONS[table]:
+            value = expr.format(row=table)
+            self.cursor.execute(f"""
+                INSERT INTO stats_counters (table_name, dimension, value, count)
+                SELECT '{table}', '{dimension}', {value}, COUNT(*)
+                FROM {table}
+                WHERE {value} IS NOT NULL
+                GROUP BY {value}
+            """)
+
+    def _read_stats_counters(self, table: str) -> Dict[str, Dict[str, int]]:
+        """
+        读取表的所有计数（需要在连接内调用）
+
+        Args:
+            table: 表名（STATS_DIMENSIONS 中的键）
+
+        Returns:
+            Dict[str, Dict[str, int]]: {维度: {取值: 数量}}，数量为0的取值不在结果中
+        """
+        counters = {dimension: {} for dimension, _, _ in STATS_DIMENSIONS[table]}
+
+        rows = self.cursor.execute("""
+            SELECT dimension, value, count FROM stats_counters
+            WHERE table_name = ? AND count > 0
+            ORDER BY dimension, value
+        """, (table,)).fetchall()
+
+        for dimension, value, count in rows:
+            counters.setdefault(dimension, {})[value] = count
+
+        return counters
 
     # ========== 事务优化相关方法（v2.1新增）==========
 
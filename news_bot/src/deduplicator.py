@@ -2,11 +2,19 @@
 新闻去重模块
 
 实现板块内去重和跨板块去重逻辑，确保每个板块都有足够的新闻。
+另提供基于 MinHash + LSH 的近似重复检测，合并不同媒体对同一事件的报道；
+以及基于字符 n-gram 的跨语言重复检测（英文新闻译名 vs 中文原生新闻）。
 """
 
+import hashlib
 import logging
+import random
+import re
+from functools import lru_cache
 from typing import Dict, List, Tuple
 
+from .url_utils import canonicalize_url
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,7 +75,7 @@ def cross_category_deduplicate(
     跨板块全局去重（核心改进 ⭐）
 
     规则：
-    1. 基于 title_original + url 判断是否为同一条新闻
+    1. 基于 title_original + 规范化url 判断是否为同一条新闻
     2. 保留第一次出现的板块
     3. 删除后续板块中的重复
 
@@ -99,11 +107,12 @@ def cross_category_deduplicate(
         articles = grouped_articles.get(category, [])
 
         for article in articles:
-            # 构建唯一键
+            # 构建唯一键（URL使用规范化形式，忽略跟踪参数等差异）
+            url_key = canonicalize_url(article.get('url')) or article.get('url', '')
             if article.get('language') == 'en':
-                key = (article.get('title_original', ''), article.get('url', ''))
+                key = (article.get('title_original', ''), url_key)
             else:
-                key = (article.get('title', ''), article.get('url', ''))
+                key = (article.get('title', ''), url_key)
 
             # 检查是否已存在
             if key not in seen:
@@ -143,7 +152,7 @@ def fill_top_10(
         填充后的分组新闻
     """
     # 延迟导入避免循环依赖
-    from news_bot.src.scorer import calculate_priority_score
+    from news_bot.src.scorer import score_batch
 
     final = {}
 
@@ -160,14 +169,11 @@ def fill_top_10(
             needed = top_n - len(articles)
             logger.info(f"{category}: 只有{len(articles)}条，从候补中补齐{needed}条")
 
-            # 从候补新闻中选择评分最高的
+            # 从候补新闻中选择评分最高的（复用缓存的命中统计）
             if backup:
-                backup_sorted = sorted(
-                    backup,
-                    key=lambda x: calculate_priority_score(x),
-                    reverse=True
-                )
-                articles.extend(backup_sorted[:needed])
+                scores = score_batch(backup).tolist()
+                order = sorted(range(len(backup)), key=lambda i: scores[i], reverse=True)
+                articles.extend(backup[i] for i in order[:needed])
 
             final[category] = articles
 
@@ -183,11 +189,11 @@ def remove_duplicates_by_url(
     """
     基于URL去重（简单版本）
 
-    用于快速过滤明显的重复新闻。
+    用于快速过滤明显的重复新闻。URL先经过规范化（去掉跟踪参数、AMP标记、跳转包装等）。
 
     Args:
         articles: 新闻列表
-        seen_urls: 已见过的URL集合
+        seen_urls: 已见过的规范化URL集合
 
     Returns:
         (去重后的新闻, 更新后的URL集合)
@@ -198,7 +204,7 @@ def remove_duplicates_by_url(
     unique_articles = []
 
     for article in articles:
-        url = article.get('url', '')
+        url = canonicalize_url(article.get('url')) or article.get('url', '')
         if url and url not in seen_urls:
             seen_urls.add(url)
             unique_articles.append(article)
@@ -209,6 +215,361 @@ def remove_duplicates_by_url(
     return unique_articles, seen_urls
 
 
+# ========== 近似重复检测（MinHash + LSH）==========
+
+MINHASH_NUM_PERM = 128          # MinHash 签名长度（分段数 × 每段行数 <= 签名长度）
+NEAR_DUP_THRESHOLD = 0.3        # 估计 Jaccard 相似度阈值
+LSH_RECALL = 0.95               # 相似度恰好等于阈值的两条新闻成为候选对的最低概率
+
+# 不同媒体对同一事件的报道，标题措辞不同、摘要差异更大（如 CNBC、MarketWatch、彭博社的同一条美联储新闻，
+# 标题+摘要的词二元组 Jaccard 只有 0.1~0.4）。因此只比较标题：
+# 英文按单词（去掉停用词），中文按相邻两个字，标题相同的词越多越相似。
+_NEAR_DUP_TOKEN_RE = re.compile(r'[\u3400-\u9fff\uf900-\ufaff]+|[0-9a-z]+(?:\.[0-9]+)?%?')
+_CJK_RE = re.compile(r'[\u3400-\u9fff\uf900-\ufaff]')
+_NEAR_DUP_STOP_WORDS = frozenset(
+    'a an and are as at be by for from has have in is it its of on or says still '
+    'than that the this to was were will with'.split()
+)
+
+# 每个置换用 (a * h + b) mod p 近似（p 为梅森素数 2^61-1），固定种子保证每次运行结果一致。
+# 不能用异或随机掩码代替：异或不满足最小值独立性，相似度估计会明显偏高。
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(20260126)
+_PERMUTATIONS = [
+    (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+    for _ in range(MINHASH_NUM_PERM)
+]
+
+
+@lru_cache(maxsize=None)
+def lsh_params(threshold: float, num_perm: int = MINHASH_NUM_PERM) -> Tuple[int, int]:
+    """
+    根据相似度阈值选择 LSH 的分段数和每段行数
+
+    相似度为 s 的两条新闻成为候选对的概率是 1 - (1 - s^rows)^bands。
+    在阈值处的概率不低于 LSH_RECALL 的前提下取最大的行数（候选对最少），
+    低于阈值的候选对随后由签名估计的相似度排除。
+
+    Args:
+        threshold: 相似度阈值（0-1）
+        num_perm: 签名长度
+
+    Returns:
+        (分段数, 每段行数)
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        bands = num_perm // rows
+        if 1 - (1 - threshold ** rows) ** bands < LSH_RECALL:
+            break
+        best = (bands, rows)
+    return best
+
+
+def _near_dup_title(article: dict) -> str:
+    """取用于近似去重的标题（英文新闻使用原文标题）"""
+    if article.get('language') == 'en':
+        title = article.get('title_original') or article.get('title') or ''
+    else:
+        title = article.get('title') or ''
+    return title.lower()
+
+
+def _shingles(title: str) -> set:
+    """将标题切分为英文单词（去掉停用词）和中文相邻字对，并哈希为64位整数"""
+    grams = set()
+    for token in _NEAR_DUP_TOKEN_RE.findall(title):
+        if _CJK_RE.match(token):
+            grams.update(token[i:i + 2] for i in range(max(len(token) - 1, 1)))
+        elif token not in _NEAR_DUP_STOP_WORDS:
+            grams.add(token)
+
+    return {
+        int.from_bytes(hashlib.blake2b(g.encode('utf-8'), digest_size=8).digest(), 'big')
+        for g in grams
+    }
+
+
+def minhash_signature(shingles: set) -> tuple:
+    """
+    计算 MinHash 签名
+
+    每个置换对所有哈希值计算 (a * h + b) mod p，取最小值。
+
+    Args:
+        shingles: 哈希后的标题词集合
+
+    Returns:
+        tuple: 长度为 MINHASH_NUM_PERM 的签名；shingles 为空时返回 None
+    """
+    if not shingles:
+        return None
+
+    prime = _MERSENNE_PRIME
+    return tuple(min((a * h + b) % prime for h in shingles) for a, b in _PERMUTATIONS)
+
+
+def estimate_similarity(sig1: tuple, sig2: tuple) -> float:
+    """根据两个 MinHash 签名估计 Jaccard 相似度"""
+    same = sum(1 for x, y in zip(sig1, sig2) if x == y)
+    return same / len(sig1)
+
+
+def cluster_near_duplicates(
+    articles: List[dict],
+    threshold: float = NEAR_DUP_THRESHOLD
+) -> List[List[dict]]:
+    """
+    将近似重复的新闻聚类（MinHash + LSH 分段）
+
+    流程：
+    1. 每条新闻的标题切分为词（见 _shingles），计算 MinHash 签名
+    2. 签名按段分桶（分段数和行数由 threshold 决定，见 lsh_params），同一桶内的新闻成为候选对
+    3. 候选对估计相似度 >= threshold 时合并到同一簇（并查集）
+
+    分桶是线性的；候选对的数量取决于阈值，阈值越低，需要逐对估计相似度的无关新闻越多。
+    没有可切分文本的新闻（标题为空或只有符号）没有签名，不参与分桶，各自单独成簇。
+
+    Args:
+        articles: 新闻列表
+        threshold: 相似度阈值（0-1）
+
+    Returns:
+        List[List[dict]]: 簇列表（包含单条新闻的簇），簇内和簇间保持原始顺序
+    """
+    signatures = [minhash_signature(_shingles(_near_dup_title(a))) for a in articles]
+
+    # 并查集
+    parent = list(range(len(articles)))
+
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    bands, rows = lsh_params(threshold)
+    checked = set()
+
+    for band in range(bands):
+        buckets = {}
+        for idx, sig in enumerate(signatures):
+            if sig is None:
+                continue
+            key = sig[band * rows:(band + 1) * rows]
+            buckets.setdefault(key, []).append(idx)
+
+        for members in buckets.values():
+            if len(members) < 2:
+                continue
+            for pos, i in enumerate(members):
+                for j in members[pos + 1:]:
+                    if (i, j) in checked or find(i) == find(j):
+                        continue
+                    checked.add((i, j))
+                    if estimate_similarity(signatures[i], signatures[j]) >= threshold:
+                        parent[find(j)] = find(i)
+
+    clusters = {}
+    for idx, article in enumerate(articles):
+        clusters.setdefault(find(idx), []).append(article)
+
+    return list(clusters.values())
+
+
+def _pick_representative(cluster: List[dict]) -> dict:
+    """选择簇代表：优先级得分 > 摘要长度 > 抓取时间"""
+    from news_bot.src.scorer import score_batch
+
+    scores = score_batch(cluster).tolist()
+
+    def key(i):
+        article = cluster[i]
+        summary = article.get('content_original') or article.get('content') or ''
+        return (scores[i], len(summary), article.get('crawl_time') or '')
+
+    return cluster[max(range(len(cluster)), key=key)]
+
+
+def deduplicate_near_duplicates(
+    articles: List[dict],
+    threshold: float = NEAR_DUP_THRESHOLD
+) -> Tuple[List[dict], List[List[dict]]]:
+    """
+    近似去重：每个近似重复簇只保留最佳代表
+
+    同一事件被多家媒体报道时（如 CNBC、MarketWatch、彭博社的同一条美联储新闻），
+    标题用词大量重合但不完全相同，精确去重无法识别。
+
+    保留的代表新闻会带上 '_near_duplicates' 字段，记录被合并的其他成员。
+
+    Args:
+        articles: 新闻列表
+        threshold: 相似度阈值（0-1）
+
+    Returns:
+        (去重后的新闻列表, 成员数大于1的簇列表)
+    """
+    if not articles:
+        return [], []
+
+    kept = []
+    duplicate_clusters = []
+
+    for cluster in cluster_near_duplicates(articles, threshold):
+        if len(cluster) == 1:
+            kept.append(cluster[0])
+            continue
+
+        best = _pick_representative(cluster)
+        best['_near_duplicates'] = [a for a in cluster if a is not best]
+        kept.append(best)
+        duplicate_clusters.append(cluster)
+
+        title_preview = (best.get('title') or best.get('title_original') or '')[:50]
+        logger.info(f"近似去重: {title_preview} (合并 {len(cluster) - 1} 条相似新闻)")
+
+    return kept, duplicate_clusters
+
+
+# ========== 跨语言重复检测（中文 vs 英文）==========
+
+CROSS_LANG_THRESHOLD = 0.4      # 标题字符二元组 Dice 相似度阈值
+TITLE_NGRAM_SIZE = 2
+
+# 标题归一化：只保留中文字符和英文/数字
+_TITLE_CHAR_RE = re.compile(r'[\u3400-\u9fff\uf900-\ufaff0-9a-z]')
+
+
+def _article_field(article, name: str):
+    """读取文章字段（兼容 dict 和 NewsArticle）"""
+    if isinstance(article, dict):
+        return article.get(name)
+    return getattr(article, name, None)
+
+
+def title_ngrams(title: str, size: int = TITLE_NGRAM_SIZE) -> set:
+    """
+    将标题切分为字符 n-gram 集合（忽略标点和空白）
+
+    Args:
+        title: 标题
+        size: n-gram 长度
+
+    Returns:
+        set: n-gram 集合
+    """
+    chars = ''.join(_TITLE_CHAR_RE.findall((title or '').lower()))
+    if len(chars) < size:
+        return {chars} if chars else set()
+    return {chars[i:i + size] for i in range(len(chars) - size + 1)}
+
+
+class CharNgramIndex:
+    """
+    字符 n-gram 倒排索引
+
+    按 n-gram 记录包含它的文档，查询时只统计共享 n-gram 的文档，
+    按 Dice 系数 2|A∩B| / (|A|+|B|) 计算相似度。
+    """
+
+    def __init__(self, size: int = TITLE_NGRAM_SIZE):
+        self.size = size
+        self.postings = {}   # {ngram: [doc_id, ...]}
+        self.sizes = {}      # {doc_id: ngram数量}
+
+    def add(self, doc_id, text: str):
+        """添加文档"""
+        grams = title_ngrams(text, self.size)
+        if not grams:
+            return
+        self.sizes[doc_id] = len(grams)
+        for gram in grams:
+            self.postings.setdefault(gram, []).append(doc_id)
+
+    def query(self, text: str, threshold: float) -> List[Tuple[object, float]]:
+        """
+        查找相似文档
+
+        Args:
+            text: 查询文本
+            threshold: 相似度阈值（0-1）
+
+        Returns:
+            List[(doc_id, 相似度)]: 按相似度降序
+        """
+        grams = title_ngrams(text, self.size)
+        if not grams:
+            return []
+
+        overlaps = {}
+        for gram in grams:
+            for doc_id in self.postings.get(gram, ()):
+                overlaps[doc_id] = overlaps.get(doc_id, 0) + 1
+
+        results = []
+        for doc_id, overlap in overlaps.items():
+            score = 2 * overlap / (len(grams) + self.sizes[doc_id])
+            if score >= threshold:
+                results.append((doc_id, score))
+
+        results.sort(key=lambda x: x[1], reverse=True)
+        return results
+
+
+def deduplicate_cross_language(
+    articles: list,
+    threshold: float = CROSS_LANG_THRESHOLD
+) -> Tuple[list, List[tuple]]:
+    """
+    跨语言去重：英文新闻的中文译名与中文原生新闻标题相似时，视为同一事件
+
+    例如财新与路透社对同一事件的报道，原文标题语言不同，精确去重无法识别。
+    保留中文原生新闻，去掉对应的英文新闻，应在生成AI评论之前调用，避免重复调用API。
+    未翻译的英文新闻（没有中文标题）不参与比较。
+
+    Args:
+        articles: 新闻列表（dict 或 NewsArticle，需已完成翻译）
+        threshold: 标题字符二元组 Dice 相似度阈值（0-1）
+
+    Returns:
+        (去重后的新闻列表, 重复对列表 [(英文新闻, 中文新闻, 相似度)])
+    """
+    index = CharNgramIndex()
+    for idx, article in enumerate(articles):
+        if _article_field(article, 'language') == 'zh':
+            index.add(idx, _article_field(article, 'title'))
+
+    if not index.sizes:
+        return list(articles), []
+
+    kept = []
+    duplicates = []
+
+    for article in articles:
+        title = _article_field(article, 'title')
+        is_translated = (
+            _article_field(article, 'language') == 'en'
+            and title
+            and title != _article_field(article, 'title_original')
+        )
+
+        matches = index.query(title, threshold) if is_translated else []
+        if not matches:
+            kept.append(article)
+            continue
+
+        native_idx, score = matches[0]
+        native = articles[native_idx]
+        duplicates.append((article, native, score))
+        logger.info(
+            f"跨语言去重: {(_article_field(article, 'title_original') or '')[:50]} "
+            f"≈ {(_article_field(native, 'title') or '')[:50]} (相似度 {score:.2f})"
+        )
+
+    return kept, duplicates
+
+
 # 测试代码
 if __name__ == "__main__":
     # 模拟数据
@@ -301,3 +662,100 @@ if __name__ == "__main__":
     filled = fill_top_10(deduped, backup, top_n=10)
     for category, articles in filled.items():
         print(f"  {category}: {len(articles)}条")
+
+    # 测试近似去重：同一条美联储新闻被三家媒体以不同措辞报道，另有同主题但不同事件的新闻
+    print("\n测试近似去重:")
+    near_dup_articles = [
+        {
+            'source': 'CNBC',
+            'title_original': 'Fed holds rates steady, still forecasts two cuts this year',
+            'content_original': 'The Federal Reserve on Wednesday held its benchmark interest rate steady in a range '
+                                'between 4.25% and 4.5% and indicated that two cuts are still likely this year.',
+            'language': 'en',
+            'crawl_time': '2026-01-26 18:00:00'
+        },
+        {
+            'source': 'MarketWatch',
+            'title_original': 'Fed leaves interest rates unchanged, still sees two cuts in 2025',
+            'content_original': 'The Federal Reserve left its benchmark interest rate unchanged on Wednesday, and '
+                                'officials continued to pencil in two rate cuts this year despite tariff uncertainty.',
+            'language': 'en',
+            'crawl_time': '2026-01-26 18:05:00'
+        },
+        {
+            'source': '彭博社',
+            'title_original': 'Fed Holds Rates Steady, Still Sees Two Cuts This Year Despite Tariff Risks',
+            'content_original': 'Federal Reserve officials left interest rates unchanged and continued to project two '
+                                'reductions in borrowing costs this year, while signaling concern about tariffs.',
+            'language': 'en',
+            'crawl_time': '2026-01-26 18:10:00'
+        },
+        {
+            'source': 'CNBC',
+            'title_original': 'ECB holds rates steady as euro-zone inflation eases toward target',
+            'content_original': 'The European Central Bank kept its deposit rate unchanged on Thursday.',
+            'language': 'en',
+            'crawl_time': '2026-01-26 18:15:00'
+        },
+        {
+            'source': 'MarketWatch',
+            'title_original': 'Bank of England holds rates, signals cuts ahead as economy slows',
+            'content_original': 'The Bank of England left interest rates unchanged on Thursday.',
+            'language': 'en',
+            'crawl_time': '2026-01-26 18:20:00'
+        },
+        {
+            'source': '彭博社',
+            'title_original': 'Fed minutes show officials divided over timing of rate cuts',
+            'content_original': "Minutes of the Federal Reserve's latest meeting showed policymakers split on timing.",
+            'language': 'en',
+            'crawl_time': '2026-01-26 18:25:00'
+        },
+        {
+            'source': '新华社',
+            'title': '美联储维持利率不变 预计年内降息两次',
+            'content': '美联储宣布将联邦基金利率目标区间维持在4.25%至4.5%之间。',
+            'language': 'zh',
+            'crawl_time': '2026-01-26 18:30:00'
+        },
+        {
+            'source': '财新',
+            'title': '美联储按兵不动，仍预计年内降息两次',
+            'content': '美联储连续第四次会议维持利率不变。',
+            'language': 'zh',
+            'crawl_time': '2026-01-26 18:35:00'
+        },
+    ]
+    bands, rows = lsh_params(NEAR_DUP_THRESHOLD)
+    print(f"  阈值 {NEAR_DUP_THRESHOLD}: {bands} 段 x {rows} 行")
+    for cluster in cluster_near_duplicates(near_dup_articles):
+        print(f"  簇({len(cluster)}): " + " | ".join(
+            f"{a['source']}: {a.get('title_original') or a.get('title')}" for a in cluster
+        ))
+    kept, clusters = deduplicate_near_duplicates(near_dup_articles)
+    print(f"  去重前: {len(near_dup_articles)}条, 去重后: {len(kept)}条, 重复簇: {len(clusters)}个"
+          f"（应为 5 条、2 个：美联储英文报道 3 合 1，中文报道 2 合 1）")
+
+    # 测试跨语言去重
+    print("\n测试跨语言去重:")
+    cross_lang_articles = [
+        {
+            'title': '中国央行下调存款准备金率0.5个百分点',
+            'language': 'zh',
+            'source': '财新'
+        },
+        {
+            'title': '中国央行下调存款准备金率50个基点',
+            'title_original': 'China central bank cuts reserve requirement ratio by 50 basis points',
+            'language': 'en',
+            'source': 'Reuters'
+        },
+        {
+            'title': '日本央行维持利率不变',
+            'title_original': 'BOJ Keeps Rate Unchanged',
+            'language': 'en',
+            'source': 'Reuters'
+        },
+    ]
+    kept, pairs = deduplicate_cross_language(cross_lang_articles)
+    print(f"  去重前: {len(cross_lang_articles)}条, 去重后: {len(kept)}条, 重复对: {len(pairs)}个")
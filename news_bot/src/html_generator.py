@@ -1,15 +1,18 @@
 """HTML生成器"""
 
 from jinja2 import Environment, FileSystemLoader
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List
+from typing import List, Tuple
 from loguru import logger
+import json
 import re
 
 from .models import NewsArticle, Category
 from .config import Config
 from .database import utc_to_beijing
+from .page_manifest import PageWriter, extract_page_title, default_page_title, update_manifest
 
 
 def simple_markdown(text):
@@ -98,6 +101,107 @@ def format_beijing_iso(utc_dt: datetime) -> str:
     return beijing_dt.isoformat()
 
 
+# 流式渲染时每次合并写入的模板片段数
+STREAM_BUFFER_SIZE = 64
+
+# 日报模板实际用到的文章字段（跨进程传递时只序列化这些字段）
+PAGE_ARTICLE_FIELDS = ('title', 'title_original', 'content', 'source', 'url', 'publish_time')
+
+
+def serialize_page_articles(articles: list) -> str:
+    """
+    将文章列表压缩为紧凑的JSON字符串（用于多进程渲染）
+
+    只保留模板需要的字段，按 PAGE_ARTICLE_FIELDS 顺序存为数组，
+    避免把完整的 pydantic 对象 pickle 到子进程。
+
+    Args:
+        articles: 文章列表（NewsArticle 或具有相同属性的对象）
+
+    Returns:
+        str: JSON字符串
+    """
+    rows = []
+    for article in articles:
+        publish_time = article.publish_time
+        rows.append([
+            article.title,
+            article.title_original,
+            article.content,
+            article.source,
+            article.url,
+            publish_time.isoformat() if publish_time else None,
+        ])
+    return json.dumps(rows, ensure_ascii=False, separators=(',', ':'))
+
+
+def deserialize_page_articles(payload: str) -> List[dict]:
+    """
+    还原 serialize_page_articles 生成的文章列表
+
+    Args:
+        payload: JSON字符串
+
+    Returns:
+        List[dict]: 文章字典列表（模板可直接按属性访问）
+    """
+    articles = []
+    for row in json.loads(payload):
+        article = dict(zip(PAGE_ARTICLE_FIELDS, row))
+        if article['publish_time']:
+            article['publish_time'] = datetime.fromisoformat(article['publish_time'])
+        articles.append(article)
+    return articles
+
+
+def _render_pages_worker(jobs: List[Tuple[str, str, str]]) -> List[dict]:
+    """
+    子进程渲染入口：依次渲染分配到的日期页面
+
+    Args:
+        jobs: [(date_str, output_path, payload), ...]
+
+    Returns:
+        List[dict]: 已生成页面的清单条目
+    """
+    generator = HTMLGenerator()
+    entries = []
+    for date_str, output_path, payload in jobs:
+        articles = deserialize_page_articles(payload)
+        entries.append(generator.render_page(date_str, articles, output_path))
+    return entries
+
+
+def render_pages_parallel(pages: List[Tuple[str, Path, list]], workers: int) -> List[dict]:
+    """
+    使用进程池并行渲染多个日期页面
+
+    日期按轮询方式分配给各个进程，每个进程只创建一次模板环境。
+    输出与串行渲染逐字节一致。
+
+    Args:
+        pages: [(date_str, output_path, articles), ...]，articles 已排好序
+        workers: 进程数
+
+    Returns:
+        List[dict]: 已生成页面的清单条目
+    """
+    jobs = [
+        (date_str, str(output_path), serialize_page_articles(articles))
+        for date_str, output_path, articles in pages
+    ]
+    workers = max(1, min(workers, len(jobs)))
+    partitions = [jobs[i::workers] for i in range(workers)]
+
+    entries = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for generated in executor.map(_render_pages_worker, partitions):
+            logger.debug(f"子进程完成 {len(generated)} 个页面")
+            entries.extend(generated)
+
+    return entries
+
+
 class HTMLGenerator:
     """HTML生成器"""
 
@@ -123,24 +227,53 @@ class HTMLGenerator:
         if not output_path:
             output_path = Config.OUTPUT_DIR / filename
 
-        # 加载模板（使用现代化模板）
+        entry = self.render_page(date_str, articles, output_path, template_name)
+        output_path = Path(output_path)
+        update_manifest(output_path.parent, [entry])
+
+        logger.info(f"HTML已生成: {output_path}")
+        logger.info(f"  总文章数: {len(articles)}")
+
+        return output_path
+
+    def render_page(self, date_str: str, articles: list, output_path, template_name: str = 'daily_news.html') -> dict:
+        """
+        渲染指定日期的页面并写入文件
+
+        写入时同步计算页面哈希、大小和标题，供页面清单使用。
+
+        Args:
+            date_str: 页面日期（YYYY-MM-DD）
+            articles: 已排好序的文章列表
+            output_path: 输出文件路径
+            template_name: 模板名称
+
+        Returns:
+            dict: 页面清单条目（date/url/title/article_count/sha256/size）
+        """
         template = self.env.get_template(template_name)
 
-        # 渲染 - 使用单一articles列表
-        html = template.render(
+        # 流式渲染 - 模板片段边生成边写入文件，不在内存中拼接整页字符串
+        stream = template.stream(
             date=date_str,
             articles=articles,
             total_articles=len(articles)
         )
+        stream.enable_buffering(size=STREAM_BUFFER_SIZE)
 
         # 保存
         output_path = Path(output_path)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(html)
-
-        logger.info(f"HTML已生成: {output_path}")
-        logger.info(f"  总文章数: {len(articles)}")
-
-        return output_path
+        with open(output_path, 'wb') as f:
+            writer = PageWriter(f)
+            stream.dump(writer)
+
+        return {
+            'date': date_str,
+            'url': output_path.name,
+            'title': extract_page_title(writer.head) or default_page_title(date_str),
+            'article_count': len(articles),
+            'sha256': writer.sha256,
+            'size': writer.size
+        }
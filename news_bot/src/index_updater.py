@@ -2,14 +2,15 @@
 自动更新首页index.html
 
 功能：
-1. 扫描public/目录下的所有HTML文件
+1. 读取public/manifest.json页面清单
 2. 过滤出过去30天的新闻
 3. 按日期倒序排列
-4. 自动生成新闻卡片列表
+4. 生成public/days.json，首页运行时加载并渲染新闻卡片
+5. 生成public/archive/按月分片，首页通过 ?month=YYYY-MM 分页浏览更早的历史
 """
 
+import json
 import os
-import re
 from datetime import datetime, timedelta
 from pathlib import Path
 from loguru import logger
@@ -18,6 +19,45 @@ import sys
 # 添加src目录到Python路径
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from src.config import Config
+from src.page_manifest import PageManifest
+
+
+DAYS_JSON_FILENAME = "days.json"
+DAYS_JSON_VERSION = 1
+ARCHIVE_VERSION = 1
+
+
+def _serialize_json(data: dict) -> bytes:
+    """紧凑JSON序列化（保留中文）"""
+    return json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def _write_bytes(path: Path, content: bytes):
+    """写入文件（先写临时文件再替换，避免写到一半被读取）"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + '.tmp')
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+
+
+def _write_json(path: Path, data: dict):
+    """写入JSON文件"""
+    _write_bytes(path, _serialize_json(data))
+
+
+def _write_json_if_changed(path: Path, data: dict) -> bool:
+    """
+    内容变化时才写入JSON文件
+
+    Returns:
+        bool: 是否写入
+    """
+    content = _serialize_json(data)
+    if path.exists() and path.read_bytes() == content:
+        return False
+
+    _write_bytes(path, content)
+    return True
 
 
 class IndexUpdater:
@@ -30,11 +70,16 @@ class IndexUpdater:
         self.project_root = project_root
         self.public_dir = project_root / "public"
         self.index_file = project_root / "public" / "index.html"
+        self.days_file = project_root / "public" / DAYS_JSON_FILENAME
+        self.archive_dir = project_root / "public" / "archive"
 
     def get_news_files(self, days: int = 30) -> list:
         """
         获取过去N天的新闻文件
 
+        只读取页面清单（public/manifest.json），不再打开每个HTML文件。
+        清单不存在时（如旧版本生成的目录）会扫描一次HTML文件重建清单。
+
         Args:
             days: 保留的天数，默认30天
 
@@ -48,92 +93,51 @@ class IndexUpdater:
             logger.warning(f"public目录不存在: {self.public_dir}")
             return news_files
 
-        # 扫描所有HTML文件
-        for file_path in self.public_dir.glob("*.html"):
-            # 提取日期（文件名格式：YYYY-MM-DD.html）
-            match = re.match(r'(\d{4}-\d{2}-\d{2})\.html', file_path.name)
-            if not match:
-                continue
-
-            date_str = match.group(1)
-            try:
-                file_date = datetime.strptime(date_str, "%Y-%m-%d")
-
-                # 检查是否在指定天数内（使用北京时间）
-                cutoff_date = Config.get_beijing_time() - timedelta(days=days)
-                if file_date >= cutoff_date:
-                    # 读取标题
-                    title = self._extract_title(file_path)
-
-                    # 提取新闻数量
-                    article_count = self._extract_article_count(file_path)
+        manifest = self._load_manifest()
 
-                    news_files.append({
-                        'date': date_str,
-                        'file_date': file_date,
-                        'url': file_path.name,  # 相对于public/index.html的路径
-                        'title': title,
-                        'article_count': article_count
-                    })
+        # 检查是否在指定天数内（使用北京时间）
+        cutoff_date = Config.get_beijing_time() - timedelta(days=days)
 
+        for entry in manifest.entries():
+            try:
+                file_date = datetime.strptime(entry['date'], "%Y-%m-%d")
             except ValueError as e:
-                logger.warning(f"日期解析失败: {file_path.name}, {e}")
+                logger.warning(f"日期解析失败: {entry['date']}, {e}")
                 continue
 
-        # 按日期倒序排列
-        news_files.sort(key=lambda x: x['file_date'], reverse=True)
+            if file_date >= cutoff_date:
+                news_files.append({
+                    'date': entry['date'],
+                    'file_date': file_date,
+                    'url': entry['url'],  # 相对于public/index.html的路径
+                    'title': entry['title'],
+                    'article_count': entry['article_count']
+                })
 
+        # 清单条目已按日期倒序排列
         return news_files
 
-    def _extract_title(self, file_path: Path) -> str:
-        """从HTML文件中提取标题"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-                # 尝试提取<h1>或<h2>标签内容
-                h1_match = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.DOTALL)
-                if h1_match:
-                    title = h1_match.group(1).strip()
-                    # 移除HTML标签
-                    title = re.sub(r'<[^>]+>', '', title)
-                    if len(title) > 10:
-                        return title[:100]  # 限制长度
-
-                # 提取<title>标签
-                title_match = re.search(r'<title>(.*?)</title>', content)
-                if title_match:
-                    title = title_match.group(1).strip()
-                    if len(title) > 10:
-                        return title[:100]
-
-        except Exception as e:
-            logger.warning(f"读取标题失败: {file_path.name}, {e}")
-
-        # 默认标题
-        return f"财经日报 - {file_path.stem}"
-
-    def _extract_article_count(self, file_path: Path) -> int:
-        """从HTML文件中提取新闻数量"""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-                # 统计 <article class="news-card ..."> 的数量
-                article_count = len(re.findall(r'<article[^>]*class="[^"]*news-card', content))
-
-                if article_count > 0:
-                    return article_count
-
-        except Exception as e:
-            logger.warning(f"读取新闻数量失败: {file_path.name}, {e}")
-
-        # 如果无法提取，返回0
-        return 0
+    def _load_manifest(self) -> PageManifest:
+        """读取页面清单，不存在时从现有HTML文件重建；移除文件已不存在的页面"""
+        manifest = PageManifest(self.public_dir)
+        if not manifest.load():
+            logger.info(f"页面清单不存在，从现有HTML文件重建: {manifest.path}")
+            manifest.rebuild()
+            manifest.prune()
+            manifest.save()
+            logger.info(f"✓ 页面清单已重建: {len(manifest.pages)} 个页面")
+        elif manifest.prune():
+            manifest.save()
+        return manifest
 
     def update_index(self, days: int = 30) -> bool:
         """
-        更新index.html
+        更新首页数据
+
+        首页本身是静态页面（从 index_modern.html 复制），运行时加载 days.json。
+        每次更新只重写 days.json；index.html 仅在缺失或模板变化时写入。
+        只要有任何页面（包括只在按月归档中的历史页面）就会写入 index.html，
+        否则最近没有新闻时站点没有首页，归档也无法访问。
 
         Args:
             days: 保留的天数，默认30天
@@ -147,94 +151,114 @@ class IndexUpdater:
             # 获取新闻文件列表
             news_files = self.get_news_files(days)
 
-            if not news_files:
-                logger.warning("没有找到符合条件的新闻文件")
-                return False
-
-            logger.info(f"找到{len(news_files)}个新闻文件")
+            # 更新按月归档
+            self.update_archive()
 
-            # 生成JavaScript数组
-            news_list_js = self._generate_news_list_js(news_files)
-
-            # 读取index.html模板，如果不存在则创建默认模板
-            if not self.index_file.exists():
-                logger.warning(f"index.html不存在，创建默认模板: {self.index_file}")
-                self._create_default_index()
-                # 创建后继续执行，填充新闻数据
-
-            with open(self.index_file, 'r', encoding='utf-8') as f:
-                content = f.read()
-
-            # 替换更新时间为北京时间
-            beijing_time = Config.get_beijing_time()
-            formatted_time = beijing_time.strftime("%Y-%m-%d %H:%M")
-            content = content.replace('{{ last_update_time }}', formatted_time)
-
-            # 替换newsList数组
-            pattern = r'const newsList = \[.*?\];'
-            replacement = f'const newsList = [\n{news_list_js}\n        ];'
+            if not news_files and not self._load_manifest().pages:
+                logger.warning("没有找到任何新闻页面")
+                return False
 
-            new_content = re.sub(pattern, replacement, content, flags=re.DOTALL)
+            # 确保 index.html 与模板一致（最近没有新闻时首页为空，仍可通过按月归档浏览历史）
+            self._ensure_index()
 
-            # 写回文件
-            with open(self.index_file, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            # 写入 days.json
+            self._write_days_json(news_files)
 
-            logger.info(f"✓ 首页更新成功，包含{len(news_files)}天新闻")
+            if news_files:
+                logger.info(f"✓ 首页更新成功，包含{len(news_files)}天新闻")
+            else:
+                logger.warning(f"过去{days}天没有新闻页面，首页只提供按月归档")
             return True
 
         except Exception as e:
             logger.error(f"更新首页失败: {e}")
             return False
 
-    def _create_default_index(self):
-        """从模板创建默认的 index.html"""
+    def _ensure_index(self):
+        """从模板写入 index.html（内容未变化时跳过写入）"""
         template_path = Config.TEMPLATES_DIR / "index_modern.html"
 
         # 检查模板是否存在
         if not template_path.exists():
             raise FileNotFoundError(f"index.html 模板文件不存在: {template_path}")
 
-        # 读取模板
-        with open(template_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = template_path.read_bytes()
 
-        # 替换更新时间为北京时间
-        beijing_time = Config.get_beijing_time()
-        formatted_time = beijing_time.strftime("%Y-%m-%d %H:%M")
-        content = content.replace('{{ last_update_time }}', formatted_time)
+        if self.index_file.exists() and self.index_file.read_bytes() == content:
+            logger.debug("index.html 已是最新，跳过写入")
+            return
 
         # 确保目录存在
         self.index_file.parent.mkdir(parents=True, exist_ok=True)
+        self.index_file.write_bytes(content)
 
-        # 写入到 public/index.html
-        with open(self.index_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        logger.info(f"✓ 已从模板写入 index.html: {self.index_file}")
 
-        logger.info(f"✓ 已从模板创建 index.html: {self.index_file}")
-
-    def _generate_news_list_js(self, news_files: list) -> str:
-        """生成JavaScript数组的字符串"""
-        lines = []
+    def _write_days_json(self, news_files: list):
+        """生成 days.json（首页运行时加载的日期列表）"""
+        # 更新时间使用北京时间
+        beijing_time = Config.get_beijing_time()
 
-        for news in news_files:
-            date = news['date']
-            url = news['url']
-            title = news['title'].replace("'", "\\'").replace('"', '\\"')
-            article_count = news.get('article_count', 0)
+        data = {
+            'version': DAYS_JSON_VERSION,
+            'updated': beijing_time.strftime("%Y-%m-%d %H:%M"),
+            'days': [
+                {
+                    'date': news['date'],
+                    'url': news['url'],
+                    'title': news['title'],
+                    'articleCount': news.get('article_count', 0)
+                }
+                for news in news_files
+            ]
+        }
+
+        _write_json(self.days_file, data)
+        logger.debug(f"days.json 已更新: {self.days_file}")
+
+    def update_archive(self) -> int:
+        """
+        更新按月归档（public/archive/）
 
-            lines.append(f"            {{")
-            lines.append(f"                date: '{date}',")
-            lines.append(f"                url: '{url}',")
-            lines.append(f"                title: '{title}',")
-            lines.append(f"                articleCount: {article_count}")
-            lines.append(f"            }},")
+        - archive/YYYY-MM.json: 当月所有日期页面
+        - archive/months.json: 所有月份列表（倒序）
 
-        # 移除最后一个逗号
-        if lines:
-            lines[-1] = lines[-1].rstrip(',')
+        只写入内容发生变化的文件，新增一天通常只会重写当月的分片。
 
-        return '\n'.join(lines)
+        Returns:
+            int: 实际写入的文件数
+        """
+        manifest = self._load_manifest()
+
+        months = {}
+        for entry in manifest.entries():
+            months.setdefault(entry['date'][:7], []).append({
+                'date': entry['date'],
+                'url': entry['url'],
+                'title': entry['title'],
+                'articleCount': entry.get('article_count', 0)
+            })
+
+        written = 0
+        for month, days in months.items():
+            shard = {
+                'version': ARCHIVE_VERSION,
+                'month': month,
+                'days': days
+            }
+            if _write_json_if_changed(self.archive_dir / f"{month}.json", shard):
+                written += 1
+                logger.info(f"  ✓ 归档分片已更新: {month}（{len(days)}天）")
+
+        months_index = {
+            'version': ARCHIVE_VERSION,
+            'months': sorted(months.keys(), reverse=True)
+        }
+        if _write_json_if_changed(self.archive_dir / "months.json", months_index):
+            written += 1
+
+        logger.info(f"✓ 归档更新完成: {len(months)} 个月，写入 {written} 个文件")
+        return written
 
 
 def update_index_html(days: int = 30) -> bool:
@@ -0,0 +1,170 @@
+"""
+按来源交错排列新闻
+
+把按来源分组的新闻轮流取出：第一轮每个来源取1条（加权时取 weight 条），第二轮再各取1条……
+某个来源取完后退出轮询，其余来源继续。
+
+interleave() 是惰性生成器：每产出一条只做 O(1) 的工作，
+调用方只需要前 N 条时用 itertools.islice 截断即可，不会排列全部新闻。
+
+fair_interleave() 是加权公平排队（WFQ）版本：每个来源按权重分得份额，
+权重由 sources.yaml 中的 priority 和来源近期的健康度（source_weights）决定。
+"""
+
+import heapq
+import logging
+from collections import deque
+from typing import Dict, Hashable, Iterable, Iterator, Mapping, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+# sources.yaml 中 priority 的取值范围（数字越小优先级越高）
+MAX_PRIORITY = 10
+
+# 健康度为0的来源保留的权重比例（近期没有新文章的来源降权，但不会被完全排到最后）
+HEALTH_FLOOR = 0.5
+
+_EXHAUSTED = object()
+
+
+def priority_weights(sources: Iterable, max_priority: int = MAX_PRIORITY) -> Dict[str, int]:
+    """
+    根据新闻源优先级计算轮询权重
+
+    priority 1（最高）对应权重 max_priority，priority max_priority 对应权重 1。
+
+    Args:
+        sources: NewsSource 列表
+        max_priority: 优先级的最大值
+
+    Returns:
+        Dict[str, int]: {来源名称: 权重}
+    """
+    return {
+        source.name: max(1, max_priority + 1 - source.priority)
+        for source in sources
+    }
+
+
+def source_weights(
+    sources: Iterable,
+    health: Optional[Mapping[str, float]] = None,
+    max_priority: int = MAX_PRIORITY
+) -> Dict[str, float]:
+    """
+    根据优先级和健康度计算公平排队的权重
+
+    权重 = 优先级权重 × (HEALTH_FLOOR + (1 - HEALTH_FLOOR) × 健康度)
+
+    Args:
+        sources: NewsSource 列表
+        health: {来源名称: 健康度(0-1)}，见 DatabaseManager.get_source_health；不提供时只看优先级
+        max_priority: 优先级的最大值
+
+    Returns:
+        Dict[str, float]: {来源名称: 权重}
+    """
+    weights = priority_weights(sources, max_priority)
+    if health is None:
+        return dict(weights)
+
+    return {
+        name: weight * (HEALTH_FLOOR + (1 - HEALTH_FLOOR) * min(max(health.get(name, 0.0), 0.0), 1.0))
+        for name, weight in weights.items()
+    }
+
+
+def interleave(
+    groups: Mapping[Hashable, Iterable[T]],
+    weights: Optional[Mapping[Hashable, int]] = None
+) -> Iterator[T]:
+    """
+    轮流从各组中取出元素（惰性）
+
+    组的轮询顺序即 groups 的迭代顺序；每组内部保持原有顺序。
+    未指定权重时每轮每组取1条；指定权重时每轮取 weight 条（缺省的组按1计）。
+
+    Args:
+        groups: {组键: 元素序列}，序列可以是列表或迭代器
+        weights: {组键: 每轮取出的条数}，可选
+
+    Yields:
+        按轮询顺序排列的元素
+    """
+    queue = deque()
+    for key, items in groups.items():
+        weight = max(1, int(weights.get(key, 1))) if weights else 1
+        queue.append((iter(items), weight))
+
+    while queue:
+        items, weight = queue.popleft()
+        for _ in range(weight):
+            item = next(items, _EXHAUSTED)
+            if item is _EXHAUSTED:
+                break
+            yield item
+        else:
+            # 本轮取满，可能还有剩余，排到队尾等待下一轮
+            queue.append((items, weight))
+
+
+def fair_interleave(
+    groups: Mapping[Hashable, Iterable[T]],
+    weights: Optional[Mapping[Hashable, float]] = None,
+    default_weight: float = 1.0
+) -> Iterator[T]:
+    """
+    加权公平排队：按虚拟完成时间交错各组元素（惰性）
+
+    第 k 条（从1开始）的虚拟完成时间为 k / weight，每次取出完成时间最小的组的下一条，
+    权重为2的组取出的条数约为权重为1的组的两倍，且均匀分布而不是连续成段。
+    完成时间相同时按 groups 的迭代顺序，结果对相同输入是确定的。
+    所有权重相同时结果与 interleave() 的轮询完全一致。
+
+    用最小堆维护各组的下一个完成时间，每产出一条 O(log s)（s 为组数）。
+
+    Args:
+        groups: {组键: 元素序列}，序列可以是列表或迭代器
+        weights: {组键: 权重}，可选
+        default_weight: weights 中没有的组使用的权重
+
+    Yields:
+        按虚拟完成时间排列的元素
+    """
+    heap = []
+    for order, (key, items) in enumerate(groups.items()):
+        weight = weights.get(key, default_weight) if weights else default_weight
+        if weight <= 0:
+            raise ValueError(f"权重必须为正数: {key}={weight}")
+        # (完成时间, 顺序, 已取出条数, 权重, 迭代器)；顺序唯一，不会比较到迭代器
+        heap.append((1 / weight, order, 1, weight, iter(items)))
+    heapq.heapify(heap)
+
+    while heap:
+        finish, order, served, weight, items = heap[0]
+        item = next(items, _EXHAUSTED)
+        if item is _EXHAUSTED:
+            heapq.heappop(heap)
+            continue
+
+        yield item
+        served += 1
+        heapq.heapreplace(heap, (served / weight, order, served, weight, items))
+
+
+# 测试代码
+if __name__ == "__main__":
+    from itertools import islice
+
+    test_groups = {
+        'Bloomberg': ['B1', 'B2', 'B3', 'B4'],
+        'CNBC': ['C1', 'C2'],
+        'WSJ': ['W1', 'W2', 'W3'],
+    }
+
+    print(f"轮询: {list(interleave(test_groups))}")
+    print(f"加权(WSJ=2): {list(interleave(test_groups, {'WSJ': 2}))}")
+    print(f"前5条: {list(islice(interleave(test_groups), 5))}")
+    print(f"公平排队(WSJ=2): {list(fair_interleave(test_groups, {'WSJ': 2}))}")
@@ -1,5 +1,6 @@
 """数据模型定义"""
 
+import json
 from pydantic import BaseModel, HttpUrl
 from datetime import datetime
 from typing import Optional, List
@@ -59,6 +60,123 @@ class NewsArticle(BaseModel):
         }
 
 
+class ArticleRow:
+    """
+    数据库新闻的只读模型（读取路径使用）
+
+    页面重新生成、搜索索引等只读场景一次读取成千上万条已入库的新闻，
+    不需要 pydantic 逐字段校验。字段与 NewsArticle 相同，其中：
+    - publish_time / crawl_time 在首次访问时才从ISO字符串解析
+    - tags 在首次访问时才解析JSON
+    - category / language 在首次访问时才转换为枚举
+
+    需要修改并重新入库时用 to_article() 转换为经过校验的 NewsArticle。
+    """
+
+    __slots__ = (
+        'id', 'title', 'title_original', 'content', 'content_original',
+        'source', 'source_original', 'url', 'ai_comment',
+        'translated', 'translation_method', 'featured', 'beijing_date',
+        '_category', '_language', '_publish_time', '_crawl_time', '_tags'
+    )
+
+    @classmethod
+    def from_row(cls, row) -> "ArticleRow":
+        """
+        从数据库行创建（不做解析和校验）
+
+        Args:
+            row: news_articles 表的一行（sqlite3.Row）
+
+        Returns:
+            ArticleRow: 只读新闻对象
+        """
+        article = cls.__new__(cls)
+        article.id = row['id']
+        article.title = row['title']
+        article.title_original = row['title_original']
+        article.content = row['content']
+        article.content_original = row['content_original']
+        article.source = row['source']
+        article.source_original = row['source_original']
+        article.url = row['url']
+        article.ai_comment = row['ai_comment']
+        article.translated = bool(row['translated'])
+        article.translation_method = row['translation_method'] or ''
+        article.featured = bool(row['featured'])
+        article.beijing_date = row['beijing_date']  # 北京日期（YYYY-MM-DD），用于按天分组
+        article._category = row['category']
+        article._language = row['language']
+        article._publish_time = row['publish_time']
+        article._crawl_time = row['crawl_time']
+        article._tags = row['tags']
+        return article
+
+    @property
+    def publish_time(self) -> datetime:
+        value = self._publish_time
+        if isinstance(value, str):
+            value = self._publish_time = datetime.fromisoformat(value)
+        return value
+
+    @property
+    def crawl_time(self) -> datetime:
+        value = self._crawl_time
+        if isinstance(value, str):
+            value = self._crawl_time = datetime.fromisoformat(value)
+        return value
+
+    @property
+    def tags(self) -> List[str]:
+        value = self._tags
+        if not isinstance(value, list):
+            try:
+                value = json.loads(value) if value else []
+            except ValueError:
+                value = []
+            self._tags = value
+        return value
+
+    @property
+    def category(self) -> Category:
+        value = self._category
+        if not isinstance(value, Category):
+            value = self._category = Category(value)
+        return value
+
+    @property
+    def language(self) -> Language:
+        value = self._language
+        if not isinstance(value, Language):
+            value = self._language = Language(value)
+        return value
+
+    def to_article(self) -> NewsArticle:
+        """转换为经过校验的 NewsArticle"""
+        return NewsArticle(
+            id=self.id,
+            title=self.title,
+            title_original=self.title_original,
+            content=self.content,
+            content_original=self.content_original,
+            source=self.source,
+            source_original=self.source_original,
+            url=self.url,
+            category=self.category,
+            language=self.language,
+            publish_time=self.publish_time,
+            crawl_time=self.crawl_time,
+            tags=self.tags,
+            ai_comment=self.ai_comment,
+            translated=self.translated,
+            translation_method=self.translation_method,
+            featured=self.featured
+        )
+
+    def __repr__(self) -> str:
+        return f"ArticleRow(id={self.id!r}, title={(self.title_original or self.title)!r})"
+
+
 class NewsSource(BaseModel):
     """新闻源配置模型"""
 
@@ -0,0 +1,264 @@
+"""
+页面清单（public/manifest.json）
+
+记录每个日期页面的元数据：日期、标题、新闻数量、内容哈希和文件大小。
+页面生成时写入清单，首页更新只需读取清单，不再逐个读取HTML文件。
+"""
+
+import hashlib
+import json
+import os
+import re
+from pathlib import Path
+from typing import List, Optional
+from loguru import logger
+
+
+MANIFEST_FILENAME = "manifest.json"
+MANIFEST_VERSION = 1
+
+# 页面标题位于<head>开头，只保留这么多字符用于提取
+PAGE_HEAD_CHARS = 4096
+
+# 日期页面的文件名（YYYY-MM-DD.html）
+PAGE_FILENAME_RE = re.compile(r'(\d{4}-\d{2}-\d{2})\.html$')
+
+
+def extract_page_title(content: str) -> Optional[str]:
+    """
+    从HTML内容中提取页面标题
+
+    优先使用<h1>（长度超过10个字符时），否则使用<title>
+
+    Args:
+        content: HTML内容（可以只是页面开头部分）
+
+    Returns:
+        str: 标题（最长100字符），无法提取时返回None
+    """
+    h1_match = re.search(r'<h1[^>]*>(.*?)</h1>', content, re.DOTALL)
+    if h1_match:
+        title = h1_match.group(1).strip()
+        # 移除HTML标签
+        title = re.sub(r'<[^>]+>', '', title)
+        if len(title) > 10:
+            return title[:100]
+
+    title_match = re.search(r'<title>(.*?)</title>', content)
+    if title_match:
+        title = title_match.group(1).strip()
+        if len(title) > 10:
+            return title[:100]
+
+    return None
+
+
+def default_page_title(date_str: str) -> str:
+    """无法提取标题时使用的默认标题"""
+    return f"财经日报 - {date_str}"
+
+
+class PageWriter:
+    """
+    页面写入器
+
+    包装二进制文件对象，写入时同步计算SHA-256和字节数，
+    并保留页面开头部分用于提取标题。可直接传给 TemplateStream.dump()。
+    """
+
+    def __init__(self, fp):
+        self.fp = fp
+        self.size = 0
+        self.head = ""
+        self._sha256 = hashlib.sha256()
+
+    def write(self, text: str):
+        data = text.encode('utf-8')
+        self.fp.write(data)
+        self._sha256.update(data)
+        self.size += len(data)
+        if len(self.head) < PAGE_HEAD_CHARS:
+            self.head += text[:PAGE_HEAD_CHARS - len(self.head)]
+
+    @property
+    def sha256(self) -> str:
+        return self._sha256.hexdigest()
+
+
+def scan_page(file_path: Path, date_str: str) -> Optional[dict]:
+    """
+    读取一个已生成的HTML页面，生成页面清单条目
+
+    Args:
+        file_path: 页面文件路径
+        date_str: 页面日期（YYYY-MM-DD）
+
+    Returns:
+        dict: 页面清单条目，读取失败时返回None
+    """
+    try:
+        data = file_path.read_bytes()
+    except OSError as e:
+        logger.warning(f"读取页面失败: {file_path.name}, {e}")
+        return None
+
+    content = data.decode('utf-8', errors='replace')
+
+    # 统计 <article class="news-card ..."> 的数量
+    article_count = len(re.findall(r'<article[^>]*class="[^"]*news-card', content))
+
+    return {
+        'date': date_str,
+        'url': file_path.name,
+        'title': extract_page_title(content) or default_page_title(date_str),
+        'article_count': article_count,
+        'sha256': hashlib.sha256(data).hexdigest(),
+        'size': len(data)
+    }
+
+
+class PageManifest:
+    """页面清单"""
+
+    def __init__(self, public_dir: Path):
+        self.public_dir = Path(public_dir)
+        self.path = self.public_dir / MANIFEST_FILENAME
+        self.pages = {}  # {date: entry}
+
+    def exists(self) -> bool:
+        """清单文件是否存在"""
+        return self.path.exists()
+
+    def load(self) -> bool:
+        """
+        读取清单文件
+
+        Returns:
+            bool: 是否成功读取（文件不存在或格式错误时返回False）
+        """
+        self.pages = {}
+        if not self.path.exists():
+            return False
+
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"读取页面清单失败: {self.path}, {e}")
+            return False
+
+        if data.get('version') != MANIFEST_VERSION:
+            logger.warning(f"页面清单版本不匹配: {data.get('version')}")
+            return False
+
+        for entry in data.get('pages', []):
+            self.pages[entry['date']] = entry
+        return True
+
+    def update(self, entry: dict):
+        """添加或更新一个页面条目"""
+        self.pages[entry['date']] = entry
+
+    def rebuild(self):
+        """扫描public目录下已有的日期页面，重建清单条目（不保存）"""
+        self.pages = {}
+        for file_path in self.public_dir.glob("*.html"):
+            match = PAGE_FILENAME_RE.match(file_path.name)
+            if not match:
+                continue
+
+            entry = scan_page(file_path, match.group(1))
+            if entry:
+                self.update(entry)
+
+    def prune(self) -> int:
+        """
+        删除页面文件已不存在的条目
+
+        Returns:
+            int: 删除的条目数
+        """
+        missing = [date for date, entry in self.pages.items()
+                   if not (self.public_dir / entry['url']).exists()]
+        for date in missing:
+            del self.pages[date]
+        if missing:
+            logger.info(f"页面清单移除了 {len(missing)} 个文件已不存在的页面")
+        return len(missing)
+
+    def entries(self) -> List[dict]:
+        """所有页面条目，按日期倒序"""
+        return sorted(self.pages.values(), key=lambda x: x['date'], reverse=True)
+
+    def save(self):
+        """写回清单文件（先写临时文件再替换，避免写到一半被读取）"""
+        self.public_dir.mkdir(parents=True, exist_ok=True)
+        data = {
+            'version': MANIFEST_VERSION,
+            'pages': self.entries()
+        }
+
+        tmp_path = self.path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, indent=1)
+        os.replace(tmp_path, self.path)
+
+        logger.debug(f"页面清单已保存: {self.path} ({len(self.pages)} 个页面)")
+
+
+def load_manifest(public_dir: Path) -> PageManifest:
+    """
+    读取页面清单；不存在或无法读取时从磁盘上已有的页面重建，并移除文件已不存在的条目
+
+    Args:
+        public_dir: public目录
+
+    Returns:
+        PageManifest: 页面清单（未保存）
+    """
+    manifest = PageManifest(public_dir)
+    if not manifest.load():
+        logger.info(f"页面清单不存在，从现有HTML文件重建: {manifest.path}")
+        manifest.rebuild()
+    manifest.prune()
+    return manifest
+
+
+def remove_pages_before(public_dir: Path, date_str: str) -> int:
+    """
+    删除早于指定日期的页面文件及其清单条目
+
+    Args:
+        public_dir: public目录
+        date_str: 日期（YYYY-MM-DD），早于该日期的页面被删除
+
+    Returns:
+        int: 删除的页面数
+    """
+    manifest = load_manifest(public_dir)
+    expired = [entry for entry in manifest.entries() if entry['date'] < date_str]
+    for entry in expired:
+        page_path = manifest.public_dir / entry['url']
+        if page_path.exists():
+            page_path.unlink()
+        del manifest.pages[entry['date']]
+
+    manifest.save()
+    return len(expired)
+
+
+def update_manifest(public_dir: Path, entries: List[dict]):
+    """
+    将新生成的页面条目合并写入清单
+
+    清单不存在或无法读取时先从磁盘上已有的页面重建，
+    否则只包含本次生成的页面，之前的日期会从首页和归档中消失。
+
+    Args:
+        public_dir: public目录
+        entries: 页面条目列表
+    """
+    manifest = load_manifest(public_dir)
+    for entry in entries:
+        manifest.update(entry)
+    manifest.save()
@@ -0,0 +1,229 @@
+"""
+数据保留：分批删除过期新闻、按月归档、增量回收空间
+
+一次性 DELETE 全部过期新闻会在一个事务里逐行触发全文索引和统计计数的触发器，
+持有写锁的时间和日志大小都与过期数量成正比；删除后空出的页也不会还给文件系统，
+news.db（GitHub Actions 缓存）只增不减。
+
+RetentionManager.apply() 的流程：
+1. 按 publish_ts 从旧到新每次取 chunk_size 条过期新闻
+2. 可选：合并进按月的列式归档文件（archive_dir/news-YYYY-MM.ncol，北京时间月份，见 archive.py）
+3. 删除这一批并提交，下一批重新开始事务
+4. 用 PRAGMA incremental_vacuum 回收最多 vacuum_pages 个空闲页
+
+增量回收需要数据库处于 auto_vacuum=INCREMENTAL 模式：
+新数据库建表前已设置（见 DatabaseManager._create_tables），
+旧数据库在第一次执行保留策略时 VACUUM 一次完成切换。
+"""
+
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from loguru import logger
+
+from .archive import append_archive, archive_path
+from .database import beijing_cutoff_ts
+
+
+# 每批删除的新闻数
+RETENTION_CHUNK_SIZE = 1000
+
+# 每次最多回收的空闲页数（默认页大小4KB，约20MB）
+VACUUM_PAGE_BUDGET = 5000
+
+# PRAGMA auto_vacuum 的取值
+AUTO_VACUUM_INCREMENTAL = 2
+
+
+class RetentionManager:
+    """
+    news_articles 的保留策略
+
+    用法：
+        result = RetentionManager(db_manager, archive_dir=Config.ARCHIVE_DIR).apply(days=365)
+        result['deleted'], result['archived'], result['freed_pages']
+    """
+
+    def __init__(
+        self,
+        db_manager,
+        archive_dir: Optional[Path] = None,
+        chunk_size: int = RETENTION_CHUNK_SIZE,
+        vacuum_pages: int = VACUUM_PAGE_BUDGET
+    ):
+        """
+        Args:
+            db_manager: DatabaseManager
+            archive_dir: 归档目录，None 表示不归档直接删除
+            chunk_size: 每批删除的新闻数
+            vacuum_pages: 每次最多回收的空闲页数，0 表示不回收
+        """
+        if chunk_size <= 0:
+            raise ValueError(f"chunk_size 必须为正数: {chunk_size}")
+
+        self.db_manager = db_manager
+        self.archive_dir = Path(archive_dir) if archive_dir else None
+        self.chunk_size = chunk_size
+        self.vacuum_pages = vacuum_pages
+
+    def apply(self, days: int) -> Dict[str, object]:
+        """
+        执行保留策略：删除（并归档）发布时间早于 days 天前的新闻，然后回收空间
+
+        Args:
+            days: 保留最近几天的新闻（基于北京时间）
+
+        Returns:
+            dict: {'deleted': 删除数, 'archived': 归档数, 'archive_files': 写入的归档文件, 'freed_pages': 回收的页数}
+        """
+        deleted, archived, archive_files = self.expire(beijing_cutoff_ts(days))
+        freed_pages = self.vacuum() if self.vacuum_pages > 0 else 0
+
+        return {
+            'deleted': deleted,
+            'archived': archived,
+            'archive_files': archive_files,
+            'freed_pages': freed_pages,
+        }
+
+    def expire(self, cutoff_ts: int) -> tuple:
+        """
+        分批删除 publish_ts 早于 cutoff_ts 的新闻
+
+        每批先写归档再删除，归档失败时这一批回滚、不会删除。
+
+        Args:
+            cutoff_ts: 截止时间（UTC epoch 秒）
+
+        Returns:
+            tuple: (删除数, 归档数, 写入的归档文件列表)
+        """
+        deleted = 0
+        archived = 0
+        archive_files = set()
+
+        with self.db_manager as db:
+            while True:
+                rows = db.cursor.execute("""
+                    SELECT * FROM news_articles
+                    WHERE publish_ts < ?
+                    ORDER BY publish_ts
+                    LIMIT ?
+                """, (cutoff_ts, self.chunk_size)).fetchall()
+
+                if not rows:
+                    break
+
+                if self.archive_dir:
+                    archive_files.update(self._archive_rows(rows))
+                    archived += len(rows)
+
+                ids = [row['id'] for row in rows]
+                placeholders = ", ".join("?" * len(ids))
+                db.cursor.execute(f"DELETE FROM news_articles WHERE id IN ({placeholders})", ids)
+                db.conn.commit()
+
+                deleted += len(ids)
+                logger.debug(f"已删除一批过期新闻: {len(ids)} 条（累计 {deleted} 条）")
+
+        return deleted, archived, sorted(archive_files)
+
+    def _archive_rows(self, rows: list) -> List[Path]:
+        """
+        把一批新闻合并进按月的归档文件
+
+        Args:
+            rows: news_articles 的行
+
+        Returns:
+            List[Path]: 写入的归档文件
+        """
+        by_month = {}
+        for row in rows:
+            month = (row['beijing_date'] or 'unknown')[:7]
+            by_month.setdefault(month, []).append(dict(row))
+
+        paths = []
+        for month, records in by_month.items():
+            path = archive_path(self.archive_dir, month)
+            append_archive(path, records)
+            paths.append(path)
+
+        return paths
+
+    def ensure_incremental_vacuum(self) -> bool:
+        """
+        确保数据库处于 auto_vacuum=INCREMENTAL 模式
+
+        已有数据的数据库需要 VACUUM 一次才能切换（会重写整个文件，同时整理碎片）。
+
+        Returns:
+            bool: 本次是否执行了切换
+        """
+        with self.db_manager as db:
+            mode = db.cursor.execute("PRAGMA auto_vacuum").fetchone()[0]
+            if mode == AUTO_VACUUM_INCREMENTAL:
+                return False
+
+            db.conn.commit()
+            db.cursor.execute(f"PRAGMA auto_vacuum = {AUTO_VACUUM_INCREMENTAL}")
+            db.cursor.execute("VACUUM")
+
+        logger.info("✓ 数据库已切换为增量回收模式（auto_vacuum=INCREMENTAL）")
+        return True
+
+    def vacuum(self) -> int:
+        """
+        回收最多 vacuum_pages 个空闲页，文件随之变小
+
+        Returns:
+            int: 回收的页数
+        """
+        self.ensure_incremental_vacuum()
+
+        with self.db_manager as db:
+            before = db.cursor.execute("PRAGMA freelist_count").fetchone()[0]
+            if before:
+                # execute() 只执行一步（回收一页），executescript() 会执行到结束
+                db.conn.commit()
+                db.cursor.executescript(f"PRAGMA incremental_vacuum({int(self.vacuum_pages)})")
+            after = db.cursor.execute("PRAGMA freelist_count").fetchone()[0]
+
+        freed = before - after
+        if freed:
+            logger.info(f"✓ 回收了 {freed} 个空闲页（剩余 {after} 个）")
+        return freed
+
+
+# 测试代码
+if __name__ == "__main__":
+    # python -m news_bot.src.retention
+    import tempfile
+    from datetime import timedelta
+
+    from .database import DatabaseManager, get_utc_now, to_epoch, to_beijing_date
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_manager = DatabaseManager(Path(tmp_dir) / "news.db")
+        db_manager.init_database()
+
+        now = get_utc_now()
+        with db_manager as db:
+            for i in range(5000):
+                publish_time = now - timedelta(days=i % 100)
+                db.cursor.execute("""
+                    INSERT INTO news_articles (
+                        title, content, source, url, url_canonical, category, language,
+                        publish_time, publish_ts, beijing_date, crawl_time
+                    ) VALUES (?, ?, ?, ?, ?, 'global', 'en', ?, ?, ?, ?)
+                """, (f"标题 {i}", "摘要" * 200, "测试源", f"https://example.com/{i}", f"https://example.com/{i}",
+                      publish_time.isoformat(), to_epoch(publish_time), to_beijing_date(publish_time),
+                      now.isoformat()))
+
+        size_before = db_manager.db_path.stat().st_size
+        result = RetentionManager(db_manager, archive_dir=Path(tmp_dir) / "archive", chunk_size=500).apply(days=30)
+
+        print(f"删除: {result['deleted']} 条, 归档: {result['archived']} 条, 回收: {result['freed_pages']} 页")
+        print(f"归档文件: {[path.name for path in result['archive_files']]}")
+        print(f"文件大小: {size_before / 1024:.0f}KB -> {db_manager.db_path.stat().st_size / 1024:.0f}KB")
+        print(f"剩余: {db_manager.get_stats()['total_articles']} 条")
@@ -2,75 +2,352 @@
 新闻评分模块
 
 根据关键词和优先级规则计算新闻得分，包含v2.1改进的得分上限机制。
+
+评分规则（关键词档位、分值、上限、板块加分）配置在 config/scoring.yaml 中，
+启动时编译为关键词匹配器和权重表，编译结果按规则文件哈希缓存在磁盘上（data/scoring_rules.cache）。
+长时间运行的进程调用 reload_scoring_rules() 即可加载修改后的规则；score_batch 每次调用前会自动检查。
 """
 
+import hashlib
+import heapq
 import logging
-from typing import Dict, List
+import marshal
+import os
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import numpy as np
+import yaml
+
+from .keyword_matcher import KeywordMatcher
 
 logger = logging.getLogger(__name__)
 
 
-# 通用关键词配置
-HIGH_PRIORITY_KEYWORDS = {
-    'zh': [
-        '央行', '美联储', '欧洲央行', '日本央行', '英国央行',
-        '利率', '降息', '加息', '基准利率', '负利率',
-        'gdp', '国内生产总值', '经济增速', '经济衰退',
-        '通胀', '通货膨胀', 'cpi', '消费者物价', '通缩',
-        '财政政策', '货币政策', '量化宽松', '缩表', 'qe'
-    ],
-    'en': [
-        'central bank', 'ecb', 'boj', 'bank of england',
-        'interest rate', 'rate cut', 'rate hike', 'benchmark rate', 'negative rate',
-        'gdp', 'economic growth', 'recession',
-        'inflation', 'cpi', 'deflation',
-        'monetary policy', 'fiscal policy', 'qe', 'balance sheet reduction'
-    ]
-}
-
-MEDIUM_PRIORITY_KEYWORDS = {
-    'zh': [
-        '股市', '大盘', '指数', '涨跌', '震荡',
-        '上证指数', '深证成指', '标普500', '纳斯达克',
-        '道琼斯', '日经指数', '恒生指数',
-        '牛市', '熊市', '反弹', '回调',
-        '财报', '营收', '利润', '季度', '年报',
-        '并购', '收购', 'ipo', '上市', '退市',
-        'ceo', '高管', '董事会', '股东大会',
-        '油价', '黄金', '白银', '铜', '铝',
-        '原油', '期货', '大宗商品'
-    ],
-    'en': [
-        'stock market', 'index', 'rally', 'drop', 'volatility',
-        's&p 500', 'nasdaq', 'dow jones',
-        'nikkei', 'hang seng', 'ftse',
-        'bull market', 'bear market', 'rebound', 'correction',
-        'earnings', 'revenue', 'profit', 'quarterly', 'annual report',
-        'm&a', 'acquisition', 'ipo', 'listing', 'delisting',
-        'ceo', 'executive', 'board of directors', 'shareholder meeting',
-        'oil price', 'gold', 'silver', 'copper', 'aluminum',
-        'crude oil', 'futures', 'commodities'
-    ]
-}
-
-# 板块特有关键词（加分规则）
-CATEGORY_KEYWORDS = {
-    'domestic': {
-        'zh': ['中国', '内地', '国内', '全国', '大陆', '国务院', '证监会', '银保监会'],
-        'en': ['china', 'chinese', 'mainland', 'domestic', 'state council', 'pboc', 'csrc'],
-        'bonus': 10
-    },
-    'asia_pacific': {
-        'zh': ['日本', '韩国', '印度', '澳大利亚', '亚太', '亚洲', '东盟'],
-        'en': ['japan', 'korea', 'india', 'australia', 'asia-pacific', 'asia', 'asean'],
-        'bonus': 10
-    },
-    'us_europe': {
-        'zh': ['美国', '美利坚', '美股', '华尔街', '美联储', '欧洲', '欧盟', '欧元'],
-        'en': ['us', 'usa', 'united states', 'america', 'wall street', 'fed', 'europe', 'eu', 'euro'],
-        'bonus': 15
+BASE_DIR = Path(__file__).parent.parent
+SCORING_RULES_FILE = BASE_DIR / "config" / "scoring.yaml"
+SCORING_CACHE_FILE = BASE_DIR / "data" / "scoring_rules.cache"
+
+# 编译结果格式版本（修改编译逻辑时递增，使旧缓存失效）
+RULES_FORMAT_VERSION = 2
+
+# 评分时的语言（英文新闻用原文评分，其余按中文评分）
+LANGUAGES = ('zh', 'en')
+
+
+class ScoringRules:
+    """
+    编译后的评分规则
+
+    - matchers: {语言: KeywordMatcher}，包含该语言所有档位和板块的关键词
+    - tiers: 关键词档位列表，每档包含标题/内容的分值和上限，{语言: 权重向量} 和 {语言: 关键词元组}
+    - categories: {板块: {'bonus': 加分, 'vectors': {语言: 0/1向量}, 'keywords': {语言: 关键词元组}}}
+
+    权重向量的列与匹配器的关键词一一对应，值为关键词在该档列表中出现的次数
+    （列表中重复的关键词按次数计分，与逐个检查一致）。
+    关键词元组（重复的关键词按次数展开）用于逐条评分的逐个检查；
+    score_batch 使用由向量拼成的矩阵（见 _build_batch_tables）。
+    """
+
+    def __init__(self, data: dict, source_hash: str):
+        self.source_hash = source_hash
+        self.base_score = data['base_score']
+        self.max_score = data['max_score']
+        self.thresholds = data['priority_thresholds']
+        self.matchers = data['matchers']
+        self.columns = {
+            lang: {keyword: i for i, keyword in enumerate(matcher.keywords)}
+            for lang, matcher in self.matchers.items()
+        }
+        self.tiers = [
+            dict(
+                tier,
+                vectors={lang: np.array(vector, dtype=np.int32) for lang, vector in tier['vectors'].items()},
+                keywords={lang: self._expand_keywords(lang, vector) for lang, vector in tier['vectors'].items()}
+            )
+            for tier in data['tiers']
+        ]
+        self.categories = {
+            name: dict(
+                category,
+                vectors={lang: np.array(vector, dtype=np.int32) for lang, vector in category['vectors'].items()},
+                keywords={lang: self._expand_keywords(lang, vector)
+                          for lang, vector in category['vectors'].items()}
+            )
+            for name, category in data['categories'].items()
+        }
+        self._build_batch_tables()
+
+    def _build_batch_tables(self):
+        """
+        score_batch 使用的矩阵和参数
+
+        - tier_matrix: {语言: 关键词数 x 档位数}，命中矩阵乘以它得到每档命中数
+        - category_matrix: {语言: 关键词数 x 板块数}，命中矩阵乘以它得到每个板块的命中数
+        - category_index: {板块: 列号}，与 category_matrix 的列对应
+        - 各档的标题/内容分值和上限（按档位顺序）
+        """
+        self.tier_matrix = {
+            lang: np.stack([tier['vectors'][lang] for tier in self.tiers], axis=1)
+            if self.tiers else np.zeros((len(matcher), 0), dtype=np.int32)
+            for lang, matcher in self.matchers.items()
+        }
+        self.category_index = {name: i for i, name in enumerate(self.categories)}
+        self.category_matrix = {
+            lang: np.stack([category['vectors'][lang] for category in self.categories.values()], axis=1)
+            if self.categories else np.zeros((len(matcher), 0), dtype=np.int32)
+            for lang, matcher in self.matchers.items()
+        }
+        self.title_points = np.array([tier['title_points'] for tier in self.tiers], dtype=np.int32)
+        self.title_caps = np.array([tier['title_cap'] for tier in self.tiers], dtype=np.int32)
+        self.content_points = np.array([tier['content_points'] for tier in self.tiers], dtype=np.int32)
+        self.content_caps = np.array([tier['content_cap'] for tier in self.tiers], dtype=np.int32)
+
+    def _expand_keywords(self, lang: str, vector: list) -> tuple:
+        """权重向量还原为关键词元组（权重为几就重复几次）"""
+        return tuple(
+            keyword
+            for keyword, count in zip(self.matchers[lang].keywords, vector)
+            for _ in range(count)
+        )
+
+    @classmethod
+    def compile(cls, config: dict, source_hash: str) -> "ScoringRules":
+        """将 scoring.yaml 的内容编译为关键词匹配器和权重表"""
+        return cls._from_compiled(compile_scoring_config(config), source_hash)
+
+    @classmethod
+    def _from_compiled(cls, compiled: dict, source_hash: str) -> "ScoringRules":
+        data = dict(compiled)
+        data['matchers'] = {
+            lang: KeywordMatcher.from_dict(matcher) for lang, matcher in compiled['matchers'].items()
+        }
+        return cls(data, source_hash)
+
+
+def compile_scoring_config(config: dict) -> dict:
+    """
+    编译评分规则（结果只包含内置类型，便于缓存到磁盘）
+
+    Args:
+        config: scoring.yaml 的内容
+
+    Returns:
+        dict: 编译结果
+    """
+    tiers_config = config.get('tiers', {})
+    categories_config = config.get('categories', {})
+
+    matchers = {}
+    columns = {}
+    for lang in LANGUAGES:
+        keywords = []
+        for tier in tiers_config.values():
+            keywords.extend(tier.get('keywords', {}).get(lang) or [])
+        for category in categories_config.values():
+            keywords.extend(category.get('keywords', {}).get(lang) or [])
+
+        matcher = KeywordMatcher(keywords)
+        matchers[lang] = matcher.to_dict()
+        columns[lang] = {keyword: i for i, keyword in enumerate(matcher.keywords)}
+
+    def vector(lang, keywords):
+        values = [0] * len(columns[lang])
+        for keyword, count in Counter(keywords or []).items():
+            values[columns[lang][keyword]] = count
+        return values
+
+    tiers = []
+    for name, tier in tiers_config.items():
+        tiers.append({
+            'name': name,
+            'title_points': tier['title_points'],
+            'title_cap': tier['title_cap'],
+            'content_points': tier['content_points'],
+            'content_cap': tier['content_cap'],
+            'vectors': {lang: vector(lang, tier.get('keywords', {}).get(lang)) for lang in LANGUAGES}
+        })
+
+    categories = {}
+    for name, category in categories_config.items():
+        categories[name] = {
+            'bonus': category.get('bonus', 0),
+            # 板块关键词只判断是否命中任意一个，重复不影响结果
+            'vectors': {
+                lang: [min(count, 1) for count in vector(lang, category.get('keywords', {}).get(lang))]
+                for lang in LANGUAGES
+            }
+        }
+
+    return {
+        'base_score': config.get('base_score', 10),
+        'max_score': config.get('max_score', 60),
+        'priority_thresholds': dict(config.get('priority_thresholds', {'high': 50, 'medium': 30})),
+        'matchers': matchers,
+        'tiers': tiers,
+        'categories': categories
     }
-}
+
+
+def _read_rules_cache(cache_path: Path, source_hash: str) -> Optional[dict]:
+    """读取编译缓存；不存在、损坏或哈希不匹配时返回None"""
+    try:
+        with open(cache_path, 'rb') as f:
+            cached = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(cached, dict) or cached.get('source_hash') != source_hash:
+        return None
+    return cached.get('compiled')
+
+
+def _write_rules_cache(cache_path: Path, source_hash: str, compiled: dict):
+    """写入编译缓存（失败只记录日志，不影响评分）"""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            marshal.dump({'source_hash': source_hash, 'compiled': compiled}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"写入评分规则缓存失败: {e}")
+
+
+def load_scoring_rules(rules_path: Path = None, cache_path: Path = None) -> ScoringRules:
+    """
+    加载评分规则：规则文件哈希与缓存一致时直接使用缓存的编译结果，否则重新编译并写入缓存
+
+    Args:
+        rules_path: scoring.yaml 路径，默认 SCORING_RULES_FILE
+        cache_path: 编译缓存路径，默认 SCORING_CACHE_FILE
+
+    Returns:
+        ScoringRules: 编译后的评分规则
+    """
+    rules_path = Path(rules_path or SCORING_RULES_FILE)
+    cache_path = Path(cache_path or SCORING_CACHE_FILE)
+
+    if not rules_path.exists():
+        raise FileNotFoundError(f"评分规则文件不存在: {rules_path}")
+
+    raw = rules_path.read_bytes()
+    source_hash = hashlib.sha256(raw + f"|v{RULES_FORMAT_VERSION}".encode()).hexdigest()
+
+    compiled = _read_rules_cache(cache_path, source_hash)
+    if compiled is None:
+        compiled = compile_scoring_config(yaml.safe_load(raw) or {})
+        _write_rules_cache(cache_path, source_hash, compiled)
+        logger.info(f"评分规则已编译: {rules_path}")
+    else:
+        logger.debug(f"使用缓存的评分规则: {cache_path}")
+
+    return ScoringRules._from_compiled(compiled, source_hash)
+
+
+def _rules_file_stamp(rules_path: Path):
+    """规则文件的修改时间和大小（用于快速判断是否需要重新加载）"""
+    try:
+        stat = rules_path.stat()
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def _load_initial_rules() -> ScoringRules:
+    """
+    导入时加载评分规则
+
+    与 reload_scoring_rules 一样，规则文件缺失或有错误时只记录日志、不中断导入（main.py 导入即加载）：
+    优先使用上一次成功编译的缓存，没有可用缓存时使用空规则（只有基础分）。
+    规则文件修复后，下一次 score_batch 会通过热加载换成新规则。
+    """
+    try:
+        return load_scoring_rules()
+    except Exception as e:
+        logger.error(f"加载评分规则失败: {e}")
+
+    try:
+        with open(SCORING_CACHE_FILE, 'rb') as f:
+            cached = marshal.load(f)
+        rules = ScoringRules._from_compiled(cached['compiled'], cached['source_hash'])
+        logger.warning(f"使用上一次编译的评分规则: {SCORING_CACHE_FILE}")
+        return rules
+    except Exception as e:
+        logger.warning(f"没有可用的评分规则缓存，只按基础分评分: {e}")
+
+    return ScoringRules.compile({}, source_hash='')
+
+
+_rules = _load_initial_rules()
+_rules_stamp = _rules_file_stamp(SCORING_RULES_FILE)
+
+
+def get_scoring_rules() -> ScoringRules:
+    """当前使用的评分规则"""
+    return _rules
+
+
+def reload_scoring_rules(force: bool = False) -> bool:
+    """
+    热加载钩子：规则文件变化时重新加载评分规则
+
+    先比较文件修改时间和大小，未变化时直接返回（开销只有一次 stat）；
+    变化时按内容哈希加载，内容没有真正改变时保留当前规则。
+
+    Args:
+        force: 忽略修改时间，强制按内容重新检查
+
+    Returns:
+        bool: 规则是否发生了变化
+    """
+    global _rules, _rules_stamp
+
+    stamp = _rules_file_stamp(SCORING_RULES_FILE)
+    if not force and stamp == _rules_stamp:
+        return False
+
+    try:
+        rules = load_scoring_rules()
+    except Exception as e:
+        # 规则文件写到一半或格式错误时继续使用旧规则
+        logger.error(f"重新加载评分规则失败，继续使用当前规则: {e}")
+        return False
+
+    _rules_stamp = stamp
+    if rules.source_hash == _rules.source_hash:
+        return False
+
+    _rules = rules
+    clear_score_cache()
+    logger.info("✓ 评分规则已重新加载")
+    return True
+
+
+# score_batch 的命中统计缓存：{(语言, 标题, 内容): 命中统计行}，见 _hit_features
+# 以评分所用的文本为键，标题或内容修改后自然不会命中旧结果；评分规则变化时清空
+_hit_cache: Dict[tuple, np.ndarray] = {}
+
+# 缓存的文本条数上限（超过时清空；每次运行评分的新闻只有几千条，正常不会达到）
+HIT_CACHE_SIZE = 100000
+
+
+def clear_score_cache():
+    """清空 score_batch 的命中统计缓存"""
+    _hit_cache.clear()
+
+
+def _scoring_text(article: dict):
+    """返回用于评分的 (语言, 标题, 内容)，均已转小写"""
+    if article.get('language') == 'en':
+        title = (article.get('title_original') or article.get('title') or '').lower()
+        content = (article.get('content_original') or article.get('content') or '').lower()
+        return 'en', title, content
+
+    title = (article.get('title') or '').lower()
+    content = (article.get('content') or '').lower()
+    return 'zh', title, content
 
 
 def calculate_priority_score(article: dict, category: str = None) -> int:
@@ -83,6 +360,10 @@ def calculate_priority_score(article: dict, category: str = None) -> int:
     3. 内容匹配得分上限：+20分（最多1个高优先级关键词）
     4. 总分上限：60分（避免垃圾新闻高分）
 
+    分值和上限以 config/scoring.yaml 为准（上面是默认配置）。
+    逐个关键词做子串检查，达到上限的档位提前停止：单条新闻命中的关键词很少，
+    这比先用匹配器找出全部关键词更快（见 src/keyword_matcher.py）；批量评分见 score_batch。
+
     Args:
         article: 新闻文章字典
         category: 板块分类（可选，用于额外加分）
@@ -90,73 +371,130 @@ def calculate_priority_score(article: dict, category: str = None) -> int:
     Returns:
         int: 优先级得分（0-60）
     """
+    rules = _rules
+
     # 提取标题和内容
-    if article.get('language') == 'en':
-        title = (article.get('title_original') or article.get('title') or '').lower()
-        content = (article.get('content_original') or article.get('content') or '').lower()
-        lang = 'en'
-    else:
-        title = (article.get('title') or '').lower()
-        content = (article.get('content') or '').lower()
-        lang = 'zh'
-
-    score = 10  # 基础分
-
-    # 高优先级关键词（标题+20，内容+10）
-    high_keywords = HIGH_PRIORITY_KEYWORDS.get(lang, [])
-
-    # ⭐ 标题匹配：最多2个关键词，上限+40分
-    title_high_count = 0
-    for keyword in high_keywords:
-        if keyword in title:
-            score += 20
-            title_high_count += 1
-            if title_high_count >= 2:  # 最多2个关键词
+    lang, title, content = _scoring_text(article)
+
+    score = rules.base_score  # 基础分
+
+    # ⭐ 各档关键词：标题和内容分别计分，命中个数（按列表中出现次数计）有上限，达到上限即停止检查
+    for tier in rules.tiers:
+        keywords = tier['keywords'][lang]
+        for text, points, cap in (
+            (title, tier['title_points'], tier['title_cap']),
+            (content, tier['content_points'], tier['content_cap']),
+        ):
+            hits = 0
+            for keyword in keywords:
+                if keyword in text:
+                    hits += 1
+                    if hits >= cap:
+                        break
+            score += points * hits
+
+    # 板块特有关键词额外加分（标题或内容命中任意一个）
+    category_rule = rules.categories.get(category) if category else None
+    if category_rule:
+        for keyword in category_rule['keywords'][lang]:
+            if keyword in title or keyword in content:
+                score += category_rule['bonus']
                 break
 
-    # ⭐ 内容匹配：最多1个关键词，上限+10分
-    content_high_count = 0
-    for keyword in high_keywords:
-        if keyword in content:
-            score += 10
-            content_high_count += 1
-            if content_high_count >= 1:  # 最多1个关键词
-                break
+    # ⭐ 总分上限：60分（避免SEO堆砌）
+    return min(score, rules.max_score)
 
-    # 中优先级关键词（标题+10，内容+5）
-    medium_keywords = MEDIUM_PRIORITY_KEYWORDS.get(lang, [])
 
-    # ⭐ 标题匹配：最多2个关键词，上限+20分
-    title_medium_count = 0
-    for keyword in medium_keywords:
-        if keyword in title:
-            score += 10
-            title_medium_count += 1
-            if title_medium_count >= 2:  # 最多2个关键词
-                break
+def _hit_features(lang: str, titles: List[str], contents: List[str]) -> np.ndarray:
+    """
+    对同一语言的一批文本统计命中情况（与板块无关，可供任意板块评分复用）
 
-    # ⭐ 内容匹配：最多1个关键词，上限+5分
-    content_medium_count = 0
-    for keyword in medium_keywords:
-        if keyword in content:
-            score += 5
-            content_medium_count += 1
-            if content_medium_count >= 1:  # 最多1个关键词
-                break
+    标题和内容各拼接后用匹配器扫描一次，命中的 (行, 列) 一次性写入命中矩阵（行=新闻，列=关键词），
+    再与权重矩阵相乘得到每档命中数和每个板块是否命中。
 
-    # 板块特有关键词额外加分
-    if category:
-        category_config = CATEGORY_KEYWORDS.get(category, {})
-        category_keywords = category_config.get(lang, [])
-        category_bonus = category_config.get('bonus', 0)
+    Args:
+        lang: 语言
+        titles: 小写标题列表
+        contents: 小写内容列表（与标题一一对应）
 
-        for keyword in category_keywords:
-            if keyword in title or keyword in content:
-                score += category_bonus
-                break
+    Returns:
+        np.ndarray: 每行为 [标题各档命中数..., 内容各档命中数..., 各板块是否命中(0/1)...]
+    """
+    rules = _rules
+    matcher = rules.matchers[lang]
 
-    # ⭐ 总分上限：60分（避免SEO堆砌）
-    return min(score, 60)
+    title_matrix = np.zeros((len(titles), len(matcher)), dtype=np.int32)
+    title_matrix[matcher.find_batch(titles)] = 1
+    content_matrix = np.zeros((len(contents), len(matcher)), dtype=np.int32)
+    content_matrix[matcher.find_batch(contents)] = 1
+
+    tier_matrix = rules.tier_matrix[lang]
+    category_hits = (title_matrix | content_matrix) @ rules.category_matrix[lang]
+    return np.hstack([
+        title_matrix @ tier_matrix,
+        content_matrix @ tier_matrix,
+        (category_hits > 0).astype(np.int32),
+    ])
+
+
+def score_batch(articles: List[dict], category: str = None, use_cache: bool = True) -> np.ndarray:
+    """
+    批量计算优先级得分（向量化）
+
+    先统计每条新闻各档关键词的命中数和各板块是否命中（_hit_features），
+    再对整批统一应用分值和上限，规则与 calculate_priority_score 完全一致。
+    命中统计按评分所用的文本缓存在模块内（与板块无关），同一批新闻按其他板块再次评分、
+    或被去重模块再次评分时不需要重新扫描；不会向新闻字典写入任何字段。
+    评分前会检查评分规则文件是否变化（规则变化后清空缓存）。
+
+    Args:
+        articles: 新闻文章字典列表
+        category: 板块分类（可选，用于额外加分）
+        use_cache: 是否读写命中统计缓存
+
+    Returns:
+        np.ndarray: 与输入一一对应的得分数组（int32）
+    """
+    reload_scoring_rules()
+    rules = _rules
+    num_tiers = len(rules.tiers)
+
+    features = np.zeros((len(articles), 2 * num_tiers + len(rules.categories)), dtype=np.int32)
+    pending = {}  # {lang: ([下标], [缓存键])}
+
+    for i, article in enumerate(articles):
+        key = _scoring_text(article)
+        cached = _hit_cache.get(key) if use_cache else None
+        if cached is not None:
+            features[i] = cached
+            continue
+
+        indices, keys = pending.setdefault(key[0], ([], []))
+        indices.append(i)
+        keys.append(key)
+
+    for lang, (indices, keys) in pending.items():
+        lang_features = _hit_features(lang, [key[1] for key in keys], [key[2] for key in keys])
+        features[indices] = lang_features
+
+        if use_cache:
+            if len(_hit_cache) + len(keys) > HIT_CACHE_SIZE:
+                _hit_cache.clear()
+            _hit_cache.update(zip(keys, lang_features))
+
+    title_hits = features[:, :num_tiers]
+    content_hits = features[:, num_tiers:2 * num_tiers]
+    scores = (
+        rules.base_score  # 基础分
+        + np.minimum(title_hits, rules.title_caps) @ rules.title_points
+        + np.minimum(content_hits, rules.content_caps) @ rules.content_points
+    )
+
+    column = rules.category_index.get(category) if category else None
+    if column is not None:
+        scores += features[:, 2 * num_tiers + column] * rules.categories[category]['bonus']
+
+    return np.minimum(scores, rules.max_score).astype(np.int32)
 
 
 def classify_by_score(score: int) -> str:
@@ -169,14 +507,25 @@ def classify_by_score(score: int) -> str:
     Returns:
         str: 优先级类别 ('high', 'medium', 'low')
     """
-    if score >= 50:
+    thresholds = _rules.thresholds
+    if score >= thresholds['high']:
         return 'high'
-    elif score >= 30:
+    elif score >= thresholds['medium']:
         return 'medium'
     else:
         return 'low'
 
 
+def _publish_time_key(item: dict):
+    """组内排序键：发布时间（最新的在前）"""
+    return item['publish_time']
+
+
+def _score_time_key(item: dict):
+    """补充排序键：得分优先，其次发布时间"""
+    return (item['score'], item['publish_time'])
+
+
 def select_top_news(
     articles: List[dict],
     category: str,
@@ -188,9 +537,9 @@ def select_top_news(
     策略：
     1. 计算每条新闻的优先级得分
     2. 按优先级分组（高/中/低）
-    3. 每组内按时间排序
+    3. 每组内按时间取最新的若干条（有界堆，O(n log k)）
     4. 按比例选择（高:中:低 = 5:3:2）
-    5. 最终总数为 top_n
+    5. 最终总数为 top_n（不足时按得分和时间从未选中的新闻中补充）
 
     Args:
         articles: 新闻列表
@@ -206,10 +555,10 @@ def select_top_news(
     if len(articles) <= top_n:
         return articles
 
-    # 第1步：计算每条新闻的优先级得分
+    # 第1步：计算每条新闻的优先级得分（批量计算，命中统计缓存在模块内供后续复用）
+    scores = score_batch(articles, category).tolist()
     scored_articles = []
-    for article in articles:
-        score = calculate_priority_score(article, category)
+    for article, score in zip(articles, scores):
         scored_articles.append({
             'article': article,
             'score': score,
@@ -218,45 +567,37 @@ def select_top_news(
         })
 
     # 第2步：按优先级分组
-    high_priority = []   # 得分 >= 50
-    medium_priority = [] # 得分 30-49
-    low_priority = []    # 得分 < 30
-
+    groups = {'high': [], 'medium': [], 'low': []}  # 得分 >= 50 / 30-49 / < 30
     for item in scored_articles:
-        if item['priority'] == 'high':
-            high_priority.append(item)
-        elif item['priority'] == 'medium':
-            medium_priority.append(item)
-        else:
-            low_priority.append(item)
-
-    # 第3步：每组内按时间排序（最新的在前）
-    for group in [high_priority, medium_priority, low_priority]:
-        group.sort(key=lambda x: x['publish_time'], reverse=True)
-
-    # 第4步：按比例选择（高:中:低 = 5:3:2）
+        groups[item['priority']].append(item)
+
+    # 第3-4步：每组按比例取最新的若干条（高:中:低 = 5:3:2）
+    # heapq.nlargest 使用大小为k的堆，O(n log k)，并且与稳定排序后取前k条的结果一致
     high_count = int(top_n * 0.5)    # 5条
     medium_count = int(top_n * 0.3)  # 3条
     low_count = top_n - high_count - medium_count  # 2条
 
     selected = []
-    selected.extend([item['article'] for item in high_priority[:high_count]])
-    selected.extend([item['article'] for item in medium_priority[:medium_count]])
-    selected.extend([item['article'] for item in low_priority[:low_count]])
-
-    # 如果某组数量不足，从其他组补充
-    if len(selected) < top_n:
-        # 按优先级和时间顺序补充
-        remaining = scored_articles
-        remaining.sort(key=lambda x: (x['score'], x['publish_time']), reverse=True)
-
-        for item in remaining:
-            if item['article'] not in selected:
-                selected.append(item['article'])
-                if len(selected) >= top_n:
-                    break
-
-    logger.info(f"{category}: 筛选 {len(articles)} → {len(selected)} (高:{len(high_priority)}, 中:{len(medium_priority)}, 低:{len(low_priority)})")
+    for priority, count in (('high', high_count), ('medium', medium_count), ('low', low_count)):
+        newest = heapq.nlargest(count, groups[priority], key=_publish_time_key)
+        selected.extend(item['article'] for item in newest)
+
+    # 如果某组数量不足，从其他组补充（按得分和时间顺序）
+    needed = top_n - len(selected)
+    if needed > 0:
+        # 按对象身份判断是否已选中；同一对象多次出现时只保留第一次
+        seen_ids = {id(article) for article in selected}
+        candidates = []
+        for item in scored_articles:
+            article_id = id(item['article'])
+            if article_id not in seen_ids:
+                seen_ids.add(article_id)
+                candidates.append(item)
+
+        best = heapq.nlargest(needed, candidates, key=_score_time_key)
+        selected.extend(item['article'] for item in best)
+
+    logger.info(f"{category}: 筛选 {len(articles)} → {len(selected)} (高:{len(groups['high'])}, 中:{len(groups['medium'])}, 低:{len(groups['low'])})")
 
     return selected
 
@@ -66,7 +66,7 @@ class NewsScraper:
                         published_raw = entry.get('published', '')
                         if published_raw:
                             try:
-                                publish_time = parse_timestamp(published_raw)
+                                publish_time = parse_timestamp(published_raw, self.source.name)
                                 publish_time = normalize_to_utc(publish_time)
                             except Exception as e:
                                 logger.debug(f"时间解析失败，使用crawl_time: {e}")
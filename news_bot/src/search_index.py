@@ -0,0 +1,229 @@
+"""
+静态全文搜索索引
+
+构建时从 news_articles 生成倒排索引，供纯静态的搜索页（public/search.html）在浏览器端使用：
+- 中文按字二元组（bigram）切分，英文/数字按单词切分
+- 按月（北京时间）分片，每个分片 gzip 压缩：public/search/YYYY-MM.json.gz
+- public/search/index.json 记录所有分片及其数据签名
+
+增量构建：每个月的数据签名（记录数、最大ID、最大更新时间）未变化且分片文件存在时跳过，
+只重建有新增/修改/删除记录的月份。
+
+签名和分片都在 public/search/ 下：分片本身需要部署，签名放在别处也无法避免分片丢失后的重建。
+因此增量构建依赖 public/ 在两次运行之间保留——GitHub Actions 中由单独的缓存步骤恢复
+（见 .github/workflows/daily-news.yml）；public/ 为空时（如缓存失效）会全量重建一次。
+"""
+
+import gzip
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, List
+from loguru import logger
+
+from .config import Config
+from .database import DatabaseManager, utc_to_beijing
+
+
+SEARCH_DIR_NAME = "search"
+SEARCH_INDEX_VERSION = 1
+
+# 参与索引的文章字段
+INDEXED_FIELDS = ('title', 'title_original', 'content', 'content_original', 'source')
+
+# 英文停用词（同时写入 index.json，浏览器端使用同一份列表）
+STOPWORDS = [
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have',
+    'in', 'is', 'it', 'its', 'of', 'on', 'or', 'that', 'the', 'to', 'was', 'were',
+    'will', 'with'
+]
+_STOPWORDS = set(STOPWORDS)
+
+# 中文字符连续片段 或 英文/数字单词（浏览器端使用相同的正则）
+_TOKEN_RE = re.compile(r'[\u3400-\u9fff\uf900-\ufaff]+|[a-z0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    切分文本为索引词
+
+    - 中文片段：相邻两字组成二元组；单字片段保留单字
+    - 英文/数字：整词（去除停用词和单个字母）
+
+    Args:
+        text: 原始文本
+
+    Returns:
+        List[str]: 索引词列表（可能有重复）
+    """
+    if not text:
+        return []
+
+    tokens = []
+    for match in _TOKEN_RE.finditer(text.lower()):
+        part = match.group(0)
+        if part[0].isascii():
+            if part in _STOPWORDS or (len(part) < 2 and not part.isdigit()):
+                continue
+            tokens.append(part)
+        elif len(part) == 1:
+            tokens.append(part)
+        else:
+            tokens.extend(part[i:i + 2] for i in range(len(part) - 1))
+    return tokens
+
+
+def build_month_shard(month: str, articles: list) -> dict:
+    """
+    构建单个月份的索引分片
+
+    Args:
+        month: 月份（YYYY-MM，北京时间）
+        articles: 当月文章列表
+
+    Returns:
+        dict: 分片数据（docs + postings）
+    """
+    docs = []
+    postings: Dict[str, List[int]] = {}
+
+    # 按发布时间倒序，搜索结果默认新的在前
+    articles = sorted(articles, key=lambda x: x.publish_time, reverse=True)
+
+    for doc_id, article in enumerate(articles):
+        docs.append([
+            utc_to_beijing(article.publish_time).strftime(Config.DATE_FORMAT),
+            article.title,
+            article.title_original or "",
+            article.source,
+            article.url or ""
+        ])
+
+        tokens = set()
+        for field in INDEXED_FIELDS:
+            tokens.update(tokenize(getattr(article, field, None)))
+        for token in tokens:
+            postings.setdefault(token, []).append(doc_id)
+
+    return {
+        'version': SEARCH_INDEX_VERSION,
+        'month': month,
+        'fields': ['date', 'title', 'title_original', 'source', 'url'],
+        'docs': docs,
+        'postings': postings
+    }
+
+
+class SearchIndexBuilder:
+    """静态搜索索引构建器"""
+
+    def __init__(self, db_manager: DatabaseManager, public_dir: Path = None):
+        self.db_manager = db_manager
+        self.public_dir = Path(public_dir or Config.OUTPUT_DIR)
+        self.search_dir = self.public_dir / SEARCH_DIR_NAME
+        self.index_file = self.search_dir / "index.json"
+        self.page_file = self.public_dir / "search.html"
+
+    def build(self, full: bool = False) -> int:
+        """
+        增量构建搜索索引
+
+        Args:
+            full: 是否忽略签名强制重建所有分片
+
+        Returns:
+            int: 重建的分片数
+        """
+        previous = {} if full else self._load_index().get('months', {})
+        signatures = self.db_manager.get_month_signatures()
+
+        months = {}
+        rebuilt = 0
+
+        for month, signature in sorted(signatures.items()):
+            shard_path = self.search_dir / f"{month}.json.gz"
+            entry = previous.get(month)
+
+            if entry and entry.get('signature') == list(signature) and shard_path.exists():
+                months[month] = entry
+                continue
+
+            articles = self.db_manager.get_articles_by_month(month)
+            shard = build_month_shard(month, articles)
+            size = self._write_shard(shard_path, shard)
+
+            months[month] = {
+                'docs': len(shard['docs']),
+                'size': size,
+                'signature': list(signature)
+            }
+            rebuilt += 1
+            logger.info(f"  ✓ 搜索分片已更新: {month}（{len(shard['docs'])} 篇, {size} 字节）")
+
+        # 删除已无数据的月份分片
+        for month in set(previous) - set(months):
+            stale_path = self.search_dir / f"{month}.json.gz"
+            if stale_path.exists():
+                stale_path.unlink()
+                logger.info(f"  ✓ 已删除过期搜索分片: {month}")
+
+        self._write_index(months)
+        self._ensure_search_page()
+
+        logger.info(f"✓ 搜索索引构建完成: {len(months)} 个月，重建 {rebuilt} 个分片")
+        return rebuilt
+
+    def _load_index(self) -> dict:
+        """读取上次构建的 index.json"""
+        if not self.index_file.exists():
+            return {}
+
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"读取搜索索引失败，将全量重建: {e}")
+            return {}
+
+        if data.get('version') != SEARCH_INDEX_VERSION:
+            return {}
+        return data
+
+    def _write_shard(self, path: Path, shard: dict) -> int:
+        """写入 gzip 压缩的分片，返回压缩后大小"""
+        raw = json.dumps(shard, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        # mtime=0 保证相同内容生成相同字节
+        data = gzip.compress(raw, compresslevel=9, mtime=0)
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+        return len(data)
+
+    def _write_index(self, months: dict):
+        """写入 index.json（月份倒序，搜索页按需加载分片）"""
+        data = {
+            'version': SEARCH_INDEX_VERSION,
+            'stopwords': STOPWORDS,
+            'months': {month: months[month] for month in sorted(months, reverse=True)}
+        }
+
+        self.search_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.index_file.with_name(self.index_file.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, self.index_file)
+
+    def _ensure_search_page(self):
+        """从模板写入 search.html（内容未变化时跳过写入）"""
+        template_path = Config.TEMPLATES_DIR / "search.html"
+        content = template_path.read_bytes()
+
+        if self.page_file.exists() and self.page_file.read_bytes() == content:
+            return
+
+        self.page_file.parent.mkdir(parents=True, exist_ok=True)
+        self.page_file.write_bytes(content)
+        logger.info(f"✓ 已从模板写入 search.html: {self.page_file}")
@@ -0,0 +1,245 @@
+"""
+"已见过"新闻的布隆过滤器
+
+在查询SQLite之前先判断抓取到的新闻是否可能已入库：
+- 过滤器记录保留期内所有文章的规范化URL和标题键，持久化在数据库旁边（news.bloom）
+- 过滤器判定"一定不存在"的新闻直接视为新新闻，不再查询数据库
+- 可能存在的新闻交给 DatabaseManager.find_existing_articles 一次批量查询确认
+
+文件头记录了保存时 news_articles 的指纹（文章数, 最大ID），加载时与数据库对比：
+- 最大ID变化或文章数增加：有其他程序（如 process_raw_articles.py）写入了过滤器不知道的文章，重建
+- 只有文章数减少：只是删除了文章（如保留策略），过期键只会造成多余的（但结果正确的）数据库查询，
+  继续使用；过期键占满容量后由 is_full 触发重建
+文件丢失、损坏、容量不足或URL规范化规则（URL_RULES_VERSION）变化时同样从 news_articles 重建。
+"""
+
+import hashlib
+import math
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, List, Optional
+from loguru import logger
+
+from .url_utils import URL_RULES_VERSION, canonicalize_url
+
+
+FILTER_SUFFIX = ".bloom"
+FILTER_MAGIC = b"NBF1"
+FILTER_HEADER = struct.Struct("<4sBQQQ")  # magic, 哈希函数个数, 位数, 容量, 已添加键数
+
+SEEN_MAGIC = b"NSF2"
+SEEN_HEADER = struct.Struct("<4sHQQ")  # magic, URL规范化规则版本, 文章数, 最大ID（保存时的数据库指纹）
+
+DEFAULT_CAPACITY = 20000       # 最少容纳的键数
+FALSE_POSITIVE_RATE = 0.01     # 目标误判率
+
+
+def article_keys(title: Optional[str], title_original: Optional[str], url: Optional[str]) -> List[str]:
+    """
+    生成新闻的过滤器键（与数据库的存在性检查规则一致）
+
+    - 规范化URL
+    - 英文新闻按原始标题，中文新闻（无原始标题）按中文标题
+
+    Args:
+        title: 新闻标题（中文）
+        title_original: 原始标题（英文）
+        url: 新闻链接
+
+    Returns:
+        List[str]: 键列表
+    """
+    keys = []
+
+    url_canonical = canonicalize_url(url)
+    if url_canonical:
+        keys.append(f"url:{url_canonical}")
+
+    if title_original:
+        keys.append(f"title_original:{title_original}")
+    elif title:
+        keys.append(f"title:{title}")
+
+    return keys
+
+
+class BloomFilter:
+    """定长位数组 + 双重哈希的布隆过滤器"""
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, error_rate: float = FALSE_POSITIVE_RATE):
+        self.capacity = max(capacity, 1)
+        self.num_bits = max(8, int(-self.capacity * math.log(error_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        """添加键"""
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+    @property
+    def is_full(self) -> bool:
+        """已添加键数超过设计容量（误判率开始上升）"""
+        return self.count > self.capacity
+
+    def to_bytes(self) -> bytes:
+        header = FILTER_HEADER.pack(FILTER_MAGIC, self.num_hashes, self.num_bits, self.capacity, self.count)
+        return header + bytes(self.bits)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "BloomFilter":
+        """从文件内容恢复过滤器，格式不正确时抛出 ValueError"""
+        if len(data) < FILTER_HEADER.size:
+            raise ValueError("文件过短")
+
+        magic, num_hashes, num_bits, capacity, count = FILTER_HEADER.unpack_from(data)
+        if magic != FILTER_MAGIC:
+            raise ValueError(f"文件标识不匹配: {magic!r}")
+
+        bits = data[FILTER_HEADER.size:]
+        if len(bits) != (num_bits + 7) // 8:
+            raise ValueError("位数组长度不匹配")
+
+        bloom = cls.__new__(cls)
+        bloom.capacity = capacity
+        bloom.num_bits = num_bits
+        bloom.num_hashes = num_hashes
+        bloom.bits = bytearray(bits)
+        bloom.count = count
+        return bloom
+
+
+class SeenFilter:
+    """
+    持久化的"已见过"过滤器
+
+    用法：
+        seen_filter = SeenFilter.for_database(db_manager)
+        candidates = [a for a in articles if seen_filter.might_contain(a)]
+        existing = db_manager.find_existing_articles(candidates)
+        ...
+        seen_filter.add_articles(saved_articles)
+        seen_filter.save()
+    """
+
+    def __init__(self, path: Path, db_manager):
+        self.path = Path(path)
+        self.db_manager = db_manager
+        self.bloom = None
+        self.fingerprint = None
+
+    @classmethod
+    def for_database(cls, db_manager) -> "SeenFilter":
+        """创建与数据库文件放在一起的过滤器（news.db -> news.bloom）并加载"""
+        seen_filter = cls(Path(db_manager.db_path).with_suffix(FILTER_SUFFIX), db_manager)
+        seen_filter.load()
+        return seen_filter
+
+    def load(self):
+        """读取过滤器文件；文件丢失、损坏、已超出容量或数据库有未知的新增文章时从数据库重建"""
+        saved_fingerprint = None
+        if self.path.exists():
+            try:
+                data = self.path.read_bytes()
+                if len(data) < SEEN_HEADER.size:
+                    raise ValueError("文件过短")
+                magic, rules_version, count, max_id = SEEN_HEADER.unpack_from(data)
+                if magic != SEEN_MAGIC:
+                    raise ValueError(f"文件标识不匹配: {magic!r}")
+                if rules_version != URL_RULES_VERSION:
+                    raise ValueError(f"URL规范化规则已变化: {rules_version} -> {URL_RULES_VERSION}")
+                self.bloom = BloomFilter.from_bytes(data[SEEN_HEADER.size:])
+                saved_fingerprint = (count, max_id)
+            except (OSError, ValueError) as e:
+                logger.warning(f"读取布隆过滤器失败，将重建: {self.path}, {e}")
+                self.bloom = None
+
+        if self.bloom is None or self.bloom.is_full:
+            self.rebuild()
+            return
+
+        self.fingerprint = self.db_manager.get_articles_fingerprint()
+        if not self._covers(saved_fingerprint, self.fingerprint):
+            logger.info(f"数据库有过滤器之外的写入，重建布隆过滤器: {saved_fingerprint} -> {self.fingerprint}")
+            self.rebuild()
+            return
+
+        logger.debug(f"布隆过滤器已加载: {self.path} ({self.bloom.count} 个键)")
+
+    @staticmethod
+    def _covers(saved: tuple, current: tuple) -> bool:
+        """
+        保存时的过滤器是否仍包含数据库中的所有文章
+
+        新抓取的文章会使最大ID变大（AUTOINCREMENT），从归档导回的文章保留原ID、会使文章数增加；
+        最大ID不变且文章数没有增加，说明之后只有删除。
+
+        Args:
+            saved: 保存时的指纹 (文章数, 最大ID)
+            current: 当前指纹
+
+        Returns:
+            bool: True 表示可以继续使用
+        """
+        return saved[1] == current[1] and current[0] <= saved[0]
+
+    def rebuild(self):
+        """从 news_articles 重建过滤器并保存"""
+        self.fingerprint = self.db_manager.get_articles_fingerprint()
+
+        self.bloom = BloomFilter(capacity=max(DEFAULT_CAPACITY, self.fingerprint[0] * 4))
+        articles = 0
+        for title, title_original, url in self.db_manager.iter_article_keys():
+            for key in article_keys(title, title_original, url):
+                self.bloom.add(key)
+            articles += 1
+
+        self._write()
+        logger.info(f"✓ 布隆过滤器已重建: {articles} 篇文章, {self.bloom.count} 个键")
+
+    def might_contain(self, article) -> bool:
+        """
+        新闻是否可能已存在
+
+        Returns:
+            bool: False 表示一定不存在；True 表示可能存在（需查询数据库确认）
+        """
+        keys = article_keys(article.title, article.title_original, article.url)
+        return any(key in self.bloom for key in keys)
+
+    def add_articles(self, articles: Iterable):
+        """添加新入库的文章"""
+        for article in articles:
+            for key in article_keys(article.title, article.title_original, article.url):
+                self.bloom.add(key)
+
+    def save(self):
+        """
+        写回过滤器文件，并记录当前的数据库指纹
+
+        在 add_articles 添加了本次写入的文章、或删除文章之后调用：
+        删除文章不需要重建，过期键只会造成多余的数据库查询。
+        """
+        self.fingerprint = self.db_manager.get_articles_fingerprint()
+        self._write()
+
+    def _write(self):
+        """写文件（先写临时文件再替换）"""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + '.tmp')
+        header = SEEN_HEADER.pack(SEEN_MAGIC, URL_RULES_VERSION, *self.fingerprint)
+        tmp_path.write_bytes(header + self.bloom.to_bytes())
+        os.replace(tmp_path, self.path)
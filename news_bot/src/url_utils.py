@@ -0,0 +1,201 @@
+"""
+URL规范化工具
+
+RSS源给同一篇文章的链接经常带有不同的附加内容：
+- 跟踪参数（utm_*、fbclid，以及部分网站自己的 mod=rss 等）
+- AMP 版本（amp.example.com、/amp/、?outputType=amp）
+- 跳转包装（https://www.google.com/url?q=<真实链接>）
+
+规范化后的URL用于去重和存在性检查（news_articles.url_canonical，唯一索引）。
+两篇不同的文章一旦规范化为同一个URL，后一篇会被当作重复丢弃，所以规则只去掉确定无关的部分：
+ref、src、feed、id、q 之类的参数在很多网站上就是文章标识，只有在下面列出的网站上才会去掉或解开。
+"""
+
+import logging
+import re
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+logger = logging.getLogger(__name__)
+
+
+# 规范化规则的版本，规则变化时加一：数据库据此重新计算已有的 url_canonical，布隆过滤器据此重建
+URL_RULES_VERSION = 2
+
+# 所有网站都去掉的跟踪参数（小写）：广告平台和统计工具附加的点击标识，不会用来区分文章
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'gbraid', 'wbraid', 'msclkid', 'yclid', 'igshid',
+    'mc_cid', 'mc_eid', '_ga', '_gl', '__twitter_impression',
+    'pk_campaign', 'pk_kwd', 'pk_source', 'pk_medium', 'pk_content',
+}
+
+# 以这些前缀开头的参数一律视为跟踪参数（Google Analytics、Matomo）
+TRACKING_PARAM_PREFIXES = ('utm_', 'mtm_')
+
+# 只在特定网站上去掉的跟踪参数：{域名: 参数}，同时适用于子域名
+TRACKING_PARAMS_BY_HOST = {
+    'wsj.com': {'mod', 'cx_testid', 'cx_testvariant'},
+    'marketwatch.com': {'mod', 'siteid'},
+    'barrons.com': {'mod'},
+    'cnbc.com': {'__source', 'par'},
+    'yahoo.com': {'ncid', 'guccounter', 'guce_referrer', 'guce_referrer_sig', 'soc_src', 'soc_trk', 'yptr', '.tsrc'},
+    'bloomberg.com': {'cmpid', 'srnd', 'sref', 'leadsource'},
+    'reuters.com': {'taid', 'rpc'},
+    'nytimes.com': {'smid', 'partner'},
+    'msn.com': {'ocid', 'cvid'},
+}
+
+# 跳转服务：(主机名正则, 路径, 存放真实链接的参数)；其他网站的 url=、q= 等参数原样保留
+REDIRECTORS = tuple(
+    (re.compile(host), path, params)
+    for host, path, params in (
+        (r'(www\.)?google(\.com)?(\.[a-z]{2})?', '/url', ('q', 'url')),
+        (r'news\.google\.com', '/url', ('url',)),
+        (r'(l|lm|m)\.facebook\.com', '/l.php', ('u',)),
+        (r'(www\.)?bing\.com', '/news/apiclick.aspx', ('url',)),
+        (r'out\.reddit\.com', None, ('url',)),
+        (r'link\.zhihu\.com', None, ('target',)),
+        (r't\.umblr\.com', '/redirect', ('z',)),
+    )
+)
+
+# AMP 标记参数
+AMP_PARAMS = {'amp', 'outputtype', 'amp_js_v', 'usqp'}
+
+# 最多解开的跳转层数
+MAX_REDIRECT_DEPTH = 3
+
+_DEFAULT_PORTS = {'http': '80', 'https': '443'}
+_AMP_PATH_RE = re.compile(r'(/amp(?=/|$)|\.amp(?=\.html?$|$))')
+
+
+def _host_matches(host: str, domain: str) -> bool:
+    """主机名是否为该域名或其子域名"""
+    return host == domain or host.endswith('.' + domain)
+
+
+def _is_tracking_param(name: str, host: str) -> bool:
+    """是否为跟踪参数（host 为规范化后的主机名）"""
+    name = name.lower()
+    if name in TRACKING_PARAMS or name.startswith(TRACKING_PARAM_PREFIXES):
+        return True
+    return any(
+        name in params
+        for domain, params in TRACKING_PARAMS_BY_HOST.items()
+        if _host_matches(host, domain)
+    )
+
+
+def _unwrap_redirect(parts) -> Optional[str]:
+    """如果URL是已知跳转服务的包装，返回其中的真实链接"""
+    host = parts.hostname.lower()
+    for host_re, path, params in REDIRECTORS:
+        if host_re.fullmatch(host) and (not path or parts.path == path):
+            break
+    else:
+        return None
+
+    for name, value in parse_qsl(parts.query, keep_blank_values=False):
+        if name.lower() in params:
+            target = value.strip()
+            if target.startswith(('http://', 'https://')):
+                return target
+    return None
+
+
+def canonicalize_url(url: Optional[str]) -> Optional[str]:
+    """
+    将URL规范化，用于判断两个链接是否指向同一篇文章
+
+    规则：
+    1. 解开已知跳转服务的包装（REDIRECTORS，最多 MAX_REDIRECT_DEPTH 层）
+    2. 协议统一为 https，主机名小写并去掉 www. / amp. / m. 前缀，去掉默认端口
+    3. 去掉 AMP 路径标记（/amp、.amp）和末尾的斜杠
+    4. 去掉跟踪参数（通用的和该网站特有的）和 AMP 参数，其余参数按名称排序
+    5. 去掉片段（#...）
+
+    Args:
+        url: 原始URL
+
+    Returns:
+        str: 规范化后的URL；无法解析（空值或非 http/https 链接）时返回None
+    """
+    if not url:
+        return None
+
+    url = url.strip()
+
+    for _ in range(MAX_REDIRECT_DEPTH + 1):
+        try:
+            parts = urlsplit(url)
+        except ValueError as e:
+            logger.debug(f"URL解析失败: {url}, {e}")
+            return None
+
+        if parts.scheme.lower() not in ('http', 'https') or not parts.hostname:
+            return None
+
+        target = _unwrap_redirect(parts)
+        if not target:
+            break
+        url = target
+
+    host = parts.hostname.lower()
+    for prefix in ('www.', 'amp.', 'm.'):
+        if host.startswith(prefix) and host.count('.') > 1:
+            host = host[len(prefix):]
+            break
+
+    params = [
+        (name, value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+        if not _is_tracking_param(name, host) and name.lower() not in AMP_PARAMS
+    ]
+    query = urlencode(sorted(params))
+
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    if port and str(port) not in _DEFAULT_PORTS.values():
+        host = f"{host}:{port}"
+
+    path = _AMP_PATH_RE.sub('', parts.path) or '/'
+    path = re.sub(r'/{2,}', '/', path)
+    if len(path) > 1:
+        path = path.rstrip('/')
+
+    return urlunsplit(('https', host, path, query, ''))
+
+
+# 测试代码
+if __name__ == "__main__":
+    test_urls = [
+        "https://www.cnbc.com/2026/01/26/fed-rate.html?utm_source=rss&utm_medium=feed",
+        "http://cnbc.com/2026/01/26/fed-rate.html/",
+        "https://www.cnbc.com/amp/2026/01/26/fed-rate.html#comments",
+        "https://www.google.com/url?q=https%3A%2F%2Fwww.cnbc.com%2F2026%2F01%2F26%2Ffed-rate.html%3Futm_source%3Drss",
+        "https://www.marketwatch.com/story/fed-holds-rates?mod=rss_topstories&page=2",
+        "https://www.marketwatch.com/story/fed-holds-rates?page=2&mod=mw_rss",
+    ]
+
+    for test_url in test_urls:
+        print(f"{test_url}\n  -> {canonicalize_url(test_url)}")
+
+    # (链接1, 链接2, 是否应规范化为同一个URL)
+    test_pairs = [
+        ("https://www.marketwatch.com/story/a?mod=rss", "https://www.marketwatch.com/story/a?mod=home", True),
+        ("https://l.facebook.com/l.php?u=https%3A%2F%2Fwww.wsj.com%2Farticles%2Fx", "https://www.wsj.com/articles/x", True),
+        ("https://example.com/story?ref=123", "https://example.com/story?ref=456", False),
+        ("https://example.com/view?src=a1", "https://example.com/view?src=b2", False),
+        ("https://example.com/rss?feed=markets", "https://example.com/rss?feed=bonds", False),
+        ("https://bbs.example.cn/forum.php?mod=viewthread&tid=1", "https://bbs.example.cn/forum.php?mod=viewthread&tid=2", False),
+        ("https://bbs.example.cn/forum.php?mod=viewthread&tid=1", "https://bbs.example.cn/forum.php?mod=forumdisplay&tid=1", False),
+        ("https://example.com/search?q=https://a.com/1", "https://example.com/search?q=https://a.com/2", False),
+        ("https://example.com/share?u=https://a.com/1", "https://a.com/1", False),
+    ]
+
+    print()
+    for url1, url2, expected in test_pairs:
+        same = canonicalize_url(url1) == canonicalize_url(url2)
+        print(f"{'✓' if same == expected else '✗'} {'相同' if same else '不同'}: {url1} | {url2}")
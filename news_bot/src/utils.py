@@ -6,11 +6,36 @@
 
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
 
 logger = logging.getLogger(__name__)
 
 
+# 专用解析器（按字符串形态直接分派，不再逐个尝试）
+FORMAT_ISO = 'iso'            # ISO 8601 / RFC 3339: "2026-01-26T18:00:00Z"
+FORMAT_RFC2822 = 'rfc2822'    # RSS: "Fri, 26 Jan 2026 18:00:00 +0000"
+
+# 专用解析器失败时逐个尝试的格式（如 Python 3.10 的 fromisoformat 不支持 "+0800" 和 1-5 位小数）
+STRPTIME_FORMATS = [
+    "%Y-%m-%dT%H:%M:%SZ",           # RFC 3339 (UTC)
+    "%Y-%m-%dT%H:%M:%S.%fZ",         # RFC 3339 (带毫秒)
+    "%Y-%m-%dT%H:%M:%S%z",          # ISO 8601 (时区)
+    "%Y-%m-%dT%H:%M:%S.%f%z",        # ISO 8601 (带毫秒和时区)
+    "%Y-%m-%dT%H:%M:%S",            # ISO 8601 (无时区)
+    "%Y-%m-%dT%H:%M:%S.%f",          # ISO 8601 (带毫秒，无时区)
+    "%Y-%m-%d %H:%M:%S",            # 标准格式
+    "%Y-%m-%d %H:%M:%S.%f",          # 标准格式 (带毫秒)
+    "%a, %d %b %Y %H:%M:%S %z",     # RSS格式 (RFC 2822)
+    "%a, %d %b %Y %H:%M:%S %Z",     # RSS格式 (时区名称)
+    "%d %b %Y %H:%M:%S %z",         # 简化的RSS格式
+    "%d %b %Y %H:%M:%S %Z",         # 简化的RSS格式 (时区名称)
+]
+
+# 每个来源上次解析成功的格式 {来源: 格式}（同一来源的时间格式几乎总是相同的）
+_source_formats: Dict[str, str] = {}
+
+
 def get_effective_publish_time(article: dict) -> datetime:
     """
     获取有效的发布时间（v2.0新增）
@@ -32,7 +57,7 @@ def get_effective_publish_time(article: dict) -> datetime:
     if publish_time:
         try:
             # 解析时间戳
-            parsed_time = parse_timestamp(publish_time)
+            parsed_time = parse_timestamp(publish_time, article.get('source'))
             normalized = normalize_to_utc(parsed_time)
             logger.debug(f"使用publish_time: {normalized}")
             return normalized
@@ -43,7 +68,7 @@ def get_effective_publish_time(article: dict) -> datetime:
     crawl_time = article.get('crawl_time')
     if crawl_time:
         try:
-            parsed_time = parse_timestamp(crawl_time)
+            parsed_time = parse_timestamp(crawl_time, 'crawl_time')
             normalized = normalize_to_utc(parsed_time)
             title_preview = article.get('title', article.get('title_original', ''))[:50]
             logger.info(f"⚠️ publish_time缺失，使用crawl_time: {title_preview}")
@@ -57,7 +82,45 @@ def get_effective_publish_time(article: dict) -> datetime:
     return datetime.now(timezone.utc)
 
 
-def parse_timestamp(time_str: str) -> datetime:
+def _parse_iso(time_str: str) -> datetime:
+    """ISO 8601 解析（"Z" 结尾的按无时区的UTC时间返回，与 strptime 的 "...Z" 格式一致）"""
+    if len(time_str) < 19 or time_str[10] not in 'T ':
+        raise ValueError(f"不是完整的ISO时间: {time_str}")
+    if time_str.endswith('Z'):
+        time_str = time_str[:-1]
+    return datetime.fromisoformat(time_str)
+
+
+def _parse_rfc2822(time_str: str) -> datetime:
+    """RFC 2822 解析（RSS 的 pubDate）"""
+    try:
+        return parsedate_to_datetime(time_str)
+    except (TypeError, IndexError) as e:
+        raise ValueError(f"不是RFC 2822时间: {time_str}") from e
+
+
+_PARSERS = {
+    FORMAT_ISO: _parse_iso,
+    FORMAT_RFC2822: _parse_rfc2822,
+}
+
+
+def _parse_with(fmt: str, time_str: str) -> datetime:
+    """按指定格式解析（专用解析器名称或 strptime 格式）"""
+    parser = _PARSERS.get(fmt)
+    if parser:
+        return parser(time_str)
+    return datetime.strptime(time_str, fmt)
+
+
+def _sniff_format(time_str: str) -> str:
+    """根据字符串形态判断格式：以 "YYYY-" 开头的是ISO，其余按RFC 2822"""
+    if time_str[:4].isdigit() and time_str[4:5] == '-':
+        return FORMAT_ISO
+    return FORMAT_RFC2822
+
+
+def parse_timestamp(time_str: str, source: Optional[str] = None) -> datetime:
     """
     解析多种时间格式（v2.0新增）
 
@@ -67,8 +130,14 @@ def parse_timestamp(time_str: str) -> datetime:
     - 标准格式: "2026-01-26 18:00:00"
     - RSS格式: "Fri, 26 Jan 2026 18:00:00 +0000"
 
+    解析顺序：
+    1. 该来源上次成功的格式（提供 source 时）
+    2. 按字符串形态直接分派给 fromisoformat / parsedate_to_datetime
+    3. 以上都失败时逐个尝试 STRPTIME_FORMATS
+
     Args:
         time_str: 时间字符串
+        source: 来源名称（可选，用于记住该来源的时间格式）
 
     Returns:
         datetime对象
@@ -82,30 +151,28 @@ def parse_timestamp(time_str: str) -> datetime:
     # 清理时间字符串
     time_str = time_str.strip()
 
-    # 定义支持的时间格式
-    formats = [
-        "%Y-%m-%dT%H:%M:%SZ",           # RFC 3339 (UTC)
-        "%Y-%m-%dT%H:%M:%S.%fZ",         # RFC 3339 (带毫秒)
-        "%Y-%m-%dT%H:%M:%S%z",          # ISO 8601 (时区)
-        "%Y-%m-%dT%H:%M:%S.%f%z",        # ISO 8601 (带毫秒和时区)
-        "%Y-%m-%dT%H:%M:%S",            # ISO 8601 (无时区)
-        "%Y-%m-%dT%H:%M:%S.%f",          # ISO 8601 (带毫秒，无时区)
-        "%Y-%m-%d %H:%M:%S",            # 标准格式
-        "%Y-%m-%d %H:%M:%S.%f",          # 标准格式 (带毫秒)
-        "%a, %d %b %Y %H:%M:%S %z",     # RSS格式 (RFC 2822)
-        "%a, %d %b %Y %H:%M:%S %Z",     # RSS格式 (时区名称)
-        "%d %b %Y %H:%M:%S %z",         # 简化的RSS格式
-        "%d %b %Y %H:%M:%S %Z",         # 简化的RSS格式 (时区名称)
-    ]
+    remembered = _source_formats.get(source) if source else None
+    if remembered:
+        try:
+            return _parse_with(remembered, time_str)
+        except ValueError:
+            pass
+
+    candidates = [_sniff_format(time_str)]
+    candidates.extend(STRPTIME_FORMATS)
 
-    # 尝试每种格式
-    for fmt in formats:
+    for fmt in candidates:
+        if fmt == remembered:
+            continue
         try:
-            parsed = datetime.strptime(time_str, fmt)
-            return parsed
+            parsed = _parse_with(fmt, time_str)
         except ValueError:
             continue
 
+        if source:
+            _source_formats[source] = fmt
+        return parsed
+
     # 所有格式都失败
     raise ValueError(f"无法解析时间格式: {time_str}")
 